@@ -0,0 +1,20 @@
+"""Session-wide pytest configuration shared by ``tests`` and ``sentinelkit/tests``."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from sentinelkit.cli.history import HISTORY_ENV
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep `sentinel selfcheck` runs (in-process or spawned) out of the real repo's timing history."""
+
+    directory = Path(tempfile.mkdtemp(prefix="sentinel-selfcheck-"))
+    os.environ[HISTORY_ENV] = str(directory / "selfcheck-history.jsonl")
+    config.add_cleanup(lambda: shutil.rmtree(directory, ignore_errors=True))
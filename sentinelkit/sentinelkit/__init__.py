@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from importlib import metadata as importlib_metadata
-from typing import Final, Tuple
+from functools import cache
+from typing import Tuple
 
 __all__ = [
     "__version__",
@@ -30,6 +30,9 @@ class VersionInfo:
 
 
 def _resolve_version() -> str:
+    # Imported here: importlib.metadata is a noticeable share of CLI startup.
+    from importlib import metadata as importlib_metadata
+
     try:
         return importlib_metadata.version("sentinelkit")
     except importlib_metadata.PackageNotFoundError:  # pragma: no cover - fallback for editable installs
@@ -47,20 +50,28 @@ def _build_version_info(raw: str) -> VersionInfo:
     )
 
 
-__version__: Final[str] = _resolve_version()
-_VERSION_INFO: Final[VersionInfo] = _build_version_info(__version__)
+@cache
+def _version_info() -> VersionInfo:
+    return _build_version_info(_resolve_version())
+
+
+def __getattr__(name: str) -> str:
+    # ``__version__`` is resolved on first access rather than at import time.
+    if name == "__version__":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_version() -> str:
     """Return the semantic version string for this installation."""
-    return __version__
+    return _version_info().raw
 
 
 def get_version_info() -> VersionInfo:
     """Return the structured version metadata."""
-    return _VERSION_INFO
+    return _version_info()
 
 
 def version_components() -> Tuple[str, ...]:
     """Convenience helper that exposes the version's dotted components."""
-    return _VERSION_INFO.as_tuple()
+    return _version_info().as_tuple()
@@ -1,5 +1,16 @@
 """CLI namespace for SentinelKit."""
 
-from .main import app
+from __future__ import annotations
 
-__all__ = ["app"]
\ No newline at end of file
+from typing import Any
+
+__all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on demand so the forwarding client (`cli.client`) starts without Typer.
+    if name == "app":
+        from .main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
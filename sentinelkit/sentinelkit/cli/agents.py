@@ -8,7 +8,7 @@ from typing import Annotated
 import typer
 from rich.table import Table
 
-from sentinelkit.prompt.agents import AgentRegistryError, load_agents
+from sentinelkit.prompt.agents import AgentRegistryError, registry_cache
 from sentinelkit.utils.errors import serialize_error
 
 from .state import get_context
@@ -30,7 +30,7 @@ def roster(
     """Emit agent metadata for routers/CapsuleAuthor workflows."""
     context = get_context(ctx)
     try:
-        registry = load_agents(root=context.root)
+        registry = registry_cache.get(context.root)
     except AgentRegistryError as error:
         payload = serialize_error(error)
         if context.format == "json":
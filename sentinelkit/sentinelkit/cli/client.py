@@ -0,0 +1,148 @@
+"""``sentinel`` entry point: forward to a running daemon, else run in-process.
+
+Only the standard library is imported here, so a forwarded command costs an
+interpreter start, one ``stat`` and a socket round trip. The Typer app (and
+every dependency behind it) is imported only when no daemon answers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import Any, Sequence
+
+__all__ = ["DAEMON_SOCKET", "LOCAL_COMMANDS", "NO_DAEMON_ENV", "forward", "main", "request"]
+
+DAEMON_SOCKET = os.path.join(".sentinel", "cache", "daemon.sock")
+NO_DAEMON_ENV = "SENTINEL_NO_DAEMON"
+# Long-running or process-bound commands always run locally: the MCP stdio
+# server owns its stdin/stdout, the sentinel suite runs pytest in-process, and
+# selfcheck may leave timed-out check threads running into the daemon's next run.
+LOCAL_COMMANDS = frozenset({"daemon", "mcp", "selfcheck", "sentinels"})
+CONNECT_TIMEOUT = 0.5
+# Root callback options that take a value (see cli/main.py).
+_VALUE_OPTIONS = frozenset({"--root", "--format", "-f"})
+
+
+def main() -> None:
+    """Console-script entry point."""
+    args = sys.argv[1:]
+    exit_code = forward(args)
+    if exit_code is None:
+        from .main import app
+
+        app(prog_name="sentinel")
+    sys.exit(exit_code)
+
+
+def forward(args: Sequence[str]) -> int | None:
+    """Run *args* in the daemon for their repository root.
+
+    Returns the command's exit code, or ``None`` when the command should run
+    in-process: no daemon socket, a local-only command, ``SENTINEL_NO_DAEMON``
+    set, or a daemon that does not accept the connection.
+    """
+
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    root, command = _split_global_options(args)
+    if command is None or command in LOCAL_COMMANDS:
+        return None
+    path = os.path.join(os.path.abspath(root), DAEMON_SOCKET)
+    if not os.path.exists(path):
+        return None
+    try:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(CONNECT_TIMEOUT)
+        connection.connect(path)
+    except (AttributeError, OSError):
+        # No AF_UNIX on this platform, or a stale socket left by a dead daemon.
+        return None
+
+    with connection:
+        connection.settimeout(None)
+        message = {
+            "op": "run",
+            "argv": list(args),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "tty": sys.stdout.isatty(),
+            "columns": _terminal_columns(),
+        }
+        try:
+            connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            response = _read_response(connection)
+        except OSError as error:
+            response = None
+            reason = str(error)
+        else:
+            reason = "connection closed"
+    if response is None:
+        # The command may already have run; running it again locally could repeat side effects.
+        sys.stderr.write(f"[sentinel] Lost the daemon connection ({reason}); the command may not have completed.\n")
+        return 1
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    return int(response.get("exit_code", 1))
+
+
+def request(
+    root: str | os.PathLike[str], payload: dict[str, Any], *, timeout: float = CONNECT_TIMEOUT
+) -> dict[str, Any] | None:
+    """Send a control request (``ping``/``stop``) to the daemon for *root*; ``None`` if none answers."""
+    path = os.path.join(os.fspath(root), DAEMON_SOCKET)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(timeout)
+            connection.connect(path)
+            connection.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            return _read_response(connection)
+    except (AttributeError, OSError):
+        return None
+
+
+def _split_global_options(args: Sequence[str]) -> tuple[str, str | None]:
+    """Return the ``--root`` value and the subcommand name from a raw argv."""
+    root = "."
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg.startswith("--root="):
+            root = arg.split("=", 1)[1]
+        elif arg in _VALUE_OPTIONS:
+            if arg == "--root" and index + 1 < len(args):
+                root = args[index + 1]
+            index += 1
+        elif not arg.startswith("-"):
+            return root, arg
+        index += 1
+    return root, None
+
+
+def _terminal_columns() -> int | None:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _read_response(connection: socket.socket) -> dict[str, Any] | None:
+    chunks: list[bytes] = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    data = b"".join(chunks)
+    if not data.endswith(b"\n"):
+        return None
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
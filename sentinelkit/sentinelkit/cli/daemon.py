@@ -0,0 +1,393 @@
+"""Persistent per-repository daemon that runs CLI commands in a warm process."""
+
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import os
+import signal
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+import typer
+
+from sentinelkit.utils.errors import (
+    SentinelKitError,
+    build_error_payload,
+    serialize_error,
+)
+
+from . import client
+from .state import CLIContext, get_context
+
+__all__ = ["DEFAULT_IDLE_TIMEOUT", "LOG_PATH", "SentinelDaemon", "app"]
+
+DEFAULT_IDLE_TIMEOUT = 30 * 60.0
+START_TIMEOUT = 15.0
+STOP_TIMEOUT = 5.0
+LOG_PATH = Path(".sentinel/cache/daemon.log")
+
+app = typer.Typer(help="Warm per-repository process that serves forwarded CLI calls.")
+
+
+class SentinelDaemon:
+    """Serve ``sentinel`` invocations for one repository over a Unix socket.
+
+    Each connection carries one JSON request line (``ping``, ``stop`` or
+    ``run``) and receives one JSON response line. ``run`` executes the CLI in
+    this process with the caller's argv, working directory and environment and
+    returns the captured output. Runs are serialized because they swap
+    process-wide state (cwd, ``os.environ``, standard streams); what stays warm
+    between them are the imported modules and the stat-validated caches
+    (context limits, contract schemas, agent registry, template environments).
+    A thread a command leaves running would see the next run's cwd and
+    environment, so commands that can abandon threads (``selfcheck`` gives up
+    on timed-out checks) are never forwarded; see ``client.LOCAL_COMMANDS``.
+    The socket is created owner-only, since whoever can connect can run any
+    command with an environment of their choosing.
+    """
+
+    def __init__(self, root: Path | str, *, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> None:
+        self.root = Path(root).resolve()
+        self.socket_path = self.root / client.DAEMON_SOCKET
+        self.idle_timeout = idle_timeout or None
+        self.served = 0
+        self._started = time.monotonic()
+        self._last_activity = self._started
+        self._run_lock = threading.Lock()
+        self._server: socketserver.BaseServer | None = None
+        self._stopped = threading.Event()
+
+    def serve_forever(self, *, ready: threading.Event | None = None) -> None:
+        """Listen until ``stop``, the idle timeout, or an interrupt."""
+        server_class = getattr(socketserver, "ThreadingUnixStreamServer", None)
+        if server_class is None:
+            raise SentinelKitError(
+                build_error_payload(
+                    code="daemon.unsupported",
+                    message="Unix domain sockets are not available on this platform.",
+                    remediation="Run commands directly; the CLI falls back to in-process execution.",
+                )
+            )
+        self._claim_socket()
+        # bind() creates the socket file; the umask makes it owner-only from the start.
+        previous_umask = os.umask(0o177)
+        try:
+            server = server_class(str(self.socket_path), _Handler)
+        finally:
+            os.umask(previous_umask)
+        server.daemon_threads = True
+        server.owner = self  # type: ignore[attr-defined]
+        self._server = server
+        try:
+            _warm_up(self.root)
+            if self.idle_timeout is not None:
+                threading.Thread(target=self._watch_idle, name="sentinel-daemon-idle", daemon=True).start()
+            if ready is not None:
+                ready.set()
+            server.serve_forever(poll_interval=0.2)
+        finally:
+            self._stopped.set()
+            server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop serving; safe to call from a request handler."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, name="sentinel-daemon-stop", daemon=True).start()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "running": True,
+            "pid": os.getpid(),
+            "root": str(self.root),
+            "socket": str(self.socket_path),
+            "uptime": round(time.monotonic() - self._started, 3),
+            "served": self.served,
+            "idle_timeout": self.idle_timeout,
+        }
+
+    def handle(self, rfile: BinaryIO, wfile: BinaryIO) -> None:
+        self._last_activity = time.monotonic()
+        try:
+            request = json.loads(rfile.readline() or b"null")
+        except ValueError:
+            request = None
+        op = request.get("op") if isinstance(request, dict) else None
+        if op == "ping" or op == "stop":
+            response = self.status()
+        elif op == "run":
+            response = self._run(request)
+        else:
+            response = {
+                "ok": False,
+                "error": serialize_error(
+                    build_error_payload(code="daemon.invalid_request", message=f"Unsupported request {op!r}.")
+                ),
+            }
+        wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        wfile.flush()
+        self._last_activity = time.monotonic()
+        if op == "stop":
+            self.shutdown()
+
+    def _run(self, request: dict[str, Any]) -> dict[str, Any]:
+        argv = [str(arg) for arg in request.get("argv") or []]
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self._run_lock:
+            try:
+                with _client_state(request), redirect_stdout(stdout), redirect_stderr(stderr):
+                    exit_code = _invoke(argv)
+            except (OSError, ValueError) as error:
+                # The caller's cwd or environment could not be adopted; nothing ran.
+                payload = build_error_payload(
+                    code="daemon.invalid_state",
+                    message=f"Cannot run in the caller's environment: {error}",
+                    remediation=f"Retry from an existing directory, or set {client.NO_DAEMON_ENV}=1.",
+                )
+                return {
+                    "ok": False,
+                    "exit_code": 1,
+                    "stdout": "",
+                    "stderr": f"[sentinel] {payload.message}\n",
+                    "error": serialize_error(payload),
+                }
+            self.served += 1
+        return {"ok": True, "exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _watch_idle(self) -> None:
+        assert self.idle_timeout is not None
+        interval = min(self.idle_timeout, 5.0)
+        while not self._stopped.wait(interval):
+            if self._run_lock.locked():
+                continue
+            if time.monotonic() - self._last_activity >= self.idle_timeout:
+                self.shutdown()
+                return
+
+    def _claim_socket(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        running = client.request(self.root, {"op": "ping"})
+        if running is None:
+            # Left behind by a daemon that did not shut down cleanly.
+            self.socket_path.unlink(missing_ok=True)
+            return
+        raise SentinelKitError(
+            build_error_payload(
+                code="daemon.already_running",
+                message=f"A sentinel daemon (pid {running.get('pid')}) is already serving {self.root}.",
+                remediation="Stop it first with `sentinel daemon stop`.",
+            )
+        )
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        self.server.owner.handle(self.rfile, self.wfile)  # type: ignore[attr-defined]
+
+
+def _invoke(argv: list[str]) -> int:
+    from .main import app as root_app
+
+    try:
+        root_app(args=argv, prog_name="sentinel")
+    except SystemExit as exit_:
+        if exit_.code is None or isinstance(exit_.code, int):
+            return exit_.code or 0
+        print(exit_.code, file=sys.stderr)
+        return 1
+    except Exception:  # report the crash to the caller instead of killing the daemon
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+@contextmanager
+def _client_state(request: dict[str, Any]) -> Iterator[None]:
+    """Adopt the caller's cwd, environment and terminal hints for one run."""
+    cwd = os.getcwd()
+    environ = dict(os.environ)
+    stdin = sys.stdin
+    raw_env = request.get("env") or {}
+    if not isinstance(raw_env, dict):
+        raise ValueError("'env' must be a JSON object")
+    env = {str(key): str(value) for key, value in raw_env.items()}
+    target = request.get("cwd") or cwd
+    if not isinstance(target, str):
+        raise ValueError("'cwd' must be a string")
+    if request.get("tty"):
+        # Output is captured, so tell Rich what the caller's terminal supports.
+        env.setdefault("FORCE_COLOR", "1")
+        if request.get("columns"):
+            env.setdefault("COLUMNS", str(request["columns"]))
+    try:
+        os.chdir(target)
+        os.environ.clear()
+        os.environ.update(env)
+        sys.stdin = io.StringIO()
+        yield
+    finally:
+        sys.stdin = stdin
+        os.environ.clear()
+        os.environ.update(environ)
+        os.chdir(cwd)
+
+
+def _warm_up(root: Path) -> None:
+    """Import every subcommand and prime the per-repository caches."""
+    from sentinelkit.context.limits import load_context_limits
+    from sentinelkit.contracts.loader import ContractLoader
+    from sentinelkit.prompt.agents import registry_cache
+
+    from .main import LAZY_COMMANDS
+
+    for spec in LAZY_COMMANDS.values():
+        importlib.import_module(spec.module)
+    primers = (
+        lambda: load_context_limits(root=root),
+        lambda: ContractLoader(root=root).load_schemas(),
+        lambda: registry_cache.get(root),
+    )
+    for prime in primers:
+        try:
+            prime()
+        except Exception:  # a broken config surfaces when a command loads it
+            continue
+
+
+@app.command("start", help="Start the daemon for this repository (in the background by default).")
+def start(
+    ctx: typer.Context,
+    foreground: bool = typer.Option(False, "--foreground", help="Serve in this process until stopped."),
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT,
+        "--idle-timeout",
+        min=0,
+        help="Exit after this many idle seconds (0 keeps running).",
+    ),
+) -> None:
+    context = get_context(ctx)
+    running = client.request(context.root, {"op": "ping"})
+    if running is not None:
+        _emit(context, {**running, "started": False})
+        return
+    try:
+        if foreground:
+            _serve_foreground(context.root, idle_timeout)
+            return
+        status = _spawn(context.root, idle_timeout)
+    except SentinelKitError as error:
+        _fail(context, error, "Daemon start failed")
+    _emit(context, {**status, "started": True})
+
+
+@app.command("stop", help="Stop the daemon for this repository.")
+def stop(ctx: typer.Context) -> None:
+    context = get_context(ctx)
+    status = client.request(context.root, {"op": "stop"}, timeout=STOP_TIMEOUT)
+    if status is None:
+        _emit(context, {"ok": True, "running": False, "root": str(context.root)})
+        return
+    socket_path = context.root / client.DAEMON_SOCKET
+    deadline = time.monotonic() + STOP_TIMEOUT
+    while socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    _emit(context, {**status, "running": False, "stopped": True})
+
+
+@app.command("status", help="Report whether a daemon is serving this repository (exit 1 when not).")
+def status(ctx: typer.Context) -> None:
+    context = get_context(ctx)
+    running = client.request(context.root, {"op": "ping"})
+    _emit(context, running or {"ok": False, "running": False, "root": str(context.root)})
+    if running is None:
+        raise typer.Exit(1)
+
+
+def _serve_foreground(root: Path, idle_timeout: float) -> None:
+    if threading.current_thread() is threading.main_thread():
+        # Let `kill` unwind through serve_forever so the socket is removed.
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        SentinelDaemon(root, idle_timeout=idle_timeout).serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def _spawn(root: Path, idle_timeout: float) -> dict[str, Any]:
+    log_path = root / LOG_PATH
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [
+        sys.executable,
+        "-m",
+        "sentinelkit.cli.main",
+        "--root",
+        str(root),
+        "daemon",
+        "start",
+        "--foreground",
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    with log_path.open("ab") as log:
+        process = subprocess.Popen(
+            command,
+            cwd=root,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        running = client.request(root, {"op": "ping"})
+        if running is not None:
+            return running
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+    raise SentinelKitError(
+        build_error_payload(
+            code="daemon.start_failed",
+            message="The sentinel daemon did not come up.",
+            remediation=f"See {log_path} for details.",
+        )
+    )
+
+
+def _emit(context: CLIContext, payload: dict[str, Any]) -> None:
+    if context.format == "json":
+        typer.echo(json.dumps(payload, indent=2))
+        return
+    if not payload.get("running"):
+        message = "stopped" if payload.get("stopped") else "not running"
+        typer.echo(f"sentinel daemon {message} ({payload['root']})")
+        return
+    verb = "started" if payload.get("started") else "running"
+    typer.secho(
+        f"sentinel daemon {verb}: pid {payload['pid']}, served {payload['served']}, "
+        f"up {payload['uptime']:.1f}s, socket {payload['socket']}",
+        fg="green",
+    )
+
+
+def _fail(context: CLIContext, error: SentinelKitError, label: str) -> None:
+    payload = serialize_error(error)
+    if context.format == "json":
+        typer.echo(json.dumps({"ok": False, "error": payload}, indent=2))
+    else:
+        typer.secho(f"{label} -> {payload['message']}", fg="red")
+        if payload.get("remediation"):
+            typer.echo(payload["remediation"])
+    raise typer.Exit(1)
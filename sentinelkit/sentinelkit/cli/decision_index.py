@@ -0,0 +1,121 @@
+"""Sidecar offset index for the DECISIONS.md ledger."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sentinelkit.utils.io import atomic_write_text
+
+__all__ = ["INDEX_VERSION", "DecisionIndex", "build_index", "default_index_path", "load_index", "save_index"]
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "decisions.index.json"
+
+NEXT_ID_BYTES = re.compile(rb"(## NEXT_ID\s*)(?:\r?\n)+([A-Z]-\d{4})")
+ENTRY_ID_BYTES = re.compile(rb"^ID:[ \t]*([A-Z]-\d{4})[ \t]*\r?$", re.MULTILINE)
+
+
+@dataclass(slots=True)
+class DecisionIndex:
+    """ID→byte offset map plus the NEXT_ID location for a ledger snapshot.
+
+    ``newline`` is the ledger's line ending (taken from its first line) so
+    in-place appends match the rest of the file.
+    """
+
+    next_id: str
+    next_id_offset: int
+    ledger_size: int
+    ledger_mtime_ns: int
+    entries: dict[str, int] = field(default_factory=dict)
+    newline: str = "\n"
+
+    def matches(self, ledger_path: Path) -> bool:
+        """Return True when the index still describes the ledger on disk.
+
+        Size and mtime catch most external edits; re-reading the NEXT_ID token at
+        its recorded offset also catches same-size edits within one mtime tick.
+        """
+        try:
+            stat = ledger_path.stat()
+            if stat.st_size != self.ledger_size or stat.st_mtime_ns != self.ledger_mtime_ns:
+                return False
+            with ledger_path.open("rb") as handle:
+                handle.seek(self.next_id_offset)
+                token = handle.read(len(self.next_id))
+        except OSError:
+            return False
+        return token == self.next_id.encode("ascii")
+
+    def refresh_stat(self, ledger_path: Path) -> None:
+        stat = ledger_path.stat()
+        self.ledger_size = stat.st_size
+        self.ledger_mtime_ns = stat.st_mtime_ns
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "version": INDEX_VERSION,
+            "nextId": self.next_id,
+            "nextIdOffset": self.next_id_offset,
+            "ledgerSize": self.ledger_size,
+            "ledgerMtimeNs": self.ledger_mtime_ns,
+            "entries": self.entries,
+            "newline": self.newline,
+        }
+
+
+def default_index_path(ledger_path: Path) -> Path:
+    """Return the sidecar location (``.sentinel/cache``) for *ledger_path*."""
+    return ledger_path.parent / "cache" / INDEX_FILENAME
+
+
+def build_index(data: bytes, *, ledger_path: Path) -> DecisionIndex | None:
+    """Scan raw ledger bytes once; return None when the NEXT_ID block is missing."""
+    match = NEXT_ID_BYTES.search(data)
+    if not match:
+        return None
+    entries: dict[str, int] = {}
+    for entry in ENTRY_ID_BYTES.finditer(data):
+        entries.setdefault(entry.group(1).decode("ascii"), entry.start())
+    first_break = data.find(b"\n")
+    newline = "\r\n" if first_break > 0 and data[first_break - 1 : first_break] == b"\r" else "\n"
+    stat = ledger_path.stat()
+    return DecisionIndex(
+        next_id=match.group(2).decode("ascii"),
+        next_id_offset=match.start(2),
+        ledger_size=stat.st_size,
+        ledger_mtime_ns=stat.st_mtime_ns,
+        entries=entries,
+        newline=newline,
+    )
+
+
+def load_index(index_path: Path) -> DecisionIndex | None:
+    """Read a persisted index; corrupt or foreign files are treated as missing."""
+    try:
+        raw = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != INDEX_VERSION:
+        return None
+    if raw.get("newline") not in ("\n", "\r\n"):
+        return None
+    try:
+        return DecisionIndex(
+            next_id=str(raw["nextId"]),
+            next_id_offset=int(raw["nextIdOffset"]),
+            ledger_size=int(raw["ledgerSize"]),
+            ledger_mtime_ns=int(raw["ledgerMtimeNs"]),
+            entries={str(key): int(value) for key, value in dict(raw["entries"]).items()},
+            newline=raw["newline"],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_index(index_path: Path, index: DecisionIndex) -> None:
+    """Persist *index* via write-then-rename so readers never see partial JSON."""
+    atomic_write_text(index_path, json.dumps(index.to_dict(), separators=(",", ":")), fsync=False)
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date
+import fnmatch
+import os
 import re
-import subprocess
 from pathlib import Path
-from typing import Iterable
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Sequence
 
 import portalocker
 from portalocker import exceptions as portalocker_exceptions
 
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
+from sentinelkit.utils.git import short_head_hash
+from sentinelkit.utils.io import atomic_write_text
+from sentinelkit.utils.journal import Journal
+from sentinelkit.utils.paths import normalize_path
+
+from .decision_index import DecisionIndex, build_index, default_index_path, load_index, save_index
 
 __all__ = [
     "DecisionLedger",
@@ -23,7 +31,12 @@ __all__ = [
 ]
 
 ID_PATTERN = re.compile(r"^[A-Z]-\d{4}$")
+ID_TOKEN = re.compile(r"[A-Z]-\d{4}")
 NEXT_ID_BLOCK = re.compile(r"(## NEXT_ID\s*)(?:\r?\n)+([A-Z]-\d{4})")
+ENTRY_FIELD = re.compile(r"^(ID|Date|Author|Scope|Decision|Rationale|Outputs|Supersedes):[ \t]*(.*?)\s*$")
+_RECORD_FIELDS = frozenset({"author", "scope", "decision", "rationale", "outputs", "supersedes", "date"})
+_RECORD_STRING_FIELDS = ("author", "decision", "rationale", "supersedes", "date")
+_RECORD_LIST_FIELDS = ("scope", "outputs")
 
 
 class DecisionLedgerError(SentinelKitError):
@@ -42,6 +55,42 @@ class DecisionPayload:
     supersedes: str = "none"
     date_override: str | None = None
 
+    @classmethod
+    def from_record(cls, record: Any, *, source: str) -> DecisionPayload:
+        """Build a payload from a JSON record (a JSONL batch line or a journal entry).
+
+        ``scope`` and ``outputs`` may be a string or a list of strings; the other
+        fields must be strings. Anything else raises ``decision.batch_parse``
+        prefixed with *source* so the offending line can be found.
+        """
+
+        def invalid(message: str) -> DecisionLedgerError:
+            return DecisionLedgerError(build_error_payload(code="decision.batch_parse", message=f"{source}: {message}"))
+
+        if not isinstance(record, Mapping):
+            raise invalid("expected a JSON object")
+        unknown = sorted(set(record) - _RECORD_FIELDS)
+        if unknown:
+            raise invalid(f"unsupported field(s): {', '.join(unknown)}")
+        for field in _RECORD_STRING_FIELDS:
+            if record.get(field) is not None and not isinstance(record[field], str):
+                raise invalid(f"'{field}' must be a string")
+        for field in _RECORD_LIST_FIELDS:
+            value = record.get(field)
+            if value is None or isinstance(value, str):
+                continue
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise invalid(f"'{field}' must be a string or a list of strings")
+        return cls(
+            author=record.get("author"),
+            scope=", ".join(_as_list(record.get("scope"))),
+            decision=record.get("decision"),
+            rationale=record.get("rationale"),
+            outputs=_as_list(record.get("outputs")),
+            supersedes=record.get("supersedes") or "none",
+            date_override=record.get("date"),
+        )
+
 
 @dataclass(slots=True)
 class ProducedBySnippets:
@@ -92,14 +141,62 @@ class _DecisionEntry:
         ]
         return "\n".join(lines)
 
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "id": self.id,
+            "date": self.date,
+            "author": self.author,
+            "scope": self.scope,
+            "decision": self.decision,
+            "rationale": self.rationale,
+            "outputs": self.outputs,
+            "supersedes": self.supersedes,
+        }
+
+    @property
+    def output_paths(self) -> list[str]:
+        return [normalize_path(token) for token in self.outputs.split(",") if token.strip()]
+
+    @property
+    def superseded_ids(self) -> list[str]:
+        return ID_TOKEN.findall(self.supersedes)
+
+
+@dataclass(slots=True)
+class _LedgerSnapshot:
+    """Parsed ledger entries plus lookup tables, valid for one (size, mtime) pair."""
+
+    size: int
+    mtime_ns: int
+    entries: list[_DecisionEntry]
+    by_id: dict[str, _DecisionEntry]
+    order: dict[str, int]
+    by_output: dict[str, list[str]]
+    superseded_by: dict[str, list[str]]
+
+
+_SNAPSHOT_CACHE: dict[Path, _LedgerSnapshot] = {}
+
 
 class DecisionLedger:
     """Manage DECISIONS.md mutations with deterministic formatting + locking."""
 
-    def __init__(self, ledger_path: Path | str, *, lock_timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        ledger_path: Path | str,
+        *,
+        lock_timeout: float = 10.0,
+        index_path: Path | str | None = None,
+        journal_path: Path | str | None = None,
+    ) -> None:
         self.ledger_path = Path(ledger_path)
         self.lock_path = self.ledger_path.with_suffix(self.ledger_path.suffix + ".lock")
         self.lock_timeout = lock_timeout
+        self.index_path = Path(index_path) if index_path else default_index_path(self.ledger_path)
+        self.journal = Journal(
+            journal_path or self.ledger_path.with_suffix(self.ledger_path.suffix + ".journal"),
+            lock_timeout=lock_timeout,
+        )
 
     def append(
         self,
@@ -111,62 +208,156 @@ class DecisionLedger:
         output_path: Path | None = None,
         decision_id: str | None = None,
     ) -> LedgerAppendResult:
-        if not self.ledger_path.exists():
-            raise DecisionLedgerError(
-                build_error_payload(
-                    code="decision.ledger_missing",
-                    message=f"Ledger '{self.ledger_path}' does not exist.",
-                    remediation="Create DECISIONS.md or point --ledger at the correct path.",
-                )
-            )
+        self._require_ledger()
 
-        try:
-            with portalocker.Lock(str(self.lock_path), timeout=self.lock_timeout, mode="w"):
+        with self._locked():
+            index = self._load_index()
+            entry_id = _normalize_decision_id(decision_id, index.next_id)
+            _assert_id_unused(index, entry_id)
+            entry = _build_entry(entry_id, payload)
+            bumped = _bump_id(entry_id)
+
+            preview_path = None
+            if output_path:
                 content = self.ledger_path.read_text(encoding="utf-8")
-                current_id = _extract_next_id(content)
-                entry_id = _normalize_decision_id(decision_id, current_id)
-                _assert_id_unused(content, entry_id)
-                entry = _DecisionEntry(
-                    id=entry_id,
-                    date=_normalize_date(payload.date_override),
-                    author=_require(payload.author, "author"),
-                    scope=_require(payload.scope, "scope"),
-                    decision=_require(payload.decision, "decision"),
-                    rationale=_require(payload.rationale, "rationale"),
-                    outputs=_normalize_outputs(payload.outputs),
-                    supersedes=_normalize_supersedes(payload.supersedes),
-                )
-                bumped = _bump_id(entry_id)
                 updated_content = _render_updated_ledger(content, bumped, entry.format())
+                preview_path = _write_preview(output_path, updated_content)
+
+            wrote_ledger = False
+            if not dry_run:
+                self._write_entry(index, bumped, entry)
+                wrote_ledger = True
+
+            return _build_result(
+                entry,
+                payload,
+                ledger_path=self.ledger_path,
+                agent=agent,
+                rules_hash=rules_hash,
+                git_hash=_git_short_hash(self.ledger_path.parent),
+                wrote_ledger=wrote_ledger,
+                dry_run=dry_run,
+                output_path=preview_path,
+            )
 
-                preview_path = None
-                if output_path:
-                    preview_path = Path(output_path)
-                    preview_path.parent.mkdir(parents=True, exist_ok=True)
-                    preview_path.write_text(updated_content, encoding="utf-8", newline="\n")
-
-                wrote_ledger = False
-                if not dry_run:
-                    self.ledger_path.write_text(updated_content, encoding="utf-8", newline="\n")
-                    wrote_ledger = True
-
-                agent_token = _normalize_agent(agent or payload.author)
-                snippets = _build_snippets(
-                    agent=agent_token,
-                    rules_hash=rules_hash or f"{agent_token}@1.0",
-                    decision_id=entry_id,
-                    git_hash=_git_short_hash(self.ledger_path.parent),
-                )
+    def append_many(
+        self,
+        payloads: Sequence[DecisionPayload],
+        *,
+        agent: str | None = None,
+        rules_hash: str | None = None,
+        dry_run: bool = False,
+        output_path: Path | None = None,
+    ) -> list[LedgerAppendResult]:
+        """Append *payloads* under consecutive ids with one lock, one rewrite, and one git lookup.
+
+        Every payload is validated before anything is written, so a bad entry leaves
+        the ledger untouched.
+        """
+        self._require_ledger()
+        if not payloads:
+            raise DecisionLedgerError(
+                build_error_payload(code="decision.empty_batch", message="No decisions provided to append.")
+            )
 
-                return LedgerAppendResult(
-                    id=entry_id,
-                    entry=entry.format(),
-                    ledger_path=self.ledger_path,
-                    wrote_ledger=wrote_ledger,
-                    dry_run=dry_run,
-                    output_path=preview_path,
-                    snippets=snippets,
-                )
+        with self._locked():
+            return self._append_many_locked(
+                payloads, agent=agent, rules_hash=rules_hash, dry_run=dry_run, output_path=output_path
+            )
+
+    def _append_many_locked(
+        self,
+        payloads: Sequence[DecisionPayload],
+        *,
+        agent: str | None,
+        rules_hash: str | None,
+        dry_run: bool = False,
+        output_path: Path | None = None,
+    ) -> list[LedgerAppendResult]:
+        index = self._load_index()
+        entries: list[_DecisionEntry] = []
+        entry_id = index.next_id
+        for payload in payloads:
+            _assert_id_unused(index, entry_id)
+            entries.append(_build_entry(entry_id, payload))
+            entry_id = _bump_id(entry_id)
+
+        content = self.ledger_path.read_text(encoding="utf-8")
+        updated_content = _render_updated_ledger(
+            content, entry_id, "\n\n".join(entry.format() for entry in entries)
+        )
+
+        preview_path = _write_preview(output_path, updated_content) if output_path else None
+
+        wrote_ledger = False
+        if not dry_run:
+            atomic_write_text(self.ledger_path, updated_content)
+            rebuilt = build_index(updated_content.encode("utf-8"), ledger_path=self.ledger_path)
+            if rebuilt is not None:
+                self._save_index(rebuilt)
+            wrote_ledger = True
+
+        git_hash = _git_short_hash(self.ledger_path.parent)
+        return [
+            _build_result(
+                entry,
+                payload,
+                ledger_path=self.ledger_path,
+                agent=agent,
+                rules_hash=rules_hash,
+                git_hash=git_hash,
+                wrote_ledger=wrote_ledger,
+                dry_run=dry_run,
+                output_path=preview_path,
+            )
+            for entry, payload in zip(entries, payloads, strict=True)
+        ]
+
+    def enqueue(self, payload: DecisionPayload) -> None:
+        """Validate *payload* and queue it in the journal without taking the ledger lock.
+
+        Ids are assigned when the journal is flushed, so concurrent agents only
+        contend on a single appended line. The entry date is fixed now.
+        """
+        entry = _build_entry("D-0000", payload)
+        self.journal.append(
+            {
+                "author": entry.author,
+                "scope": entry.scope,
+                "decision": entry.decision,
+                "rationale": entry.rationale,
+                "outputs": [token.strip() for token in entry.outputs.split(",")],
+                "supersedes": entry.supersedes,
+                "date": entry.date,
+            }
+        )
+
+    def flush(
+        self,
+        *,
+        agent: str | None = None,
+        rules_hash: str | None = None,
+    ) -> list[LedgerAppendResult]:
+        """Compact every journaled decision into the ledger with one ``append_many`` write.
+
+        Records are checked like ``--from-jsonl`` lines, since any process may have
+        appended to the journal; a bad record fails the flush and stays queued.
+        """
+        self._require_ledger()
+        with self._locked(), self.journal.pending() as records:
+            if not records:
+                return []
+            payloads = [
+                DecisionPayload.from_record(record, source=f"{self.journal.path.name} record {number}")
+                for number, record in enumerate(records, start=1)
+            ]
+            return self._append_many_locked(payloads, agent=agent, rules_hash=rules_hash)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        try:
+            with portalocker.Lock(str(self.lock_path), timeout=self.lock_timeout, mode="w"):
+                yield
         except portalocker_exceptions.LockException as exc:
             raise DecisionLedgerError(
                 build_error_payload(
@@ -176,22 +367,289 @@ class DecisionLedger:
                 )
             ) from exc
 
+    def query(
+        self,
+        *,
+        decision_id: str | None = None,
+        output: str | None = None,
+        text: str | None = None,
+        author: str | None = None,
+        limit: int | None = None,
+    ) -> list[_DecisionEntry]:
+        """Return ledger entries matching every provided filter, in ledger order.
+
+        ``output`` matches an exact output path, any output below it when it names a
+        directory, and output globs (``fixtures/users.v1/*``) that cover it.
+        """
+        snapshot = self._snapshot()
+        output_ids = _ids_for_output(snapshot, output) if output is not None else None
+        candidates: list[_DecisionEntry]
+        if decision_id is not None:
+            entry = snapshot.by_id.get(decision_id.strip().upper())
+            candidates = [entry] if entry and (output_ids is None or entry.id in output_ids) else []
+        elif output_ids is not None:
+            candidates = sorted((snapshot.by_id[item] for item in output_ids), key=lambda e: snapshot.order[e.id])
+        else:
+            candidates = list(snapshot.entries)
+
+        if text:
+            needle = text.strip().lower()
+            candidates = [
+                entry
+                for entry in candidates
+                if needle in entry.decision.lower()
+                or needle in entry.rationale.lower()
+                or needle in entry.scope.lower()
+            ]
+        if author:
+            wanted = author.strip().lower()
+            candidates = [entry for entry in candidates if entry.author.lower() == wanted]
+        if limit is not None and limit >= 0:
+            candidates = candidates[:limit]
+        return candidates
+
+    def get(self, decision_id: str) -> _DecisionEntry:
+        """Return a single entry or raise ``decision.not_found``."""
+        matches = self.query(decision_id=decision_id)
+        if not matches:
+            raise DecisionLedgerError(
+                build_error_payload(
+                    code="decision.not_found",
+                    message=f"Decision {decision_id.strip().upper()} does not exist in the ledger.",
+                )
+            )
+        return matches[0]
+
+    def chain(self, decision_id: str) -> list[_DecisionEntry]:
+        """Return every entry linked to *decision_id* through Supersedes, oldest first.
+
+        Links are followed in both directions from every entry reached, so the
+        result includes siblings (other entries superseding the same decision)
+        and their successors, not just the straight line through *decision_id*.
+        """
+        root = self.get(decision_id)
+        snapshot = self._snapshot()
+        related: dict[str, _DecisionEntry] = {root.id: root}
+
+        pending = [root.id]
+        while pending:
+            current = pending.pop()
+            neighbours = (*snapshot.by_id[current].superseded_ids, *snapshot.superseded_by.get(current, ()))
+            for linked in neighbours:
+                if linked not in related and linked in snapshot.by_id:
+                    related[linked] = snapshot.by_id[linked]
+                    pending.append(linked)
+
+        return sorted(related.values(), key=lambda entry: snapshot.order[entry.id])
+
+    def _require_ledger(self) -> None:
+        if not self.ledger_path.exists():
+            raise DecisionLedgerError(
+                build_error_payload(
+                    code="decision.ledger_missing",
+                    message=f"Ledger '{self.ledger_path}' does not exist.",
+                    remediation="Create DECISIONS.md or point --ledger at the correct path.",
+                )
+            )
 
-def _extract_next_id(content: str) -> str:
-    match = NEXT_ID_BLOCK.search(content)
-    if not match:
-        raise DecisionLedgerError(
-            build_error_payload(
-                code="decision.missing_next_id",
-                message="NEXT_ID block not found in DECISIONS.md",
+    def _snapshot(self) -> _LedgerSnapshot:
+        """Return the parsed ledger, re-reading it only when size or mtime changed."""
+        self._require_ledger()
+        key = self.ledger_path.resolve()
+        stat = key.stat()
+        cached = _SNAPSHOT_CACHE.get(key)
+        if cached is not None and cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns:
+            return cached
+        snapshot = _build_snapshot(key.read_text(encoding="utf-8"), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        _SNAPSHOT_CACHE[key] = snapshot
+        return snapshot
+
+    def _load_index(self) -> DecisionIndex:
+        """Return the sidecar index, rebuilding it when the ledger changed underneath it."""
+        index = load_index(self.index_path)
+        if index is not None and index.matches(self.ledger_path):
+            return index
+        index = build_index(self.ledger_path.read_bytes(), ledger_path=self.ledger_path)
+        if index is None:
+            raise DecisionLedgerError(
+                build_error_payload(
+                    code="decision.missing_next_id",
+                    message="NEXT_ID block not found in DECISIONS.md",
+                )
             )
-        )
-    return match.group(2)
+        self._save_index(index)
+        return index
+
+    def _save_index(self, index: DecisionIndex) -> None:
+        try:
+            save_index(self.index_path, index)
+        except OSError:
+            # The index is a cache; an unwritable cache dir only costs a rescan next time.
+            pass
+
+    def _write_entry(self, index: DecisionIndex, next_id: str, entry: _DecisionEntry) -> None:
+        """Patch NEXT_ID in place and append *entry*, in the ledger's line endings, without rewriting it."""
+        token = next_id.encode("ascii")
+        if len(token) != len(index.next_id):
+            content = self.ledger_path.read_text(encoding="utf-8")
+            updated = _render_updated_ledger(content, next_id, entry.format())
+            atomic_write_text(self.ledger_path, updated)
+            rebuilt = build_index(updated.encode("utf-8"), ledger_path=self.ledger_path)
+            if rebuilt is not None:
+                self._save_index(rebuilt)
+            return
+
+        # The entry is made durable before NEXT_ID moves: a crash in between leaves
+        # an entry whose id equals NEXT_ID, which the next append reports as
+        # decision.duplicate_id instead of silently reusing the id.
+        newline = index.newline
+        text = entry.format().replace("\n", newline)
+        with self.ledger_path.open("r+b") as handle:
+            end = _content_end(handle)
+            handle.seek(end)
+            handle.write(f"{newline}{newline}{text}{newline}".encode("utf-8"))
+            handle.truncate()
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.seek(index.next_id_offset)
+            handle.write(token)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        index.entries[entry.id] = end + 2 * len(newline)
+        index.next_id = next_id
+        index.refresh_stat(self.ledger_path)
+        self._save_index(index)
+
+
+def _build_entry(entry_id: str, payload: DecisionPayload) -> _DecisionEntry:
+    return _DecisionEntry(
+        id=entry_id,
+        date=_normalize_date(payload.date_override),
+        author=_require(payload.author, "author"),
+        scope=_require(payload.scope, "scope"),
+        decision=_require(payload.decision, "decision"),
+        rationale=_require(payload.rationale, "rationale"),
+        outputs=_normalize_outputs(payload.outputs),
+        supersedes=_normalize_supersedes(payload.supersedes),
+    )
 
 
-def _assert_id_unused(content: str, decision_id: str) -> None:
-    pattern = re.compile(rf"^ID:\s*{re.escape(decision_id)}\s*$", re.MULTILINE)
-    if pattern.search(content):
+def _build_result(
+    entry: _DecisionEntry,
+    payload: DecisionPayload,
+    *,
+    ledger_path: Path,
+    agent: str | None,
+    rules_hash: str | None,
+    git_hash: str,
+    wrote_ledger: bool,
+    dry_run: bool,
+    output_path: Path | None,
+) -> LedgerAppendResult:
+    agent_token = _normalize_agent(agent or payload.author)
+    snippets = _build_snippets(
+        agent=agent_token,
+        rules_hash=rules_hash or f"{agent_token}@1.0",
+        decision_id=entry.id,
+        git_hash=git_hash,
+    )
+    return LedgerAppendResult(
+        id=entry.id,
+        entry=entry.format(),
+        ledger_path=ledger_path,
+        wrote_ledger=wrote_ledger,
+        dry_run=dry_run,
+        output_path=output_path,
+        snippets=snippets,
+    )
+
+
+def _write_preview(output_path: Path | str, content: str) -> Path:
+    preview_path = Path(output_path)
+    preview_path.parent.mkdir(parents=True, exist_ok=True)
+    preview_path.write_text(content, encoding="utf-8", newline="\n")
+    return preview_path
+
+
+def _parse_entries(content: str) -> list[_DecisionEntry]:
+    entries: list[_DecisionEntry] = []
+    current: dict[str, str] | None = None
+
+    def flush() -> None:
+        if current is not None and ID_PATTERN.match(current["id"]):
+            entries.append(
+                _DecisionEntry(
+                    id=current["id"],
+                    date=current.get("date", ""),
+                    author=current.get("author", ""),
+                    scope=current.get("scope", ""),
+                    decision=current.get("decision", ""),
+                    rationale=current.get("rationale", ""),
+                    outputs=current.get("outputs", ""),
+                    supersedes=current.get("supersedes", "none"),
+                )
+            )
+
+    for line in content.splitlines():
+        match = ENTRY_FIELD.match(line)
+        if match is None:
+            if current is not None and not line.strip():
+                flush()
+                current = None
+            continue
+        key, value = match.groups()
+        if key == "ID":
+            flush()
+            current = {"id": value}
+        elif current is not None:
+            current[key.lower()] = value
+    flush()
+    return entries
+
+
+def _build_snapshot(content: str, *, size: int, mtime_ns: int) -> _LedgerSnapshot:
+    entries = _parse_entries(content)
+    by_id: dict[str, _DecisionEntry] = {}
+    order: dict[str, int] = {}
+    by_output: dict[str, list[str]] = {}
+    superseded_by: dict[str, list[str]] = {}
+    for position, entry in enumerate(entries):
+        by_id.setdefault(entry.id, entry)
+        order.setdefault(entry.id, position)
+        for output in entry.output_paths:
+            owners = by_output.setdefault(output, [])
+            if entry.id not in owners:
+                owners.append(entry.id)
+        for previous in entry.superseded_ids:
+            superseded_by.setdefault(previous, []).append(entry.id)
+    return _LedgerSnapshot(
+        size=size,
+        mtime_ns=mtime_ns,
+        entries=entries,
+        by_id=by_id,
+        order=order,
+        by_output=by_output,
+        superseded_by=superseded_by,
+    )
+
+
+def _ids_for_output(snapshot: _LedgerSnapshot, path: str) -> set[str]:
+    target = normalize_path(path).rstrip("/")
+    ids = set(snapshot.by_output.get(target, ()))
+    prefix = f"{target}/"
+    for output, owners in snapshot.by_output.items():
+        if output.startswith(prefix) or (_is_glob(output) and fnmatch.fnmatchcase(target, output)):
+            ids.update(owners)
+    return ids
+
+
+def _is_glob(value: str) -> bool:
+    return any(marker in value for marker in "*?[")
+
+
+def _assert_id_unused(index: DecisionIndex, decision_id: str) -> None:
+    if decision_id in index.entries:
         raise DecisionLedgerError(
             build_error_payload(
                 code="decision.duplicate_id",
@@ -201,6 +659,19 @@ def _assert_id_unused(content: str, decision_id: str) -> None:
         )
 
 
+def _content_end(handle: BinaryIO) -> int:
+    """Return the offset just past the last non-whitespace byte (mirrors ``str.rstrip``)."""
+    position = handle.seek(0, os.SEEK_END)
+    while position > 0:
+        step = min(position, 512)
+        handle.seek(position - step)
+        stripped = handle.read(step).rstrip()
+        if stripped:
+            return position - step + len(stripped)
+        position -= step
+    return 0
+
+
 def _bump_id(decision_id: str) -> str:
     if not ID_PATTERN.match(decision_id):
         raise DecisionLedgerError(
@@ -227,6 +698,12 @@ def _normalize_outputs(outputs: Iterable[str]) -> str:
     return ", ".join(tokens)
 
 
+def _as_list(value: str | list[str] | None) -> list[str]:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
 def _normalize_supersedes(value: str | None) -> str:
     return value.strip() if value and value.strip() else "none"
 
@@ -294,21 +771,7 @@ def _normalize_decision_id(override: str | None, current: str) -> str:
 
 
 def _git_short_hash(cwd: Path) -> str:
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=str(cwd),
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            token = result.stdout.strip()
-            if token:
-                return token
-    except OSError:
-        pass
-    return "unknown"
+    return short_head_hash(cwd) or "unknown"
 
 
 def _build_snippets(*, agent: str, rules_hash: str, decision_id: str, git_hash: str) -> ProducedBySnippets:
@@ -9,7 +9,11 @@ from typing import Annotated
 
 import typer
 
-from sentinelkit.utils.errors import SentinelKitError, serialize_error
+from sentinelkit.utils.errors import (
+    SentinelKitError,
+    build_error_payload,
+    serialize_error,
+)
 
 from .decision_log import DecisionLedger, DecisionLedgerError, DecisionPayload
 from .state import get_context
@@ -20,26 +24,28 @@ app = typer.Typer(help="Decision log utilities.")
 @app.command("append", help="Append to the decision ledger.")
 def append(
     ctx: typer.Context,
-    author: Annotated[str, typer.Option("--author", "-a", help="Author or agent for the ledger entry.")],
+    author: Annotated[
+        str | None, typer.Option("--author", "-a", help="Author or agent for the ledger entry.")
+    ] = None,
     scope: Annotated[
-        list[str],
+        list[str] | None,
         typer.Option(
             "--scope",
             "-s",
             help="Scope paths (repeat flag for multiple entries, e.g., --scope file1 --scope file2).",
         ),
-    ],
-    decision: Annotated[str, typer.Option("--decision", "-d", help="Decision summary text.")],
-    rationale: Annotated[str, typer.Option("--rationale", "-r", help="Rationale for the decision.")],
+    ] = None,
+    decision: Annotated[str | None, typer.Option("--decision", "-d", help="Decision summary text.")] = None,
+    rationale: Annotated[str | None, typer.Option("--rationale", "-r", help="Rationale for the decision.")] = None,
     outputs: Annotated[
-        list[str],
+        list[str] | None,
         typer.Option(
             "--output-path",
             "--outputs",
             "-o",
             help="Output artifacts touched by this decision (repeat flag for multiple entries).",
         ),
-    ],
+    ] = None,
     supersedes: Annotated[
         str,
         typer.Option("--supersedes", help="Decision id that is superseded (defaults to 'none')."),
@@ -69,21 +75,69 @@ def append(
             help="Optional preview file to write (useful for CI diffs); relative to --root when not absolute.",
         ),
     ] = None,
+    from_jsonl: Annotated[
+        Path | None,
+        typer.Option(
+            "--from-jsonl",
+            help=(
+                "Append every entry from a JSONL file (one object per line with author, scope, decision, "
+                "rationale, outputs, and optional supersedes/date) in a single ledger write."
+            ),
+        ),
+    ] = None,
+    queue: Annotated[
+        bool,
+        typer.Option(
+            "--queue",
+            help="Queue the entry in the ledger journal; ids are assigned by `sentinel decisions flush`.",
+        ),
+    ] = False,
 ) -> None:
     """Append a structured decision entry."""
     context = get_context(ctx)
     ledger_path = context.root / ".sentinel" / "DECISIONS.md"
     preview_path = _resolve_optional_path(context.root, preview)
+    ledger = DecisionLedger(ledger_path)
+
+    if from_jsonl is not None:
+        per_entry = [author, decision, rationale, decision_id, date]
+        if any(value is not None for value in per_entry) or scope or outputs or supersedes != "none":
+            raise typer.BadParameter("--from-jsonl cannot be combined with per-entry options.")
+        try:
+            payloads = _load_jsonl_payloads(_resolve_optional_path(context.root, from_jsonl))
+            results = ledger.append_many(
+                payloads,
+                agent=agent,
+                rules_hash=rules_hash,
+                dry_run=dry_run,
+                output_path=preview_path,
+            )
+        except DecisionLedgerError as error:
+            _emit_error(ctx, error)
+        else:
+            _emit_batch_result(ctx, results)
+        return
+
     payload = DecisionPayload(
-        author=author,
+        author=_require_value(author, "author"),
         scope=_join_values(scope, "scope"),
-        decision=decision,
-        rationale=rationale,
+        decision=_require_value(decision, "decision"),
+        rationale=_require_value(rationale, "rationale"),
         outputs=_require_values(outputs, "outputs"),
         supersedes=supersedes,
         date_override=date,
     )
-    ledger = DecisionLedger(ledger_path)
+    if queue:
+        if decision_id is not None or dry_run or preview is not None:
+            raise typer.BadParameter("--queue cannot be combined with --id, --dry-run, or --output.")
+        try:
+            ledger.enqueue(payload)
+        except SentinelKitError as error:
+            _emit_error(ctx, error)
+        else:
+            _emit_queued(ctx, ledger.journal.path)
+        return
+
     try:
         result = ledger.append(
             payload,
@@ -99,15 +153,108 @@ def append(
         _emit_decision_result(ctx, result)
 
 
+@app.command("flush", help="Write queued decisions from the journal into the ledger.")
+def flush(
+    ctx: typer.Context,
+    agent: Annotated[
+        str | None,
+        typer.Option("--agent", help="Agent name for ProducedBy headers (defaults to each author)."),
+    ] = None,
+    rules_hash: Annotated[
+        str | None,
+        typer.Option("--rules-hash", help="Rules hash for ProducedBy headers (defaults to '<agent>@1.0')."),
+    ] = None,
+) -> None:
+    """Compact the decision journal into DECISIONS.md with a single ledger write."""
+    ledger = _ledger(ctx)
+    try:
+        results = ledger.flush(agent=agent, rules_hash=rules_hash)
+    except SentinelKitError as error:
+        _emit_error(ctx, error)
+    else:
+        if not results and ctx.obj.format != "json":
+            typer.echo("[sentinel] No queued decisions.")
+            return
+        _emit_batch_result(ctx, results)
+
+
+@app.command("show", help="Show a single decision entry.")
+def show(
+    ctx: typer.Context,
+    decision_id: Annotated[str, typer.Argument(help="Decision id (e.g., D-0042).")],
+) -> None:
+    """Print one ledger entry."""
+    ledger = _ledger(ctx)
+    try:
+        entry = ledger.get(decision_id)
+    except DecisionLedgerError as error:
+        _emit_error(ctx, error)
+    else:
+        _emit_entries(ctx, [entry], key="decision")
+
+
+@app.command("search", help="Search decisions by output path, text, or author.")
+def search(
+    ctx: typer.Context,
+    path: Annotated[
+        str | None,
+        typer.Option("--path", "-p", help="Output path (or directory) touched by the decision."),
+    ] = None,
+    text: Annotated[
+        str | None,
+        typer.Option("--text", "-t", help="Case-insensitive text matched against decision, rationale, and scope."),
+    ] = None,
+    author: Annotated[str | None, typer.Option("--author", "-a", help="Exact author (case-insensitive).")] = None,
+    limit: Annotated[int | None, typer.Option("--limit", "-n", help="Maximum number of entries to return.")] = None,
+) -> None:
+    """List ledger entries matching every provided filter."""
+    ledger = _ledger(ctx)
+    try:
+        entries = ledger.query(output=path, text=text, author=author, limit=limit)
+    except DecisionLedgerError as error:
+        _emit_error(ctx, error)
+    else:
+        _emit_entries(ctx, entries, key="decisions")
+
+
+@app.command("chain", help="Show every decision linked to one through Supersedes, including siblings.")
+def chain(
+    ctx: typer.Context,
+    decision_id: Annotated[str, typer.Argument(help="Decision id (e.g., D-0042).")],
+) -> None:
+    """Print every decision linked to DECISION_ID through Supersedes in either direction, oldest first."""
+    ledger = _ledger(ctx)
+    try:
+        entries = ledger.chain(decision_id)
+    except DecisionLedgerError as error:
+        _emit_error(ctx, error)
+    else:
+        if ctx.obj.format != "json":
+            # Siblings make this a tree, not a line, so list the ids in ledger order.
+            typer.echo(", ".join(entry.id for entry in entries))
+        _emit_entries(ctx, entries, key="chain")
+
+
+def _ledger(ctx: typer.Context) -> DecisionLedger:
+    context = get_context(ctx)
+    return DecisionLedger(context.root / ".sentinel" / "DECISIONS.md")
+
+
+def _emit_entries(ctx: typer.Context, entries, *, key: str) -> None:
+    if ctx.obj.format == "json":
+        value = entries[0].to_dict() if key == "decision" else [entry.to_dict() for entry in entries]
+        typer.echo(json.dumps({"ok": True, key: value}, indent=2))
+        return
+    if not entries:
+        typer.echo("[sentinel] No matching decisions.")
+        return
+    for entry in entries:
+        typer.echo(entry.format())
+        typer.echo("")
+
+
 def _emit_decision_result(ctx: typer.Context, result) -> None:
-    data = {
-        "id": result.id,
-        "ledger": str(result.ledger_path),
-        "dry_run": result.dry_run,
-        "wrote_ledger": result.wrote_ledger,
-        "preview": str(result.output_path) if result.output_path else None,
-        "snippets": asdict(result.snippets),
-    }
+    data = _result_data(result)
     if ctx.obj.format == "json":
         typer.echo(json.dumps(data, indent=2))
     else:
@@ -117,6 +264,56 @@ def _emit_decision_result(ctx: typer.Context, result) -> None:
         typer.echo(f"  {result.snippets.plain}")
 
 
+def _emit_queued(ctx: typer.Context, journal_path: Path) -> None:
+    if ctx.obj.format == "json":
+        typer.echo(json.dumps({"ok": True, "queued": True, "journal": str(journal_path)}, indent=2))
+    else:
+        typer.echo(f"[sentinel] Decision queued in {journal_path} (run `sentinel decisions flush` to assign an id)")
+
+
+def _emit_batch_result(ctx: typer.Context, results) -> None:
+    if ctx.obj.format == "json":
+        typer.echo(json.dumps({"ok": True, "decisions": [_result_data(result) for result in results]}, indent=2))
+        return
+    for result in results:
+        status = "previewed" if result.dry_run else "written"
+        typer.echo(f"[sentinel] Decision {result.id} {status} in {result.ledger_path}")
+        typer.echo(f"  {result.snippets.plain}")
+
+
+def _result_data(result) -> dict:
+    return {
+        "id": result.id,
+        "ledger": str(result.ledger_path),
+        "dry_run": result.dry_run,
+        "wrote_ledger": result.wrote_ledger,
+        "preview": str(result.output_path) if result.output_path else None,
+        "snippets": asdict(result.snippets),
+    }
+
+
+def _load_jsonl_payloads(path: Path) -> list[DecisionPayload]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as error:
+        raise DecisionLedgerError(
+            build_error_payload(code="decision.batch_read", message=f"Unable to read '{path}': {error}")
+        ) from error
+
+    payloads: list[DecisionPayload] = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise DecisionLedgerError(
+                build_error_payload(code="decision.batch_parse", message=f"{path}:{number}: {error.msg}")
+            ) from error
+        payloads.append(DecisionPayload.from_record(record, source=f"{path}:{number}"))
+    return payloads
+
+
 def _emit_error(ctx: typer.Context, error: SentinelKitError) -> None:
     payload = serialize_error(error)
     if ctx.obj.format == "json":
@@ -126,13 +323,19 @@ def _emit_error(ctx: typer.Context, error: SentinelKitError) -> None:
     raise typer.Exit(1)
 
 
-def _join_values(values: list[str], label: str) -> str:
+def _join_values(values: list[str] | None, label: str) -> str:
     entries = _require_values(values, label)
     return ", ".join(entries)
 
 
-def _require_values(values: list[str], label: str) -> list[str]:
-    normalized = [value.strip() for value in values if value and value.strip()]
+def _require_value(value: str | None, label: str) -> str:
+    if value is None:
+        raise typer.BadParameter(f"--{label} is required.")
+    return value
+
+
+def _require_values(values: list[str] | None, label: str) -> list[str]:
+    normalized = [value.strip() for value in values or [] if value and value.strip()]
     if not normalized:
         raise typer.BadParameter(f"At least one --{label} value is required.")
     return normalized
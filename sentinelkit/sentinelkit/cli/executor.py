@@ -1,10 +1,13 @@
-"""Concurrency helpers for running sentinel checks."""
+"""Dependency-aware scheduler for running sentinel checks."""
 
 from __future__ import annotations
 
+import queue
+import subprocess
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Callable, Literal, Mapping, Sequence
 
 from rich.console import Console
@@ -13,10 +16,13 @@ from rich.status import Status
 from .state import CLIContext
 from sentinelkit.utils.errors import ErrorPayload, serialize_error
 
-__all__ = ["CheckResult", "run_checks"]
+__all__ = ["CheckResult", "CheckRun", "CheckSpec", "run_cancellable", "run_checks"]
 
 CheckStatus = Literal["ok", "pending", "fail"]
 
+DEFAULT_MAX_WORKERS = 8
+POLL_INTERVAL = 0.1
+
 
 @dataclass(slots=True)
 class CheckResult:
@@ -39,50 +45,258 @@ class CheckResult:
         return payload
 
 
+@dataclass(slots=True, frozen=True)
+class CheckRun:
+    """Per-run inputs handed to a scheduled check.
+
+    ``dependencies`` holds the finished results of every check named in
+    ``depends_on``. ``cancel`` is set when the check overruns its timeout;
+    long-running work should poll it (``run_cancellable`` does) and stop early.
+    """
+
+    dependencies: Mapping[str, CheckResult] = field(default_factory=dict)
+    cancel: threading.Event = field(default_factory=threading.Event)
+
+
+@dataclass(slots=True, frozen=True)
+class CheckSpec:
+    """A check plus its scheduling constraints.
+
+    ``fn`` receives the CLI context and a :class:`CheckRun`. Calling the spec
+    directly runs it without dependencies, which keeps specs usable wherever a
+    plain ``check(context)`` callable is expected.
+    """
+
+    fn: Callable[[CLIContext, CheckRun], CheckResult]
+    depends_on: tuple[str, ...] = ()
+    timeout: float | None = None
+
+    def __call__(self, context: CLIContext, run: CheckRun | None = None) -> CheckResult:
+        return self.fn(context, run or CheckRun())
+
+
 CheckCallable = Callable[[CLIContext], CheckResult]
 
 
+@dataclass(slots=True)
+class _Running:
+    started: float
+    deadline: float | None
+    cancel: threading.Event
+
+
 def run_checks(
     context: CLIContext,
-    checks: Mapping[str, CheckCallable],
+    checks: Mapping[str, CheckCallable | CheckSpec],
     *,
     show_status: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> Sequence[CheckResult]:
-    """Execute each check concurrently and return structured results."""
-    console = Console()
-    results: list[CheckResult] = []
+    """Run *checks* concurrently, honouring declared dependencies and timeouts.
+
+    A check starts as soon as everything it depends on has finished, so total
+    wall time tracks the longest dependency chain rather than the sum of the
+    checks. When more checks are ready than ``max_workers`` allows, those with
+    the longest chain of dependents start first. A check that outlives its
+    timeout is reported as ``<name>.timeout`` and its cancel event is set; its
+    worker is a daemon thread, so a hung check never blocks process exit.
+    Unknown dependencies and cycles fail the affected checks without running them.
+    """
+    specs = {name: _as_spec(check) for name, check in checks.items()}
+    results: dict[str, CheckResult] = dict(_invalid_checks(specs))
+    heights = _chain_heights(specs, results)
+    waiting = {name for name in specs if name not in results}
+    running: dict[str, _Running] = {}
+    finished: queue.Queue[tuple[str, CheckResult]] = queue.Queue()
+    limit = max(1, max_workers)
 
+    console = Console()
     status: Status | None = None
     if show_status and context.format == "pretty":
         status = console.status("Running sentinel checks...")
         status.start()
 
+    def record(name: str, result: CheckResult) -> None:
+        results[name] = result
+        if status:
+            status_icon = {
+                "ok": "✅",
+                "pending": "⏳",
+                "fail": "❌",
+            }.get(result.status, "❔")
+            status.update(f"[bold]{result.name}[/] {status_icon}")
+
     try:
-        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
-            future_map = {
-                executor.submit(_run_single_check, name, fn, context): name for name, fn in checks.items()
-            }
-            for future in as_completed(future_map):
-                result = future.result()
-                results.append(result)
-                if status:
-                    status_icon = {
-                        "ok": "✅",
-                        "pending": "⏳",
-                        "fail": "❌",
-                    }.get(result.status, "❔")
-                    status.update(f"[bold]{result.name}[/] {status_icon}")
+        while waiting or running:
+            ready = sorted(
+                (name for name in waiting if all(dep in results for dep in specs[name].depends_on)),
+                key=lambda name: (-heights[name], name),
+            )
+            for name in ready[: limit - len(running)]:
+                waiting.discard(name)
+                spec = specs[name]
+                run = CheckRun(dependencies={dep: results[dep] for dep in spec.depends_on})
+                now = time.perf_counter()
+                deadline = now + spec.timeout if spec.timeout is not None else None
+                running[name] = _Running(started=now, deadline=deadline, cancel=run.cancel)
+                worker = threading.Thread(
+                    target=lambda name=name, spec=spec, run=run: finished.put(
+                        (name, _run_single_check(name, spec, context, run))
+                    ),
+                    name=f"selfcheck-{name}",
+                    daemon=True,
+                )
+                worker.start()
+
+            if not running:
+                break
+            try:
+                name, result = finished.get(timeout=_next_wait(running))
+            except queue.Empty:
+                for expired in _expired(running):
+                    entry = running.pop(expired)
+                    entry.cancel.set()
+                    elapsed = time.perf_counter() - entry.started
+                    record(expired, _timeout_result(expired, specs[expired].timeout, elapsed))
+                continue
+            # Results from checks already reported as timed out are dropped.
+            if running.pop(name, None) is not None:
+                record(name, result)
     finally:
         if status:
             status.stop()
+        for entry in running.values():
+            entry.cancel.set()
+
+    return [results[name] for name in specs]
+
+
+def run_cancellable(
+    args: Sequence[str],
+    run: CheckRun,
+    *,
+    cwd: Path | str | None = None,
+    env: Mapping[str, str] | None = None,
+) -> subprocess.CompletedProcess[str] | None:
+    """Run *args* in a child process, killing it if the check is cancelled.
+
+    stdout and stderr are merged into ``stdout``. Returns ``None`` when the
+    process was killed because ``run.cancel`` was set.
+    """
+    process = subprocess.Popen(
+        list(args),
+        cwd=str(cwd) if cwd is not None else None,
+        env=dict(env) if env is not None else None,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    while True:
+        try:
+            output, _ = process.communicate(timeout=POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            if run.cancel.is_set():
+                process.kill()
+                process.communicate()
+                return None
+            continue
+        return subprocess.CompletedProcess(process.args, process.returncode, output, None)
+
+
+def _as_spec(check: CheckCallable | CheckSpec) -> CheckSpec:
+    if isinstance(check, CheckSpec):
+        return check
+    return CheckSpec(fn=lambda context, _run: check(context))
+
+
+def _invalid_checks(specs: Mapping[str, CheckSpec]) -> dict[str, CheckResult]:
+    """Fail checks with unknown dependencies and every check caught in (or behind) a cycle."""
+    failed: dict[str, CheckResult] = {}
+    for name, spec in specs.items():
+        unknown = sorted(dep for dep in spec.depends_on if dep not in specs)
+        if unknown:
+            failed[name] = _fail(
+                name,
+                "dependency_unknown",
+                f"Check '{name}' depends on unknown check(s): {', '.join(unknown)}.",
+            )
+
+    indegree = {name: len(spec.depends_on) for name, spec in specs.items() if name not in failed}
+    dependents: dict[str, list[str]] = {name: [] for name in specs}
+    for name in indegree:
+        for dep in specs[name].depends_on:
+            dependents[dep].append(name)
+    # Checks with unknown dependencies still run their dependents (with a failed input).
+    for name in failed:
+        for child in dependents[name]:
+            indegree[child] -= 1
+    resolved = [name for name, count in indegree.items() if count == 0]
+    while resolved:
+        current = resolved.pop()
+        for child in dependents[current]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                resolved.append(child)
+    for name, count in indegree.items():
+        if count > 0:
+            failed[name] = _fail(
+                name, "dependency_cycle", f"Check '{name}' is part of or depends on a dependency cycle."
+            )
+    return failed
+
+
+def _chain_heights(specs: Mapping[str, CheckSpec], invalid: Mapping[str, CheckResult]) -> dict[str, int]:
+    """Length of the longest chain of dependents hanging off each schedulable check."""
+    heights: dict[str, int] = {}
+
+    def height(name: str) -> int:
+        if name not in heights:
+            children = [
+                child for child, spec in specs.items() if name in spec.depends_on and child not in invalid
+            ]
+            heights[name] = 1 + max((height(child) for child in children), default=0)
+        return heights[name]
+
+    return {name: height(name) for name in specs if name not in invalid}
+
+
+def _next_wait(running: Mapping[str, _Running]) -> float | None:
+    deadlines = [entry.deadline for entry in running.values() if entry.deadline is not None]
+    if not deadlines:
+        return None
+    return max(0.0, min(deadlines) - time.perf_counter())
+
+
+def _expired(running: Mapping[str, _Running]) -> list[str]:
+    now = time.perf_counter()
+    return [name for name, entry in running.items() if entry.deadline is not None and entry.deadline <= now]
+
+
+def _timeout_result(name: str, timeout: float | None, elapsed: float) -> CheckResult:
+    return CheckResult(
+        name=name,
+        status="fail",
+        duration=elapsed,
+        error=ErrorPayload(
+            code=f"{name}.timeout",
+            message=f"Check '{name}' did not finish within {timeout:g}s and was cancelled.",
+            remediation="Run the check on its own to investigate, or raise its timeout.",
+        ),
+    )
+
 
-    return results
+def _fail(name: str, reason: str, message: str) -> CheckResult:
+    error = ErrorPayload(code=f"{name}.{reason}", message=message)
+    return CheckResult(name=name, status="fail", duration=0.0, error=error)
 
 
-def _run_single_check(name: str, fn: CheckCallable, context: CLIContext) -> CheckResult:
+def _run_single_check(name: str, spec: CheckSpec, context: CLIContext, run: CheckRun) -> CheckResult:
     start = time.perf_counter()
     try:
-        return fn(context)
-    except Exception as exc:  # pragma: no cover - placeholder until real checks land
+        return spec.fn(context, run)
+    except Exception as exc:
         payload = ErrorPayload(code=f"{name}.error", message=str(exc))
         return CheckResult(name=name, status="fail", duration=time.perf_counter() - start, error=payload)
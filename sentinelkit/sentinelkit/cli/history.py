@@ -0,0 +1,187 @@
+"""Append-only selfcheck timing history and duration regression detection."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from sentinelkit.utils import stats
+
+from .executor import CheckResult
+
+__all__ = [
+    "DEFAULT_PERCENTILE",
+    "DEFAULT_WINDOW",
+    "HISTORY_ENV",
+    "HISTORY_PATH",
+    "CheckTiming",
+    "SelfcheckHistory",
+]
+
+HISTORY_PATH = Path(".sentinel/status/selfcheck-history.jsonl")
+# Overrides HISTORY_PATH, e.g. so test suites never append to the real history.
+HISTORY_ENV = "SENTINEL_SELFCHECK_HISTORY"
+DEFAULT_WINDOW = 50
+DEFAULT_PERCENTILE = 95.0
+# Fewer earlier runs than this are not enough to call a run slow.
+MIN_SAMPLES = 5
+# Ignore regressions smaller than this; sub-second checks jitter by a few ms.
+MIN_REGRESSION_SECONDS = 0.05
+TAIL_CHUNK = 64 * 1024
+TIMED_STATUSES = frozenset({"ok", "fail"})
+
+
+@dataclass(slots=True, frozen=True)
+class CheckTiming:
+    """Duration statistics for one check over the recent history window.
+
+    ``threshold`` is the configured percentile of the runs *before* the latest
+    one; ``regressed`` is set when the latest duration exceeds it.
+    """
+
+    name: str
+    samples: int
+    p50: float
+    p95: float
+    last: float | None
+    threshold: float | None
+    regressed: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "samples": self.samples,
+            "p50": round(self.p50, 4),
+            "p95": round(self.p95, 4),
+            "last": None if self.last is None else round(self.last, 4),
+            "threshold": None if self.threshold is None else round(self.threshold, 4),
+            "regressed": self.regressed,
+        }
+
+
+class SelfcheckHistory:
+    """One JSON line per selfcheck run, appended and never rewritten.
+
+    Only the tail of the file is read back, so lookups stay cheap however long
+    the history grows. Pending checks are recorded but do not count towards the
+    percentiles because their near-zero durations say nothing about speed.
+    Without an explicit *path* the location comes from ``$SENTINEL_SELFCHECK_HISTORY``
+    or defaults to ``HISTORY_PATH``; relative paths resolve against *root*.
+    """
+
+    def __init__(self, root: Path | str, *, path: Path | str | None = None) -> None:
+        self.root = Path(root)
+        if path is None:
+            path = os.environ.get(HISTORY_ENV) or HISTORY_PATH
+        candidate = Path(path)
+        self.path = candidate if candidate.is_absolute() else self.root / candidate
+
+    def append(self, results: Sequence[CheckResult], *, ok: bool, now: datetime | None = None) -> None:
+        """Record the durations from one run."""
+        stamp = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        record = {
+            "timestamp": stamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "ok": ok,
+            "checks": {
+                result.name: {"status": result.status, "duration": round(result.duration, 4)}
+                for result in results
+            },
+        }
+        line = json.dumps(record, separators=(",", ":"), sort_keys=True) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A single O_APPEND write keeps concurrent runs from interleaving lines.
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def runs(self, limit: int) -> list[dict[str, Any]]:
+        """Return up to *limit* most recent runs, oldest first."""
+        records: list[dict[str, Any]] = []
+        # One spare line covers a torn record left by an interrupted write.
+        for raw in _tail_lines(self.path, limit + 1):
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("checks"), dict):
+                records.append(record)
+        return records[-limit:] if limit > 0 else []
+
+    def timings(
+        self,
+        *,
+        window: int = DEFAULT_WINDOW,
+        percentile: float = DEFAULT_PERCENTILE,
+    ) -> dict[str, CheckTiming]:
+        """Summarize the last *window* runs per check, sorted by name."""
+        runs = self.runs(window)
+        if not runs:
+            return {}
+        latest = runs[-1]["checks"]
+        durations: dict[str, list[float]] = {}
+        for run in runs:
+            for name, entry in run["checks"].items():
+                duration = _timed_duration(entry)
+                if duration is not None:
+                    durations.setdefault(name, []).append(duration)
+
+        timings: dict[str, CheckTiming] = {}
+        for name in sorted(durations):
+            values = durations[name]
+            last = _timed_duration(latest.get(name))
+            baseline = values[:-1] if last is not None else values
+            threshold = stats.percentile(baseline, percentile) if len(baseline) >= MIN_SAMPLES else None
+            regressed = (
+                last is not None
+                and threshold is not None
+                and last > threshold
+                and last - threshold >= MIN_REGRESSION_SECONDS
+            )
+            timings[name] = CheckTiming(
+                name=name,
+                samples=len(values),
+                p50=stats.percentile(values, 50.0),
+                p95=stats.percentile(values, 95.0),
+                last=last,
+                threshold=threshold,
+                regressed=regressed,
+            )
+        return timings
+
+
+def _timed_duration(entry: object) -> float | None:
+    if not isinstance(entry, dict) or entry.get("status") not in TIMED_STATUSES:
+        return None
+    duration = entry.get("duration")
+    if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+        return None
+    return float(duration)
+
+
+def _tail_lines(path: Path, count: int) -> list[bytes]:
+    """Return the last *count* non-empty lines of *path* without reading all of it."""
+    if count <= 0:
+        return []
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with handle:
+        position = handle.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(TAIL_CHUNK, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if position > 0:
+        # The first line may be cut mid-record by the chunk boundary.
+        lines = lines[1:]
+    return lines[-count:]
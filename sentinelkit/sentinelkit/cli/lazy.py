@@ -0,0 +1,59 @@
+"""Typer group that imports subcommand modules only when they are invoked."""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import ClassVar, Mapping
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+__all__ = ["LazyCommand", "LazyGroup"]
+
+
+@dataclass(slots=True, frozen=True)
+class LazyCommand:
+    """Where to find a subcommand: a ``typer.Typer`` app or a plain command function.
+
+    ``help`` is only used for functions; Typer apps carry their own help text.
+    """
+
+    module: str
+    attribute: str = "app"
+    help: str | None = None
+
+
+class LazyGroup(TyperGroup):
+    """Resolve ``lazy_commands`` on first lookup instead of at import time.
+
+    Running ``sentinel decisions append`` then imports the decisions module
+    alone, not pytest, jinja2 or jsonschema for commands that never run.
+    Subclasses set ``lazy_commands``; listing every command (``--help``) still
+    imports them all.
+    """
+
+    lazy_commands: ClassVar[Mapping[str, LazyCommand]] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        eager = super().list_commands(ctx)
+        return [*eager, *(name for name in self.lazy_commands if name not in eager)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | TyperGroup | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = _load(cmd_name, self.lazy_commands[cmd_name])
+            self.add_command(command, cmd_name)
+        return command
+
+
+def _load(name: str, spec: LazyCommand) -> TyperCommand | TyperGroup:
+    target = getattr(importlib.import_module(spec.module), spec.attribute)
+    if isinstance(target, typer.Typer):
+        command: TyperCommand | TyperGroup = typer.main.get_group(target)
+    else:
+        wrapper = typer.Typer()
+        wrapper.command(name, help=spec.help)(target)
+        command = typer.main.get_command(wrapper)
+    command.name = name
+    return command
@@ -7,17 +7,32 @@ from typing import Annotated
 
 import typer
 
-from sentinelkit import capsule as _capsule_pkg  # noqa: F401
-from sentinelkit import contracts as _contracts_pkg  # noqa: F401
-from sentinelkit import context as _context_pkg  # noqa: F401
-from sentinelkit import prompt as _prompt_pkg  # noqa: F401
-from sentinelkit import scripts as _scripts_pkg  # noqa: F401
-from sentinelkit import utils as _utils_pkg  # noqa: F401
-
-from . import agents, capsule, context, contracts, decisions, mcp, prompts, runbook, selfcheck, sentinels, snippets
+from .lazy import LazyCommand, LazyGroup
 from .state import OutputFormat, set_context
 
-app = typer.Typer(help="SentinelKit CLI (scaffold)")
+# Subcommands in help order. Each module is imported only when its command runs,
+# so a quick `sentinel decisions ...` does not pay for pytest, jinja2 or jsonschema.
+LAZY_COMMANDS: dict[str, LazyCommand] = {
+    "selfcheck": LazyCommand("sentinelkit.cli.selfcheck", "run", help="Run SentinelKit diagnostics."),
+    "contracts": LazyCommand("sentinelkit.cli.contracts"),
+    "context": LazyCommand("sentinelkit.cli.context"),
+    "capsule": LazyCommand("sentinelkit.cli.capsule"),
+    "prompts": LazyCommand("sentinelkit.cli.prompts"),
+    "sentinels": LazyCommand("sentinelkit.cli.sentinels"),
+    "decisions": LazyCommand("sentinelkit.cli.decisions"),
+    "runbook": LazyCommand("sentinelkit.cli.runbook"),
+    "mcp": LazyCommand("sentinelkit.cli.mcp"),
+    "snippets": LazyCommand("sentinelkit.cli.snippets"),
+    "agents": LazyCommand("sentinelkit.cli.agents"),
+    "daemon": LazyCommand("sentinelkit.cli.daemon"),
+}
+
+
+class _SentinelGroup(LazyGroup):
+    lazy_commands = LAZY_COMMANDS
+
+
+app = typer.Typer(help="SentinelKit CLI (scaffold)", cls=_SentinelGroup)
 
 
 @app.callback()
@@ -46,19 +61,6 @@ def root_callback(
     set_context(ctx, root=root.resolve(), output=output_format)
 
 
-app.command("selfcheck", help="Run SentinelKit diagnostics.")(selfcheck.run)
-app.add_typer(contracts.app, name="contracts")
-app.add_typer(context.app, name="context")
-app.add_typer(capsule.app, name="capsule")
-app.add_typer(prompts.app, name="prompts")
-app.add_typer(sentinels.app, name="sentinels")
-app.add_typer(decisions.app, name="decisions")
-app.add_typer(runbook.app, name="runbook")
-app.add_typer(mcp.app, name="mcp")
-app.add_typer(snippets.app, name="snippets")
-app.add_typer(agents.app, name="agents")
-
-
 def main() -> None:  # pragma: no cover - Typer handles invocation
     """Invoke the Typer application."""
     app()
@@ -3,24 +3,38 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from sentinelkit.utils.errors import SentinelKitError, serialize_error
+
 from ..state import get_context
 from . import server
-from .smoke import DEFAULT_TIMEOUTS, SmokeTimeouts, run_smoke
+from .bench import BenchConfig, BenchReport, run_bench
+from .smoke import DEFAULT_TIMEOUTS, SmokeProfile, SmokeTimeouts, run_smoke
 
 app = typer.Typer(help="SentinelKit MCP utilities.")
 
 
-@app.command("server", help="Launch the MCP stdio server.")
-def launch(ctx: typer.Context) -> None:
+@app.command("server", help="Launch the MCP server on stdio or a Unix socket.")
+def launch(
+    ctx: typer.Context,
+    socket: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help=f"Listen on this Unix socket instead of stdio (conventionally {server.DEFAULT_SOCKET}).",
+        ),
+    ] = None,
+) -> None:
     """Start the asyncio MCP server rooted at the provided repository path."""
     context = get_context(ctx)
-    server.serve(root=context.root)
+    server.serve(root=context.root, socket_path=_resolve(context.root, socket))
 
 
 @app.command("smoke", help="Run initialize/list/call smoke tests against the MCP server.")
@@ -47,6 +61,21 @@ def smoke(
             help="Seconds to wait for each tools/call invocation.",
         ),
     ] = DEFAULT_TIMEOUTS.tools_call,
+    connect: Annotated[
+        Path | None,
+        typer.Option(
+            "--connect",
+            help="Smoke an already running `mcp server --socket` instead of spawning one.",
+        ),
+    ] = None,
+    profile: Annotated[
+        SmokeProfile,
+        typer.Option(
+            "--profile",
+            case_sensitive=False,
+            help="'light' skips sentinel_run (the full sentinel suite); 'full' calls every tool.",
+        ),
+    ] = "full",
 ) -> None:
     """Execute a deterministic initialize → tools/list → tools/call sequence."""
 
@@ -58,6 +87,8 @@ def smoke(
             tools_list=timeout_list,
             tools_call=timeout_call,
         ),
+        connect=_resolve(context.root, connect),
+        profile=profile,
     )
 
     if context.format == "json":
@@ -75,6 +106,112 @@ def smoke(
         raise typer.Exit(1)
 
 
+@app.command("bench", help="Load-test the MCP server with concurrent and pipelined clients.")
+def bench(
+    ctx: typer.Context,
+    clients: Annotated[int, typer.Option("--clients", "-n", min=1, help="Concurrent client connections.")] = 4,
+    pipeline: Annotated[
+        int,
+        typer.Option("--pipeline", "-m", min=1, help="Requests each client keeps in flight."),
+    ] = 1,
+    requests: Annotated[int, typer.Option("--requests", min=1, help="Requests sent by each client.")] = 100,
+    operation: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--op",
+            help=(
+                "Operation to include: ping, tools/list, or a tool name "
+                "(repeatable; defaults to all but sentinel_run)."
+            ),
+        ),
+    ] = None,
+    connect: Annotated[
+        Path | None,
+        typer.Option(
+            "--connect",
+            help="Share one running `mcp server --socket` instead of spawning a server per client.",
+        ),
+    ] = None,
+    timeout: Annotated[float, typer.Option("--timeout", help="Seconds to wait for any single response.")] = 30.0,
+) -> None:
+    """Report throughput and latency percentiles/histograms per operation."""
+
+    context = get_context(ctx)
+    config = BenchConfig(
+        clients=clients,
+        pipeline=pipeline,
+        requests=requests,
+        operations=tuple(operation or ()),
+        connect=_resolve(context.root, connect),
+        timeout=timeout,
+    )
+    try:
+        report = run_bench(context.root, config)
+    except SentinelKitError as error:
+        payload = serialize_error(error)
+        if context.format == "json":
+            typer.echo(json.dumps({"ok": False, "error": payload}, indent=2))
+        else:
+            typer.secho(f"Error: {payload.get('message')}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1) from error
+
+    if context.format == "json":
+        typer.echo(json.dumps(report.to_dict(), indent=2))
+    else:
+        console = Console()
+        console.print(_build_bench_table(report))
+        for failure in report.failures:
+            console.print(f"[red]{failure}[/red]")
+        status = "[bold green]MCP bench passed[/bold green]" if report.ok else "[bold red]MCP bench failed[/bold red]"
+        console.print(status)
+
+    if not report.ok:
+        raise typer.Exit(1)
+
+
+def _build_bench_table(report: BenchReport) -> Table:
+    data = report.to_dict()
+    table = Table(
+        title=(
+            f"MCP bench: {data['clients']} client(s) x pipeline {data['pipeline']}, "
+            f"{data['total']} requests in {data['wall']:.2f}s ({data['throughput']:.0f} req/s)"
+        )
+    )
+    table.add_column("Operation")
+    table.add_column("Count", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Timeouts", justify="right")
+    table.add_column("req/s", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Histogram (≤ms: count)")
+    for entry in data["operations"]:
+        latency = entry["latency_ms"]
+        histogram = ", ".join(
+            f"{'∞' if bucket['le_ms'] is None else format(bucket['le_ms'], 'g')}: {bucket['count']}"
+            for bucket in entry["histogram"]
+        )
+        table.add_row(
+            escape(entry["name"]),
+            str(entry["count"]),
+            str(entry["errors"]),
+            str(entry["timeouts"]),
+            f"{entry['throughput']:.0f}",
+            f"{latency['p50']:.2f}",
+            f"{latency['p95']:.2f}",
+            f"{latency['p99']:.2f}",
+            histogram or "-",
+        )
+    return table
+
+
+def _resolve(root: Path, path: Path | None) -> Path | None:
+    if path is None or path.is_absolute():
+        return path
+    return root / path
+
+
 def _build_summary_table(summary) -> Table:
     table = Table(title="MCP smoke")
     table.add_column("Step")
@@ -0,0 +1,341 @@
+"""Load generator for the MCP server: concurrent clients and pipelined requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from sentinelkit.utils.errors import SentinelKitError, build_error_payload
+from sentinelkit.utils.stats import percentile
+
+from .client import (
+    JsonRpcClient,
+    graceful_shutdown,
+    server_command,
+    server_env,
+    socket_command,
+    wait_for_process,
+)
+from .smoke import HEAVY_TOOLS, Command
+
+__all__ = ["BenchConfig", "BenchReport", "OperationStats", "run_bench"]
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0, 5000.0)
+# Tool responses (contract reports, mounted context) can be far larger than asyncio's 64 KiB line limit.
+STREAM_LIMIT = 16 * 1024 * 1024
+BASE_OPERATIONS = ("ping", "tools/list")
+BENCH_ARGUMENTS: dict[str, Mapping[str, Any]] = {
+    "sentinel_decision_log": {
+        "author": "MCP_BENCH",
+        "scope": [".sentinel/docs/IMPLEMENTATION.md"],
+        "decision": "MCP bench request",
+        "rationale": "Measure decision_log latency without touching the ledger.",
+        "outputs": [".sentinel/docs/IMPLEMENTATION.md"],
+        "dry_run": True,
+    },
+    "sentinel_decision_query": {"limit": 5},
+    "sentinel_context_mount": {"entries": [".sentinel/contracts"], "max_lines": 200},
+}
+
+
+@dataclass(slots=True)
+class BenchConfig:
+    """Load shape for one bench run.
+
+    Each of ``clients`` connections sends ``requests`` requests, keeping up to
+    ``pipeline`` of them in flight. ``operations`` lists ``ping``,
+    ``tools/list`` and tool names; when empty, every advertised tool except the
+    heavy ones is benchmarked.
+    """
+
+    clients: int = 4
+    pipeline: int = 1
+    requests: int = 100
+    operations: tuple[str, ...] = ()
+    connect: Path | None = None
+    timeout: float = 30.0
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Latencies (seconds) plus error and timeout counts for one operation.
+
+    A timed-out request still contributes its latency (the time waited), so
+    saturation shows up in the percentiles as well as in ``timeouts``.
+    """
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    timeouts: int = 0
+
+    def to_dict(self, wall: float) -> dict[str, Any]:
+        values = self.latencies
+        return {
+            "name": self.name,
+            "count": len(values),
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "throughput": round(len(values) / wall, 2) if wall > 0 else 0.0,
+            "latency_ms": {
+                "p50": _ms(percentile(values, 50.0)),
+                "p95": _ms(percentile(values, 95.0)),
+                "p99": _ms(percentile(values, 99.0)),
+                "max": _ms(max(values, default=0.0)),
+            },
+            "histogram": _histogram(values),
+        }
+
+
+@dataclass(slots=True)
+class BenchReport:
+    """Aggregate bench output."""
+
+    command: Command
+    config: BenchConfig
+    wall: float = 0.0
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(len(stats.latencies) for stats in self.operations.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.operations.values())
+
+    @property
+    def timeouts(self) -> int:
+        return sum(stats.timeouts for stats in self.operations.values())
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures and self.errors == 0 and self.timeouts == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "command": list(self.command),
+            "clients": self.config.clients,
+            "pipeline": self.config.pipeline,
+            "requests_per_client": self.config.requests,
+            "wall": round(self.wall, 4),
+            "total": self.total,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "throughput": round(self.total / self.wall, 2) if self.wall > 0 else 0.0,
+            "operations": [stats.to_dict(self.wall) for stats in self.operations.values()],
+            "failures": list(self.failures),
+        }
+
+
+def run_bench(root: Path, config: BenchConfig | None = None) -> BenchReport:
+    """Drive the MCP server with concurrent, optionally pipelined, clients.
+
+    Without ``config.connect`` every client spawns its own stdio server, which
+    measures per-process cost; with it all clients share the server listening on
+    that socket, which is how many IDE agents would load one warm server.
+    """
+
+    config = config or BenchConfig()
+    if config.clients < 1 or config.pipeline < 1 or config.requests < 1:
+        raise SentinelKitError(
+            build_error_payload(
+                code="mcp.bench_invalid_config",
+                message="--clients, --pipeline and --requests must all be at least 1.",
+            )
+        )
+    return asyncio.run(_run_bench(Path(root).resolve(), config))
+
+
+@dataclass(slots=True)
+class _Connection:
+    client: JsonRpcClient
+    process: asyncio.subprocess.Process | None = None
+    writer: asyncio.StreamWriter | None = None
+
+
+async def _run_bench(root: Path, config: BenchConfig) -> BenchReport:
+    command = socket_command(config.connect) if config.connect is not None else server_command()
+    report = BenchReport(command=command, config=config)
+    connections: list[_Connection] = []
+    try:
+        opened = await asyncio.gather(
+            *(_open(root, config) for _ in range(config.clients)), return_exceptions=True
+        )
+        for outcome in opened:
+            if isinstance(outcome, BaseException):
+                report.failures.append(f"connect: {_describe(outcome)}")
+            else:
+                connections.append(outcome)
+        if report.failures:
+            return report
+
+        handshakes = await asyncio.gather(
+            *(_handshake(connection.client, config.timeout) for connection in connections),
+            return_exceptions=True,
+        )
+        report.failures.extend(
+            f"client {index}: initialize: {_describe(outcome)}"
+            for index, outcome in enumerate(handshakes)
+            if isinstance(outcome, BaseException)
+        )
+        if report.failures:
+            return report
+        operations = _resolve_operations(config.operations, handshakes[0])
+        report.operations = {operation: OperationStats(operation) for operation in operations}
+
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(
+                _drive(connection.client, _schedule(operations, config.requests, offset=index), config, report)
+                for index, connection in enumerate(connections)
+            ),
+            return_exceptions=True,
+        )
+        report.wall = time.perf_counter() - start
+        report.failures.extend(
+            f"client {index}: {_describe(outcome)}"
+            for index, outcome in enumerate(outcomes)
+            if isinstance(outcome, BaseException)
+        )
+        return report
+    finally:
+        await asyncio.gather(*(_close(connection) for connection in connections))
+
+
+async def _open(root: Path, config: BenchConfig) -> _Connection:
+    if config.connect is not None:
+        reader, writer = await asyncio.open_unix_connection(str(config.connect), limit=STREAM_LIMIT)
+        return _Connection(JsonRpcClient(reader, writer, trace=False), writer=writer)
+    process = await asyncio.create_subprocess_exec(
+        *server_command(),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        # The server traces every message to stderr; an undrained pipe would stall it.
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=str(root),
+        env=server_env(root),
+        limit=STREAM_LIMIT,
+    )
+    if process.stdin is None or process.stdout is None:
+        raise RuntimeError("MCP server must expose stdin/stdout pipes.")
+    return _Connection(JsonRpcClient(process.stdout, process.stdin, trace=False), process=process)
+
+
+async def _handshake(client: JsonRpcClient, timeout: float) -> set[str]:
+    await asyncio.wait_for(client.request("initialize"), timeout=timeout)
+    await client.notify("notifications/initialized")
+    listing = await asyncio.wait_for(client.request("tools/list"), timeout=timeout)
+    return {tool["name"] for tool in (listing or {}).get("tools", [])}
+
+
+async def _close(connection: _Connection) -> None:
+    await graceful_shutdown(connection.client)
+    if connection.process is not None:
+        await wait_for_process(connection.process)
+    if connection.writer is not None:
+        connection.writer.close()
+        try:
+            await connection.writer.wait_closed()
+        except OSError:
+            pass
+
+
+def _resolve_operations(requested: Sequence[str], advertised: set[str]) -> list[str]:
+    if not requested:
+        tools = sorted(advertised - HEAVY_TOOLS)
+        return [*BASE_OPERATIONS, *(f"tools/call[{tool}]" for tool in tools)]
+    operations: list[str] = []
+    unknown: list[str] = []
+    for name in dict.fromkeys(requested):
+        if name in BASE_OPERATIONS:
+            operations.append(name)
+        elif name in advertised:
+            operations.append(f"tools/call[{name}]")
+        else:
+            unknown.append(name)
+    if unknown:
+        raise SentinelKitError(
+            build_error_payload(
+                code="mcp.bench_unknown_operation",
+                message=f"Unknown bench operation(s): {', '.join(unknown)}.",
+                remediation=f"Use {' or '.join(BASE_OPERATIONS)}, or a tool from: {', '.join(sorted(advertised))}.",
+            )
+        )
+    return operations
+
+
+def _schedule(operations: Sequence[str], count: int, *, offset: int) -> list[str]:
+    """Round-robin over *operations*, shifted per client so clients mix operations."""
+    return [operations[(offset + index) % len(operations)] for index in range(count)]
+
+
+def _request(operation: str) -> tuple[str, Mapping[str, Any] | None]:
+    if operation in BASE_OPERATIONS:
+        return operation, None
+    tool = operation[len("tools/call[") : -1]
+    return "tools/call", {"name": tool, "arguments": dict(BENCH_ARGUMENTS.get(tool, {}))}
+
+
+async def _drive(client: JsonRpcClient, schedule: Sequence[str], config: BenchConfig, report: BenchReport) -> None:
+    """Send *schedule* keeping up to ``config.pipeline`` requests in flight.
+
+    The client matches responses to requests by id, so they may complete in
+    any order.
+    """
+
+    window = asyncio.Semaphore(config.pipeline)
+
+    async def send(operation: str) -> None:
+        async with window:
+            stats = report.operations[operation]
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(client.request(*_request(operation)), timeout=config.timeout)
+            except TimeoutError:
+                # Counted, not raised: a timeout must not cancel the client's other requests.
+                result = None
+                stats.timeouts += 1
+            except RuntimeError:
+                # JSON-RPC error response (or a dropped connection, which fails every later request too).
+                result = None
+                stats.errors += 1
+            stats.latencies.append(time.perf_counter() - start)
+            if isinstance(result, Mapping) and result.get("isError"):
+                stats.errors += 1
+
+    async with asyncio.TaskGroup() as group:
+        for operation in schedule:
+            group.create_task(send(operation))
+
+
+def _histogram(latencies: Sequence[float]) -> list[dict[str, Any]]:
+    counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for latency in latencies:
+        milliseconds = latency * 1000.0
+        index = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= bound), len(LATENCY_BUCKETS_MS)
+        )
+        counts[index] += 1
+    buckets: list[dict[str, Any]] = []
+    for index, count in enumerate(counts):
+        if count:
+            bound = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else None
+            buckets.append({"le_ms": bound, "count": count})
+    return buckets
+
+
+def _describe(error: BaseException) -> str:
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return str(error) or type(error).__name__
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
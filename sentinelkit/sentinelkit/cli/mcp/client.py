@@ -0,0 +1,222 @@
+"""JSON-RPC client and server-spawning helpers shared by MCP smoke and bench."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+__all__ = [
+    "JsonRpcClient",
+    "NotificationHandler",
+    "graceful_shutdown",
+    "server_command",
+    "server_env",
+    "socket_command",
+    "wait_for_process",
+]
+
+NotificationHandler = Callable[[Mapping[str, Any]], None]
+
+
+class JsonRpcClient:
+    """JSON-RPC client over a stream pair (subprocess pipes or a socket).
+
+    A background reader task hands each response to the request with the same
+    ``id``, so any number of requests may be outstanding and responses may
+    arrive in any order. Notifications go to handlers registered with
+    :meth:`on_notification`; requests initiated by the server are answered
+    with "method not found".
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *, trace: bool = True) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._trace = trace
+        self._pending: dict[int, asyncio.Future[Mapping[str, Any]]] = {}
+        self._handlers: dict[str, NotificationHandler] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+        self._closed_reason: str | None = None
+
+    def on_notification(self, method: str, handler: NotificationHandler) -> None:
+        self._handlers[method] = handler
+
+    async def request(self, method: str, params: Mapping[str, Any] | None = None) -> Any:
+        if self._closed_reason is not None:
+            raise RuntimeError(self._closed_reason)
+        self._ensure_reader()
+        payload = self._build_payload(method, params)
+        request_id = payload["id"]
+        future: asyncio.Future[Mapping[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._write(payload)
+            message = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if "error" in message:
+            error = message["error"]
+            raise RuntimeError(f"{method} failed ({error.get('code')}): {error.get('message')}")
+        return message.get("result")
+
+    async def notify(self, method: str, params: Mapping[str, Any] | None = None) -> None:
+        await self._write(self._build_payload(method, params, include_id=False))
+
+    async def close(self) -> None:
+        """Stop the reader task; requests still outstanding fail."""
+        task, self._reader_task = self._reader_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._fail_pending("MCP client closed.")
+
+    def _ensure_reader(self) -> None:
+        if self._reader_task is None:
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        reason = "MCP server closed the connection unexpectedly."
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                try:
+                    message = self._decode(line)
+                except RuntimeError as exc:
+                    # An unparseable line cannot be matched to a request; fail them all.
+                    self._fail_pending(str(exc))
+                    continue
+                await self._dispatch(message)
+        except (ConnectionError, ValueError) as exc:
+            # ValueError: a single line longer than the stream limit.
+            reason = f"MCP connection failed: {exc}"
+        self._closed_reason = reason
+        self._fail_pending(reason)
+
+    async def _dispatch(self, message: Mapping[str, Any]) -> None:
+        request_id = message.get("id")
+        method = message.get("method")
+        if isinstance(method, str):
+            if request_id is not None:
+                await self._write(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "error": {"code": -32601, "message": f"Client does not handle '{method}'."},
+                    }
+                )
+                return
+            handler = self._handlers.get(method)
+            if handler is not None:
+                try:
+                    handler(message.get("params") or {})
+                except Exception as exc:  # pragma: no cover - defensive
+                    print(f"[MCP SMOKE] notification handler for {method} failed: {exc}", file=sys.stderr, flush=True)
+            return
+        future = self._pending.get(request_id) if isinstance(request_id, int) else None
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def _fail_pending(self, reason: str) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+
+    def _build_payload(
+        self,
+        method: str,
+        params: Mapping[str, Any] | None,
+        *,
+        include_id: bool = True,
+    ) -> dict[str, Any]:
+        message: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "method": method,
+        }
+        if include_id:
+            self._next_id += 1
+            message["id"] = self._next_id
+        if params is not None:
+            message["params"] = params
+        return message
+
+    async def _write(self, payload: Mapping[str, Any]) -> None:
+        message_str = json.dumps(payload, separators=(",", ":"))
+        if self._trace:
+            print(f"[MCP SMOKE WRITE] {message_str}", file=sys.stderr, flush=True)
+        encoded = (message_str + "\n").encode("utf-8")
+        self._writer.write(encoded)
+        await self._writer.drain()
+
+    def _decode(self, line: bytes) -> Mapping[str, Any]:
+        try:
+            decoded = line.decode("utf-8").rstrip("\r\n")
+            if self._trace:
+                print(f"[MCP SMOKE READ RAW] {decoded}", file=sys.stderr, flush=True)
+            message = json.loads(decoded)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise RuntimeError(f"Invalid MCP response payload: {exc}") from exc
+        if not isinstance(message, dict):
+            raise RuntimeError("Invalid MCP response payload: expected a JSON object.")
+        return message
+
+
+async def graceful_shutdown(client: JsonRpcClient) -> None:
+    """Send ``shutdown``/``exit`` (best effort) and stop the client's reader."""
+    try:
+        await asyncio.wait_for(client.request("shutdown"), timeout=2.0)
+    except Exception:
+        pass
+    try:
+        await asyncio.wait_for(client.notify("exit"), timeout=1.0)
+    except Exception:
+        pass
+    await client.close()
+
+
+async def wait_for_process(process: asyncio.subprocess.Process) -> None:
+    """Close the server's stdin and reap it, killing it after three seconds."""
+    if process.stdin:
+        process.stdin.close()
+        try:
+            await process.stdin.wait_closed()
+        except Exception:
+            pass
+    if process.returncode is not None:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), timeout=3.0)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+
+
+def server_command() -> list[str]:
+    """Command that spawns a stdio MCP server with this interpreter."""
+    return [sys.executable, "-m", "sentinelkit.cli.mcp.server"]
+
+
+def socket_command(socket_path: Path) -> list[str]:
+    """Pseudo-command recorded in reports for a server reached over *socket_path*."""
+    return [f"unix:{socket_path}"]
+
+
+def server_env(root: Path) -> dict[str, str]:
+    """Environment for a spawned server: *root* and this checkout on ``PYTHONPATH``."""
+    env = os.environ.copy()
+    env.setdefault("PYTHONWARNINGS", "ignore::RuntimeWarning:runpy")
+    sentinelkit_repo_root = Path(__file__).resolve().parents[3]
+    python_path_entries = [str(root), str(sentinelkit_repo_root)]
+    existing_pythonpath = env.get("PYTHONPATH")
+    if existing_pythonpath:
+        python_path_entries.append(existing_pythonpath)
+    env["PYTHONPATH"] = os.pathsep.join(python_path_entries)
+    return env
@@ -1,4 +1,4 @@
-"""Asyncio-based MCP stdio server exposing Sentinel tools."""
+"""Asyncio-based MCP server (stdio or Unix socket) exposing Sentinel tools."""
 
 from __future__ import annotations
 
@@ -13,18 +13,20 @@ from typing import Any, Awaitable, BinaryIO, Callable, Dict, Mapping, Sequence
 
 from sentinelkit import get_version
 from sentinelkit.cli.decision_log import DecisionLedger, DecisionLedgerError, DecisionPayload
-from sentinelkit.cli.sentinels import run_sentinel_pytest
+from sentinelkit.cli.sentinels import sentinel_pytest_args, sentinel_pytest_command
+from sentinelkit.context.mount import ContextMount
 from sentinelkit.contracts.api import ContractValidator
 from sentinelkit.contracts.loader import ContractLoader
-from sentinelkit.utils.errors import SentinelKitError, serialize_error
+from sentinelkit.utils.errors import SentinelKitError, build_error_payload, serialize_error
 
-__all__ = ["SentinelMCPServer", "serve"]
+__all__ = ["DEFAULT_SOCKET", "SentinelMCPServer", "serve", "serve_socket"]
 
 logger = logging.getLogger(__name__)
 
 JSONRPC_VERSION = "2.0"
 PROTOCOL_VERSION = "2024-11-01"
 SERVER_NAME = "sentinel-mcp"
+DEFAULT_SOCKET = Path(".sentinel/cache/mcp.sock")
 
 PARSE_ERROR = -32700
 INVALID_REQUEST = -32600
@@ -164,6 +166,57 @@ class SentinelMCPServer:
                 },
                 handler=self._handle_decision_log,
             ),
+            "sentinel_decision_query": ToolSpec(
+                name="sentinel_decision_query",
+                description="Look up DECISIONS.md entries by id, output path, text, or Supersedes chain.",
+                input_schema={
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string", "description": "Decision id (e.g., D-0042)."},
+                        "path": {
+                            "type": "string",
+                            "description": "Output path or directory touched by the decision.",
+                        },
+                        "text": {
+                            "type": "string",
+                            "description": "Case-insensitive text matched against decision, rationale, and scope.",
+                        },
+                        "author": {"type": "string"},
+                        "chain": {
+                            "type": "boolean",
+                            "description": (
+                                "Return every entry linked to 'id' through Supersedes (including siblings) "
+                                "instead of a single entry."
+                            ),
+                        },
+                        "limit": {"type": "integer", "minimum": 0},
+                    },
+                    "additionalProperties": False,
+                },
+                handler=self._handle_decision_query,
+            ),
+            "sentinel_context_mount": ToolSpec(
+                name="sentinel_context_mount",
+                description="Return the contents of a capsule's Allowed Context, deduplicated and within a budget.",
+                input_schema={
+                    "type": "object",
+                    "properties": {
+                        "capsule": {
+                            "type": "string",
+                            "description": "Capsule markdown whose Allowed Context section should be mounted.",
+                        },
+                        "entries": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Explicit Allowed Context entries (used when 'capsule' is omitted).",
+                        },
+                        "max_lines": {"type": "integer", "minimum": 1},
+                        "max_tokens": {"type": "integer", "minimum": 1},
+                    },
+                    "additionalProperties": False,
+                },
+                handler=self._handle_context_mount,
+            ),
         }
 
     @property
@@ -239,7 +292,9 @@ class SentinelMCPServer:
         if asyncio.iscoroutinefunction(handler):
             response: ToolResponse = await handler(arguments)
         else:
-            response = handler(arguments)  # type: ignore[assignment]
+            # Sync handlers block on disk and parsing; a worker thread keeps the
+            # loop free for the server's other connections meanwhile.
+            response = await asyncio.to_thread(handler, arguments)  # type: ignore[arg-type]
         return response.to_call_result()
 
     def _handle_initialize(self) -> Mapping[str, Any]:
@@ -264,18 +319,32 @@ class SentinelMCPServer:
         summary = {"ok": all(result.ok for result in results), "results": [result.to_dict() for result in results]}
         return ToolResponse.from_json(summary, is_error=not summary["ok"])
 
-    def _handle_sentinel_run(self, arguments: Mapping[str, Any]) -> ToolResponse:
+    async def _handle_sentinel_run(self, arguments: Mapping[str, Any]) -> ToolResponse:
         marker = self._optional_string(arguments.get("marker"))
-        exit_code, summary = run_sentinel_pytest(
-            root=self.root,
-            marker=marker,
-            junit=None,
-            json_report=None,
-            quiet=True,
+        # pytest changes directory and imports test modules; a child process keeps
+        # that away from the shared server and its other connections.
+        command, env = sentinel_pytest_command(self.root, marker=marker)
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=self.root,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        summary = dict(summary)
-        summary["exit_code"] = int(exit_code)
-        summary["marker"] = marker
+        try:
+            exit_code = await process.wait()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        summary = {
+            "ok": exit_code == 0,
+            "root": str(self.root),
+            "args": sentinel_pytest_args(marker=marker),
+            "exit_code": exit_code,
+            "marker": marker,
+        }
         return ToolResponse.from_json(summary, is_error=exit_code != 0)
 
     def _handle_decision_log(self, arguments: Mapping[str, Any]) -> ToolResponse:
@@ -318,6 +387,51 @@ class SentinelMCPServer:
             payload = serialize_error(error)
             return ToolResponse.from_json({"ok": False, "error": payload}, is_error=True)
 
+    def _handle_decision_query(self, arguments: Mapping[str, Any]) -> ToolResponse:
+        decision_id = self._optional_string(arguments.get("id"))
+        limit = arguments.get("limit")
+        if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool)):
+            raise JsonRpcError(INVALID_PARAMS, "'limit' must be an integer.")
+        ledger = DecisionLedger(self._ledger_path)
+        try:
+            if arguments.get("chain"):
+                if decision_id is None:
+                    raise JsonRpcError(INVALID_PARAMS, "'id' is required when 'chain' is true.")
+                entries = ledger.chain(decision_id)
+            else:
+                entries = ledger.query(
+                    decision_id=decision_id,
+                    output=self._optional_string(arguments.get("path")),
+                    text=self._optional_string(arguments.get("text")),
+                    author=self._optional_string(arguments.get("author")),
+                    limit=limit,
+                )
+        except (DecisionLedgerError, SentinelKitError) as error:
+            payload = serialize_error(error)
+            return ToolResponse.from_json({"ok": False, "error": payload}, is_error=True)
+        return ToolResponse.from_json({"ok": True, "decisions": [entry.to_dict() for entry in entries]})
+
+    def _handle_context_mount(self, arguments: Mapping[str, Any]) -> ToolResponse:
+        budgets: dict[str, int | None] = {}
+        for key in ("max_lines", "max_tokens"):
+            value = arguments.get(key)
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+                raise JsonRpcError(INVALID_PARAMS, f"'{key}' must be a positive integer.")
+            budgets[key] = value
+        mount = ContextMount(self.root, max_lines=budgets["max_lines"], max_tokens=budgets["max_tokens"])
+        capsule = self._optional_string(arguments.get("capsule"))
+        try:
+            if capsule:
+                result = mount.mount_capsule(self._resolve_path(capsule))
+            else:
+                result = mount.mount(self._normalize_list(arguments.get("entries"), label="entries"))
+        except SentinelKitError as error:
+            payload = serialize_error(error)
+            return ToolResponse.from_json({"ok": False, "error": payload}, is_error=True)
+        return ToolResponse.from_json(
+            {"ok": not result.errors, "mount": result.to_dict()}, is_error=bool(result.errors)
+        )
+
     @staticmethod
     def _optional_string(value: Any) -> str | None:
         if value is None:
@@ -383,6 +497,7 @@ class _StdioTransport:
     def __init__(self, reader: BinaryIO, writer: BinaryIO) -> None:
         self._reader = reader
         self._writer = writer
+        self._write_lock = asyncio.Lock()
 
     async def read(self) -> Mapping[str, Any] | None:
         """Read a single JSON-RPC message as a newline-delimited JSON object."""
@@ -410,11 +525,49 @@ class _StdioTransport:
         print(f"[MCP SERVER WRITE] {message_str}", file=sys.stderr, flush=True)
         encoded = (message_str + "\n").encode("utf-8")
         loop = asyncio.get_running_loop()
-        try:
-            await loop.run_in_executor(None, self._writer.write, encoded)
-            await loop.run_in_executor(None, self._writer.flush)
-        except BrokenPipeError:  # pragma: no cover - occurs when the client disappears
-            pass
+        async with self._write_lock:
+            try:
+                await loop.run_in_executor(None, self._writer.write, encoded)
+                await loop.run_in_executor(None, self._writer.flush)
+            except BrokenPipeError:  # pragma: no cover - occurs when the client disappears
+                pass
+
+
+async def _serve_messages(server: SentinelMCPServer, transport: _StdioTransport | _StreamTransport) -> None:
+    """Answer requests from *transport* until EOF or ``exit``.
+
+    Each request is answered from its own task, so requests a client pipelines
+    behind a slow tool call are not held up by it; responses go out as they
+    complete and the transport's write lock keeps them from interleaving.
+    Requests still in flight at EOF or ``exit`` are answered before returning.
+    """
+
+    in_flight: set[asyncio.Task[None]] = set()
+
+    async def answer(message: Mapping[str, Any]) -> None:
+        response = await server.handle_message(message)
+        if response:
+            await transport.write(response)
+
+    try:
+        while True:
+            try:
+                message = await transport.read()
+            except JsonRpcError as exc:
+                await transport.write(SentinelMCPServer._error(None, exc))
+                continue
+            if message is None:
+                break
+            if message.get("method") == "exit":
+                await answer(message)
+                break
+            task = asyncio.create_task(answer(message))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+    finally:
+        for task in in_flight:
+            task.cancel()
 
 
 async def _serve_async(
@@ -425,37 +578,154 @@ async def _serve_async(
 ) -> None:
     server = SentinelMCPServer(root=root)
     transport = _StdioTransport(reader or sys.stdin.buffer, writer or sys.stdout.buffer)
-    while True:
+    await _serve_messages(server, transport)
+
+
+class _StreamTransport:
+    """Newline-delimited JSON-RPC over an asyncio stream (one socket connection)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._write_lock = asyncio.Lock()
+
+    async def read(self) -> Mapping[str, Any] | None:
         try:
-            message = await transport.read()
-        except JsonRpcError as exc:
-            error_payload = SentinelMCPServer._error(None, exc)
-            await transport.write(error_payload)
-            continue
-        if message is None:
-            break
+            line = await self._reader.readline()
+        except (ConnectionError, ValueError):
+            # ValueError: a single line longer than the stream limit.
+            return None
+        if not line:
+            return None
+        try:
+            message = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise JsonRpcError(PARSE_ERROR, f"Invalid JSON payload: {exc}") from exc
+        if not isinstance(message, Mapping):
+            raise JsonRpcError(INVALID_REQUEST, "JSON-RPC message must be an object.")
+        return message
+
+    async def write(self, payload: Mapping[str, Any]) -> None:
+        async with self._write_lock:
+            self._writer.write((json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8"))
+            try:
+                await self._writer.drain()
+            except ConnectionError:  # pragma: no cover - client went away mid-response
+                pass
+
+
+async def _serve_connection(
+    server: SentinelMCPServer,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Serve one socket client; ``exit`` closes this connection only."""
+
+    transport = _StreamTransport(reader, writer)
+    try:
+        await _serve_messages(server, transport)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:  # pragma: no cover - peer already gone
+            pass
+
+
+async def serve_socket(
+    socket_path: Path | str,
+    *,
+    root: Path | str | None = None,
+    ready: asyncio.Event | None = None,
+) -> None:
+    """Serve every client that connects to the Unix socket at *socket_path*.
+
+    All connections share one warm :class:`SentinelMCPServer`, so schemas,
+    ledgers and imports are loaded once instead of per client. A socket file
+    left behind by a dead server is replaced; a live one is an error. Runs until
+    cancelled and removes the socket file on the way out.
+    """
+
+    if not hasattr(asyncio, "start_unix_server"):
+        raise SentinelKitError(
+            build_error_payload(
+                code="mcp.socket_unsupported",
+                message="Unix socket transport is not available on this platform.",
+                remediation="Use the stdio server (`sentinel mcp server`) instead.",
+            )
+        )
+    path = Path(socket_path)
+    await _claim_socket_path(path)
+    server = SentinelMCPServer(root=root)
+    connections: set[asyncio.Task[Any]] = set()
+
+    async def connected(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            connections.add(task)
+        try:
+            await _serve_connection(server, reader, writer)
+        finally:
+            connections.discard(task)  # type: ignore[arg-type]
+
+    listener = await asyncio.start_unix_server(connected, path=str(path))
+    path.chmod(0o600)
+    try:
+        async with listener:
+            if ready is not None:
+                ready.set()
+            await listener.serve_forever()
+    finally:
+        path.unlink(missing_ok=True)
+        # Closing the listener leaves accepted connections running; stop them
+        # (and their in-flight requests) before the loop goes away.
+        for task in connections:
+            task.cancel()
+        await asyncio.gather(*connections, return_exceptions=True)
+
+
+async def _claim_socket_path(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    try:
+        _reader, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        path.unlink(missing_ok=True)
+        return
+    writer.close()
+    raise SentinelKitError(
+        build_error_payload(
+            code="mcp.socket_in_use",
+            message=f"An MCP server is already listening on {path}.",
+            remediation="Connect to it with `sentinel mcp smoke --connect`, or stop it first.",
+        )
+    )
 
-        response = await server.handle_message(message)
-        if response:
-            await transport.write(response)
-        if server.should_exit:
-            break
 
+def serve(*, root: Path | str | None = None, socket_path: Path | str | None = None) -> None:
+    """Run the JSON-RPC server until the client terminates.
 
-def serve(*, root: Path | str | None = None) -> None:
-    """Run the JSON-RPC server until the client terminates."""
+    With *socket_path* the server listens on a Unix socket instead of stdio and
+    keeps running across clients until interrupted.
+    """
 
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    main = loop.create_task(
+        serve_socket(socket_path, root=root) if socket_path is not None else _serve_async(root=root)
+    )
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(sig, loop.stop)
+            loop.add_signal_handler(sig, main.cancel)
         except NotImplementedError:  # pragma: no cover - Windows lacks signal handlers for threads
             pass
 
     try:
-        loop.run_until_complete(_serve_async(root=root))
+        loop.run_until_complete(main)
+    except asyncio.CancelledError:
+        pass
     finally:
         pending = asyncio.all_tasks(loop)
         for task in pending:
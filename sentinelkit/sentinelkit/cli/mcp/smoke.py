@@ -1,17 +1,18 @@
-"""Utilities to run MCP smoke tests against the stdio server."""
+"""Utilities to run MCP smoke tests against a spawned or already running server."""
 
 from __future__ import annotations
 
 import asyncio
-import json
-import sys
-import os
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Mapping, Sequence
+from typing import Any, Awaitable, Callable, Dict, Literal, Mapping, Sequence, get_args
+
+from .client import JsonRpcClient, graceful_shutdown, server_command, server_env, socket_command, wait_for_process
 
 Command = Sequence[str]
+SmokeProfile = Literal["full", "light"]
 
 EXPECTED_TOOLS = {
     "sentinel_contract_validate",
@@ -68,45 +69,161 @@ class SmokeSummary:
 
 
 DEFAULT_TIMEOUTS = SmokeTimeouts()
+SMOKE_PROFILES: tuple[str, ...] = get_args(SmokeProfile)
+# Tools the light profile leaves out: sentinel_run executes the whole sentinel pytest suite.
+HEAVY_TOOLS = frozenset({"sentinel_run"})
+# How often a running smoke checks its cancel event.
+CANCEL_POLL_INTERVAL = 0.05
 
 
-def run_smoke(root: Path, *, timeouts: SmokeTimeouts | None = None) -> SmokeSummary:
-    """Entrypoint invoked by the CLI; wraps the async implementation."""
-
+def run_smoke(
+    root: Path,
+    *,
+    timeouts: SmokeTimeouts | None = None,
+    reuse: Mapping[str, Any] | None = None,
+    connect: Path | str | None = None,
+    profile: SmokeProfile = "full",
+    cancel: threading.Event | None = None,
+) -> SmokeSummary:
+    """Entrypoint invoked by the CLI; wraps the async implementation.
+
+    Tools named in *reuse* must still be advertised by ``tools/list`` but are not
+    called; their supplied payloads are recorded instead. Selfcheck uses this to
+    avoid running the sentinel suite a second time through ``sentinel_run``.
+
+    With *connect* the smoke talks to a server already listening on that Unix
+    socket (``sentinel mcp server --socket``) instead of spawning one. The
+    ``light`` profile skips the tools in ``HEAVY_TOOLS``; they must still be
+    listed.
+
+    Setting *cancel* (selfcheck does when the check overruns its timeout)
+    abandons the run: a spawned server is killed and the summary ends with a
+    failed ``cancelled`` step.
+    """
+
+    if profile not in SMOKE_PROFILES:
+        raise ValueError(f"Unknown smoke profile '{profile}' (expected one of: {', '.join(SMOKE_PROFILES)}).")
     root = Path(root).resolve()
+    skipped = HEAVY_TOOLS if profile == "light" else frozenset()
+    timeouts = timeouts or DEFAULT_TIMEOUTS
+    reuse = dict(reuse or {})
+    if connect is not None:
+        socket_path = Path(connect)
+        try:
+            return asyncio.run(_run_connected(root, socket_path, timeouts, reuse, skipped, cancel))
+        except OSError as exc:
+            step = SmokeStep(name="connect", success=False, duration=0.0, detail=str(exc))
+            return SmokeSummary(ok=False, command=socket_command(socket_path), steps=[step])
     try:
-        return asyncio.run(_run_smoke(root, timeouts or DEFAULT_TIMEOUTS))
+        return asyncio.run(_run_smoke(root, timeouts, reuse, skipped, cancel))
     except OSError as exc:
         step = SmokeStep(name="spawn", success=False, duration=0.0, detail=str(exc))
-        return SmokeSummary(ok=False, command=_server_command(), steps=[step])
+        return SmokeSummary(ok=False, command=server_command(), steps=[step])
 
 
-async def _run_smoke(root: Path, timeouts: SmokeTimeouts) -> SmokeSummary:
-    command = _server_command()
-    env = os.environ.copy()
-    env.setdefault("PYTHONWARNINGS", "ignore::RuntimeWarning:runpy")
-    sentinelkit_repo_root = Path(__file__).resolve().parents[3]
-    python_path_entries = [str(root), str(sentinelkit_repo_root)]
-    existing_pythonpath = env.get("PYTHONPATH")
-    if existing_pythonpath:
-        python_path_entries.append(existing_pythonpath)
-    env["PYTHONPATH"] = os.pathsep.join(python_path_entries)
-
+async def _run_smoke(
+    root: Path,
+    timeouts: SmokeTimeouts,
+    reuse: Mapping[str, Any],
+    skipped: frozenset[str],
+    cancel: threading.Event | None = None,
+) -> SmokeSummary:
+    command = server_command()
     process = await asyncio.create_subprocess_exec(
         *command,
         stdin=asyncio.subprocess.PIPE,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
         cwd=str(root),
-        env=env,
+        env=server_env(root),
     )
     stderr_task = asyncio.create_task(_capture_stream(process.stderr))
-    client = _JsonRpcClient(process)
+    if process.stdin is None or process.stdout is None:
+        raise RuntimeError("MCP server must expose stdin/stdout pipes.")
+    client = JsonRpcClient(process.stdout, process.stdin)
+    summary: SmokeSummary | None = None
+    killed = False
+
+    try:
+        summary = await _until_cancelled(_exercise(client, root, command, timeouts, reuse, skipped), cancel)
+    finally:
+        if summary is None and process.returncode is None:
+            # Cancelled (or failed) mid-run: do not wait on a server that may be busy.
+            process.kill()
+            killed = True
+        await graceful_shutdown(client)
+        await wait_for_process(process)
+        stderr_output = (await stderr_task).strip() or None
+        if summary is None:
+            summary = _cancelled_summary(command)
+        summary.stderr = stderr_output
+        if process.returncode and process.returncode != 0 and not killed:
+            reason = f"MCP server exited with {process.returncode}"
+            summary.steps.append(SmokeStep(name="server-exit", success=False, duration=0.0, detail=reason))
+            summary.ok = False
+    return summary
+
+
+async def _run_connected(
+    root: Path,
+    socket_path: Path,
+    timeouts: SmokeTimeouts,
+    reuse: Mapping[str, Any],
+    skipped: frozenset[str],
+    cancel: threading.Event | None = None,
+) -> SmokeSummary:
+    command = socket_command(socket_path)
+    reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(str(socket_path)), timeout=timeouts.initialize)
+    client = JsonRpcClient(reader, writer)
+    try:
+        summary = await _until_cancelled(_exercise(client, root, command, timeouts, reuse, skipped), cancel)
+        return summary if summary is not None else _cancelled_summary(command)
+    finally:
+        # ``exit`` only ends this connection; the shared server keeps running.
+        await graceful_shutdown(client)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+
+async def _until_cancelled(work: Awaitable[SmokeSummary], cancel: threading.Event | None) -> SmokeSummary | None:
+    """Await *work*, or cancel it and return ``None`` once *cancel* is set."""
+
+    task = asyncio.ensure_future(work)
+    if cancel is None:
+        return await task
+    while not task.done():
+        if cancel.is_set():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return None
+        await asyncio.wait({task}, timeout=CANCEL_POLL_INTERVAL)
+    return task.result()
+
+
+def _cancelled_summary(command: Command) -> SmokeSummary:
+    step = SmokeStep(name="cancelled", success=False, duration=0.0, detail="MCP smoke was cancelled.")
+    return SmokeSummary(False, command, [step], stderr=None)
+
+
+async def _exercise(
+    client: JsonRpcClient,
+    root: Path,
+    command: Command,
+    timeouts: SmokeTimeouts,
+    reuse: Mapping[str, Any],
+    skipped: frozenset[str],
+) -> SmokeSummary:
+    """Drive initialize → tools/list → tools/call over an open client."""
+
     steps: list[SmokeStep] = []
     tool_payloads: dict[str, Any] = {}
     preview_path = _ensure_preview_file(root)
-    summary: SmokeSummary | None = None
-
     try:
         step, _ = await _phase(
             "initialize",
@@ -116,8 +233,7 @@ async def _run_smoke(root: Path, timeouts: SmokeTimeouts) -> SmokeSummary:
         )
         steps.append(step)
         if not step.success:
-            summary = SmokeSummary(False, command, steps, stderr=None)
-            return summary
+            return SmokeSummary(False, command, steps, stderr=None)
 
         await client.notify("notifications/initialized")
 
@@ -128,8 +244,7 @@ async def _run_smoke(root: Path, timeouts: SmokeTimeouts) -> SmokeSummary:
         )
         steps.append(list_step)
         if not list_step.success:
-            summary = SmokeSummary(False, command, steps, stderr=None)
-            return summary
+            return SmokeSummary(False, command, steps, stderr=None)
 
         missing = EXPECTED_TOOLS - {tool["name"] for tool in list_payload.get("tools", [])}
         if missing:
@@ -141,61 +256,41 @@ async def _run_smoke(root: Path, timeouts: SmokeTimeouts) -> SmokeSummary:
                     detail=f"Missing tools: {', '.join(sorted(missing))}",
                 )
             )
-            summary = SmokeSummary(False, command, steps, stderr=None)
-            return summary
+            return SmokeSummary(False, command, steps, stderr=None)
 
-        for tool_name in sorted(EXPECTED_TOOLS):
-            arguments = _tool_arguments(tool_name, preview_path.relative_to(root))
-            step, payload = await _call_tool(client, tool_name, arguments, timeout=timeouts.tools_call)
+        # The tools are independent, so all calls go out at once; steps keep sorted order.
+        tools = sorted(EXPECTED_TOOLS)
+        relative_preview = preview_path.relative_to(root)
+        outcomes = await asyncio.gather(
+            *(_tool_step(client, name, relative_preview, timeouts, reuse, skipped) for name in tools)
+        )
+        for tool_name, (step, payload) in zip(tools, outcomes, strict=True):
             steps.append(step)
             if payload is not None:
                 tool_payloads[tool_name] = payload
-            if not step.success:
-                break
 
         ok = all(step.success for step in steps)
-        summary = SmokeSummary(ok, command, steps, tool_payloads, stderr=None)
+        return SmokeSummary(ok, command, steps, tool_payloads, stderr=None)
     finally:
-        await _graceful_shutdown(client)
-        await _wait_for_process(process)
-        stderr_output = (await stderr_task).strip() or None
         if preview_path.exists():
             preview_path.unlink()
-        if summary is None:
-            summary = SmokeSummary(False, command, steps, tool_payloads, stderr=None)
-        summary.stderr = stderr_output
-        if process.returncode and process.returncode != 0:
-            reason = f"MCP server exited with {process.returncode}"
-            summary.steps.append(SmokeStep(name="server-exit", success=False, duration=0.0, detail=reason))
-            summary.ok = False
-    return summary
 
 
-async def _graceful_shutdown(client: "_JsonRpcClient") -> None:
-    try:
-        await asyncio.wait_for(client.request("shutdown"), timeout=2.0)
-    except Exception:
-        pass
-    try:
-        await asyncio.wait_for(client.notify("exit"), timeout=1.0)
-    except Exception:
-        pass
-
-
-async def _wait_for_process(process: asyncio.subprocess.Process) -> None:
-    if process.stdin:
-        process.stdin.close()
-        try:
-            await process.stdin.wait_closed()
-        except Exception:
-            pass
-    if process.returncode is not None:
-        return
-    try:
-        await asyncio.wait_for(process.wait(), timeout=3.0)
-    except asyncio.TimeoutError:
-        process.kill()
-        await process.wait()
+async def _tool_step(
+    client: JsonRpcClient,
+    tool_name: str,
+    preview_path: Path,
+    timeouts: SmokeTimeouts,
+    reuse: Mapping[str, Any],
+    skipped: frozenset[str],
+) -> tuple[SmokeStep, Any]:
+    step_name = f"tools.call[{tool_name}]"
+    if tool_name in reuse:
+        return SmokeStep(name=step_name, success=True, duration=0.0, detail="reused caller result"), reuse[tool_name]
+    if tool_name in skipped:
+        return SmokeStep(name=step_name, success=True, duration=0.0, detail="skipped (light profile)"), None
+    arguments = _tool_arguments(tool_name, preview_path)
+    return await _call_tool(client, tool_name, arguments, timeout=timeouts.tools_call)
 
 
 async def _capture_stream(stream: asyncio.StreamReader | None) -> str:
@@ -205,10 +300,6 @@ async def _capture_stream(stream: asyncio.StreamReader | None) -> str:
     return data.decode("utf-8", errors="replace")
 
 
-def _server_command() -> list[str]:
-    return [sys.executable, "-m", "sentinelkit.cli.mcp.server"]
-
-
 async def _phase(
     name: str,
     action: Callable[[], Awaitable[Any]],
@@ -234,7 +325,7 @@ async def _phase(
 
 
 async def _call_tool(
-    client: "_JsonRpcClient",
+    client: JsonRpcClient,
     tool_name: str,
     arguments: Mapping[str, Any],
     *,
@@ -295,61 +386,3 @@ def _ensure_preview_file(root: Path) -> Path:
     return preview
 
 
-class _JsonRpcClient:
-    """Minimal JSON-RPC client for stdio subprocesses."""
-
-    def __init__(self, process: asyncio.subprocess.Process) -> None:
-        if process.stdin is None or process.stdout is None:
-            raise RuntimeError("MCP server must expose stdin/stdout pipes.")
-        self._process = process
-        self._reader = process.stdout
-        self._writer = process.stdin
-        self._next_id = 0
-
-    async def request(self, method: str, params: Mapping[str, Any] | None = None) -> Any:
-        payload = self._build_payload(method, params)
-        await self._write(payload)
-        message = await self._read()
-        if "error" in message:
-            error = message["error"]
-            raise RuntimeError(f"{method} failed ({error.get('code')}): {error.get('message')}")
-        return message.get("result")
-
-    async def notify(self, method: str, params: Mapping[str, Any] | None = None) -> None:
-        await self._write(self._build_payload(method, params, include_id=False))
-
-    def _build_payload(
-        self,
-        method: str,
-        params: Mapping[str, Any] | None,
-        *,
-        include_id: bool = True,
-    ) -> dict[str, Any]:
-        message: dict[str, Any] = {
-            "jsonrpc": "2.0",
-            "method": method,
-        }
-        if include_id:
-            self._next_id += 1
-            message["id"] = self._next_id
-        if params is not None:
-            message["params"] = params
-        return message
-
-    async def _write(self, payload: Mapping[str, Any]) -> None:
-        message_str = json.dumps(payload, separators=(",", ":"))
-        print(f"[MCP SMOKE WRITE] {message_str}", file=sys.stderr, flush=True)
-        encoded = (message_str + "\n").encode("utf-8")
-        self._writer.write(encoded)
-        await self._writer.drain()
-
-    async def _read(self) -> Mapping[str, Any]:
-        line = await self._reader.readline()
-        if not line:
-            raise RuntimeError("MCP server closed the connection unexpectedly.")
-        try:
-            decoded = line.decode("utf-8").rstrip("\r\n")
-            print(f"[MCP SMOKE READ RAW] {decoded}", file=sys.stderr, flush=True)
-            return json.loads(decoded)
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(f"Invalid MCP response payload: {exc.msg}") from exc
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Iterator
 
 import typer
 
-from sentinelkit.prompt import PromptRenderer, PromptRenderingError
+from sentinelkit.context.mount import ContextMount
+from sentinelkit.prompt import PromptBundle, PromptRenderer, PromptRenderingError
+from sentinelkit.prompt.environment import compile_templates
+from sentinelkit.prompt.render import TEMPLATE_DIR
 from sentinelkit.utils.errors import build_error_payload, serialize_error
 
 from .state import get_context
@@ -19,7 +23,7 @@ app = typer.Typer(help="Prompt rendering utilities.")
 @app.command("render", help="Render Sentinel prompts.")
 def render(
     ctx: typer.Context,
-    mode: Annotated[str, typer.Option("--mode", "-m", help="Prompt mode: router or capsule.")],
+    mode: Annotated[str, typer.Option("--mode", "-m", help="Prompt mode: router, capsule, or bundle.")],
     capsule: Annotated[
         Path,
         typer.Option(
@@ -32,32 +36,76 @@ def render(
     ],
     agent: Annotated[
         str | None,
-        typer.Option("--agent", "-a", help="Agent id (required for capsule mode)."),
+        typer.Option(
+            "--agent",
+            "-a",
+            help="Agent id (required for capsule mode); comma-separated ids for bundle mode (defaults to all).",
+        ),
     ] = None,
     output: Annotated[
         Path | None,
-        typer.Option("--output", "-o", help="Optional file to write prompt output."),
+        typer.Option(
+            "--output",
+            "-o",
+            help="Optional file to write prompt output (a directory in bundle mode).",
+        ),
     ] = None,
     router_json: Annotated[
         Path | None,
         typer.Option("--router-json", help="Router JSON payload to validate and log."),
     ] = None,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help="Write router/capsule prompts chunk by chunk instead of building them in memory.",
+        ),
+    ] = False,
+    mount_context: Annotated[
+        bool,
+        typer.Option("--mount-context", help="Inline the capsule's Allowed Context files into agent prompts."),
+    ] = False,
+    mount_max_lines: Annotated[
+        int | None,
+        typer.Option("--mount-max-lines", min=1, help="Line budget for mounted context (implies --mount-context)."),
+    ] = None,
+    mount_max_tokens: Annotated[
+        int | None,
+        typer.Option(
+            "--mount-max-tokens",
+            min=1,
+            help="Approximate token budget for mounted context (implies --mount-context).",
+        ),
+    ] = None,
 ) -> None:
-    """Render router or capsule prompts via the Python renderer."""
+    """Render router, capsule, or bundle prompts via the Python renderer."""
     context = get_context(ctx)
-    renderer = PromptRenderer(root=context.root)
+    mount = None
+    if mount_context or mount_max_lines is not None or mount_max_tokens is not None:
+        mount = ContextMount(context.root, max_lines=mount_max_lines, max_tokens=mount_max_tokens)
+    renderer = PromptRenderer(root=context.root, context_mount=mount)
     mode = mode.lower()
     try:
         if mode == "router":
-            prompt = renderer.render_router_prompt(capsule)
-            _write_output(prompt, output)
+            if stream:
+                _stream_output(renderer.stream_router_prompt(capsule), output)
+            else:
+                _write_output(renderer.render_router_prompt(capsule), output)
             if router_json:
                 log_path = renderer.write_router_log(capsule, router_json)
                 typer.secho(f"router log -> {log_path}", fg="cyan")
             return
+        if mode == "bundle":
+            agent_ids = [item.strip() for item in agent.split(",") if item.strip()] if agent else None
+            bundle = renderer.render_bundle(capsule, agent_ids)
+            _write_bundle(context.format, bundle, output)
+            return
         if mode != "capsule":
             raise PromptRenderingError(
-                build_error_payload(code="prompts.invalid_mode", message="Mode must be 'router' or 'capsule'.")
+                build_error_payload(
+                    code="prompts.invalid_mode",
+                    message="Mode must be 'router', 'capsule', or 'bundle'.",
+                )
             )
         if not agent:
             raise PromptRenderingError(
@@ -66,8 +114,10 @@ def render(
                     message="--agent is required when rendering capsule prompts.",
                 )
             )
-        prompt = renderer.render_agent_prompt(capsule, agent)
-        _write_output(prompt, output)
+        if stream:
+            _stream_output(renderer.stream_agent_prompt(capsule, agent), output)
+        else:
+            _write_output(renderer.render_agent_prompt(capsule, agent), output)
     except PromptRenderingError as error:
         payload = serialize_error(error)
         if context.format == "json":
@@ -77,6 +127,53 @@ def render(
         raise typer.Exit(1)
 
 
+@app.command("compile", help="Precompile prompt templates (run before packaging).")
+def compile_command(
+    ctx: typer.Context,
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Target directory (defaults to the bundled templates/_compiled)."),
+    ] = None,
+) -> None:
+    """Compile the Jinja templates into modules that the renderer loads without parsing."""
+    context = get_context(ctx)
+    target = compile_templates(TEMPLATE_DIR, output)
+    if context.format == "json":
+        typer.echo(json.dumps({"ok": True, "compiled": str(target)}, indent=2))
+    else:
+        typer.secho(f"compiled templates -> {target}", fg="green")
+
+
+def _write_bundle(output_format: str, bundle: PromptBundle, destination: Path | None) -> None:
+    prompts = {"router": bundle.router, **bundle.agents}
+    if destination:
+        destination.mkdir(parents=True, exist_ok=True)
+        for name, content in prompts.items():
+            (destination / f"{name.lower()}.md").write_text(content, encoding="utf-8")
+        typer.secho(f"wrote {len(prompts)} prompts -> {destination}", fg="green")
+    elif output_format == "json":
+        typer.echo(json.dumps({"ok": True, "capsule": bundle.capsule.path, "prompts": prompts}, indent=2))
+    else:
+        for name, content in prompts.items():
+            typer.echo(f"<!-- prompt: {name} -->")
+            typer.echo(content)
+
+
+def _stream_output(chunks: Iterator[str], destination: Path | None) -> None:
+    if destination is None:
+        typer.get_text_stream("stdout").writelines(chunks)
+        return
+    # Stream into a sibling temp file so a failed render never leaves a partial prompt.
+    tmp_path = destination.with_name(f"{destination.name}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.writelines(chunks)
+        os.replace(tmp_path, destination)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    typer.secho(f"wrote prompt -> {destination}", fg="green")
+
+
 def _write_output(content: str, destination: Path | None) -> None:
     if destination:
         destination.write_text(content, encoding="utf-8")
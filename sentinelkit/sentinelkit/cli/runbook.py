@@ -9,8 +9,8 @@ from typing import Annotated
 
 import typer
 
-from sentinelkit.runbook import RunbookUpdater
-from sentinelkit.runbook.updater import RunbookUpdaterError
+from sentinelkit.runbook import RunbookRetention, RunbookUpdater
+from sentinelkit.runbook.updater import DEFAULT_RETENTION, RunbookUpdaterError
 from sentinelkit.utils.errors import SentinelKitError, serialize_error
 
 from .state import get_context
@@ -33,11 +33,26 @@ def append(
         Path | None,
         typer.Option("--output", "-O", help="Optional preview file (relative to --root when not absolute)."),
     ] = None,
+    queue: Annotated[
+        bool,
+        typer.Option("--queue", help="Queue the note in the runbook journal for `sentinel runbook flush`."),
+    ] = False,
 ) -> None:
     """Append a structured runbook entry."""
     context = get_context(ctx)
-    updater = RunbookUpdater(context.root / ".sentinel" / "docs" / "IMPLEMENTATION.md")
+    updater = _updater(context.root)
     preview_path = _resolve_optional_path(context.root, output)
+    if queue:
+        if dry_run or preview_path is not None:
+            raise typer.BadParameter("--queue cannot be combined with --dry-run or --output.")
+        try:
+            updater.enqueue(section=section, note=note, author=author, timestamp=_parse_timestamp(timestamp))
+        except SentinelKitError as error:
+            _emit_error(ctx, error)
+        else:
+            _emit_queued(ctx, updater.journal.path)
+        return
+
     try:
         result = updater.append(
             section=section,
@@ -53,6 +68,81 @@ def append(
         _emit_runbook_result(ctx, result)
 
 
+@app.command("flush", help="Write queued runbook notes into IMPLEMENTATION.md.")
+def flush(ctx: typer.Context) -> None:
+    """Compact the runbook journal into IMPLEMENTATION.md with a single write."""
+    context = get_context(ctx)
+    updater = _updater(context.root)
+    try:
+        results = updater.flush()
+    except SentinelKitError as error:
+        _emit_error(ctx, error)
+    else:
+        if ctx.obj.format == "json":
+            typer.echo(
+                json.dumps(
+                    {"ok": True, "path": str(updater.path), "sections": [result.section.slug for result in results]},
+                    indent=2,
+                )
+            )
+        elif results:
+            typer.echo(f"[sentinel] Runbook updated with {len(results)} queued note(s) -> {updater.path}")
+        else:
+            typer.echo("[sentinel] No queued runbook notes.")
+
+
+@app.command("compact", help="Move old runbook notes into quarterly archives.")
+def compact(
+    ctx: typer.Context,
+    keep: Annotated[
+        int | None,
+        typer.Option("--keep", min=0, help="Newest notes to keep per section (default: 50 when no policy is given)."),
+    ] = None,
+    max_age_days: Annotated[
+        int | None,
+        typer.Option("--max-age-days", min=0, help="Archive notes older than this many days."),
+    ] = None,
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Report what would move without writing.")] = False,
+) -> None:
+    """Rotate notes into .sentinel/docs/archive/IMPLEMENTATION-YYYY-Qn.md."""
+    context = get_context(ctx)
+    updater = _updater(context.root)
+    retention = None
+    if keep is not None or max_age_days is not None:
+        retention = RunbookRetention(keep_per_section=keep, max_age_days=max_age_days)
+    try:
+        result = updater.compact(retention, dry_run=dry_run)
+    except SentinelKitError as error:
+        _emit_error(ctx, error)
+    else:
+        archives = {str(path): count for path, count in sorted(result.archives.items())}
+        if ctx.obj.format == "json":
+            typer.echo(
+                json.dumps(
+                    {
+                        "ok": True,
+                        "path": str(result.path),
+                        "archived": result.archived,
+                        "archives": archives,
+                        "dry_run": result.dry_run,
+                        "wrote_file": result.wrote_file,
+                    },
+                    indent=2,
+                )
+            )
+        elif result.archived:
+            verb = "Would archive" if result.dry_run else "Archived"
+            typer.echo(f"[sentinel] {verb} {result.archived} runbook note(s):")
+            for path, count in archives.items():
+                typer.echo(f"  - {path}: {count}")
+        else:
+            typer.echo("[sentinel] Runbook already within retention.")
+
+
+def _updater(root: Path) -> RunbookUpdater:
+    return RunbookUpdater(root / ".sentinel" / "docs" / "IMPLEMENTATION.md", retention=DEFAULT_RETENTION)
+
+
 def _parse_timestamp(value: str | None) -> datetime | None:
     if value is None:
         return None
@@ -87,6 +177,13 @@ def _emit_runbook_result(ctx: typer.Context, result) -> None:
         typer.echo(f"[sentinel] Runbook {status} ({result.section.title}) -> {result.path}")
 
 
+def _emit_queued(ctx: typer.Context, journal_path: Path) -> None:
+    if ctx.obj.format == "json":
+        typer.echo(json.dumps({"ok": True, "queued": True, "journal": str(journal_path)}, indent=2))
+    else:
+        typer.echo(f"[sentinel] Runbook note queued in {journal_path} (run `sentinel runbook flush` to apply)")
+
+
 def _emit_error(ctx: typer.Context, error: SentinelKitError) -> None:
     payload = serialize_error(error)
     if ctx.obj.format == "json":
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+from functools import partial
+from pathlib import Path
 from typing import Dict, Mapping
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from sentinelkit.capsule.generator import CapsuleGenerator
+from sentinelkit.cli.mcp.server import DEFAULT_SOCKET
 from sentinelkit.cli.mcp.smoke import SmokeSummary, run_smoke
-from sentinelkit.utils.errors import build_error_payload
+from sentinelkit.context.limits import DEFAULT_CONFIG, ContextLimits, ContextLimitsError, load_context_limits
+from sentinelkit.context.lint import ContextLintError, lint_context
+from sentinelkit.contracts.api import ContractValidator
+from sentinelkit.contracts.loader import ContractLoader
+from sentinelkit.utils.errors import SentinelKitError, build_error_payload, serialize_error
+from sentinelkit.utils.paths import walk_files
 
-from .executor import CheckResult, run_checks
+from .executor import CheckCallable, CheckResult, CheckRun, CheckSpec, run_cancellable, run_checks
+from .history import DEFAULT_PERCENTILE, DEFAULT_WINDOW, HISTORY_ENV, HISTORY_PATH, CheckTiming, SelfcheckHistory
+from .sentinels import sentinel_pytest_args, sentinel_pytest_command
 from .state import CLIContext, get_context
-from .sentinels import run_sentinel_pytest
 
 __all__ = ["run"]
 
@@ -23,15 +34,49 @@ __all__ = ["run"]
 def run(
     ctx: typer.Context,
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show additional diagnostics."),
+    trend: bool = typer.Option(
+        False, "--trend", help="Show duration percentiles from the timing history instead of running checks."
+    ),
+    window: int = typer.Option(DEFAULT_WINDOW, "--window", min=2, help="Number of recent runs used for percentiles."),
+    percentile: float = typer.Option(
+        DEFAULT_PERCENTILE,
+        "--percentile",
+        min=50.0,
+        max=100.0,
+        help="Flag checks slower than this percentile of earlier runs.",
+    ),
+    record: bool = typer.Option(
+        True,
+        "--record/--no-record",
+        help=f"Append this run's timings to {HISTORY_PATH.as_posix()} (or ${HISTORY_ENV}).",
+    ),
 ) -> None:
     """Run SentinelKit self diagnostics."""
     context = get_context(ctx)
+    history = SelfcheckHistory(context.root)
+    if trend:
+        _show_trend(context, history, window=window, percentile=percentile)
+        return
+
     checks = _build_checks()
     results = sorted(run_checks(context, checks, show_status=not verbose), key=lambda r: r.name)
     ok = all(result.status != "fail" for result in results)
     has_pending = any(result.status == "pending" for result in results)
+    if record:
+        try:
+            history.append(results, ok=ok)
+        except OSError:
+            pass  # Read-only checkouts still get a report; they just keep no history.
+    timings = history.timings(window=window, percentile=percentile) if record else {}
+    regressions = [timing for timing in timings.values() if timing.regressed]
 
     if context.format == "json":
+        checks_payload = []
+        for result in results:
+            entry = result.to_dict()
+            if result.name in timings:
+                entry["timing"] = timings[result.name].to_dict()
+            checks_payload.append(entry)
         payload = {
             "ok": ok,
             "environment": {
@@ -40,12 +85,15 @@ def run(
                 "platform": context.env.platform,
                 "python": context.env.python_version,
             },
-            "checks": [result.to_dict() for result in results],
+            "checks": checks_payload,
+            "regressions": [timing.name for timing in regressions],
         }
         typer.echo(json.dumps(payload, indent=2))
     else:
         console = Console()
         console.print(_build_table(results))
+        if regressions:
+            console.print(f"[yellow]{_describe_regressions(regressions, percentile)}[/yellow]")
         if not ok:
             summary = "[bold red]Selfcheck failed[/bold red]"
         elif has_pending:
@@ -58,6 +106,47 @@ def run(
         raise typer.Exit(1)
 
 
+def _show_trend(context: CLIContext, history: SelfcheckHistory, *, window: int, percentile: float) -> None:
+    timings = history.timings(window=window, percentile=percentile)
+    regressions = [timing for timing in timings.values() if timing.regressed]
+    if context.format == "json":
+        payload = {
+            "history": str(history.path),
+            "window": window,
+            "percentile": percentile,
+            "checks": [timing.to_dict() for timing in timings.values()],
+            "regressions": [timing.name for timing in regressions],
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    console = Console()
+    if not timings:
+        console.print(f"No selfcheck history yet ({history.path}). Run `sentinel selfcheck` to start recording.")
+        return
+    table = Table(title=f"Selfcheck timing trend (last {window} runs)")
+    table.add_column("Check")
+    table.add_column("Samples", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Last", justify="right")
+    table.add_column(f"p{percentile:g} before", justify="right")
+    for timing in timings.values():
+        last = "-" if timing.last is None else f"{timing.last:.2f}s"
+        if timing.regressed:
+            last = f"[yellow]{last} ⚠[/yellow]"
+        threshold = "-" if timing.threshold is None else f"{timing.threshold:.2f}s"
+        table.add_row(timing.name, str(timing.samples), f"{timing.p50:.2f}s", f"{timing.p95:.2f}s", last, threshold)
+    console.print(table)
+    if regressions:
+        console.print(f"[yellow]{_describe_regressions(regressions, percentile)}[/yellow]")
+
+
+def _describe_regressions(regressions: list[CheckTiming], percentile: float) -> str:
+    details = ", ".join(f"{timing.name} ({timing.last:.2f}s > {timing.threshold:.2f}s)" for timing in regressions)
+    return f"Slower than p{percentile:g} of earlier runs: {details}"
+
+
 def _build_table(results: list[CheckResult]) -> Table:
     table = Table(title="Sentinel selfcheck")
     table.add_column("Check")
@@ -79,32 +168,230 @@ def _build_table(results: list[CheckResult]) -> Table:
     return table
 
 
-def _build_checks() -> Dict[str, callable]:
+SENTINELS_TIMEOUT = 600.0
+MCP_TIMEOUT = 300.0
+GATE_TIMEOUT = 60.0
+OUTPUT_TAIL_LINES = 20
+MAX_REPORTED_FAILURES = 10
+SELFCHECK_DECISION = "D-SELFCHECK"
+SPECS_DIR = ".specify/specs"
+
+
+def _build_checks() -> Dict[str, CheckCallable | CheckSpec]:
+    scans = _ScanCache()
     return {
-        "contracts": _placeholder_check(
-            "contracts", "Contract validation not configured yet. Add schemas to enable this gate."
-        ),
-        "context": _placeholder_check(
-            "context", "Context lint not configured yet. Copy context budgets to enable this gate."
+        "contracts": CheckSpec(partial(_contracts_check, scans), timeout=GATE_TIMEOUT),
+        "context": CheckSpec(partial(_context_check, scans), timeout=GATE_TIMEOUT),
+        "capsule": CheckSpec(partial(_capsule_check, scans), timeout=GATE_TIMEOUT),
+        "sentinels": CheckSpec(_sentinel_check, timeout=SENTINELS_TIMEOUT),
+        # The smoke run reuses the sentinel result instead of running the suite again via sentinel_run.
+        "mcp": CheckSpec(_mcp_check, depends_on=("sentinels",), timeout=MCP_TIMEOUT),
+    }
+
+
+class _WorkspaceScan:
+    """Repository facts the contracts, context and capsule gates share.
+
+    Each is computed once, on first use, no matter which gate asks first: one
+    walk of the tree (skipping the configured forbidden paths), one load of the
+    context limits, and one contract validator with its schema cache.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.RLock()
+        self._files: tuple[str, ...] | None = None
+        self._limits: ContextLimits | None = None
+        self._validator: ContractValidator | None = None
+
+    @property
+    def has_limits(self) -> bool:
+        return (self.root / DEFAULT_CONFIG).is_file()
+
+    def limits(self) -> ContextLimits:
+        with self._lock:
+            if self._limits is None:
+                self._limits = load_context_limits(root=self.root)
+            return self._limits
+
+    def files(self) -> tuple[str, ...]:
+        with self._lock:
+            if self._files is None:
+                forbidden: set[str] = set()
+                if self.has_limits:
+                    try:
+                        forbidden.update(self.limits().forbidden_paths)
+                    except ContextLimitsError:
+                        pass
+                self._files = tuple(walk_files(self.root, skip=forbidden))
+            return self._files
+
+    def spec_dirs(self) -> list[Path]:
+        prefix = f"{SPECS_DIR}/"
+        names = sorted(
+            {
+                relative[len(prefix) :].split("/", 1)[0]
+                for relative in self.files()
+                if relative.startswith(prefix)
+                and relative.endswith("/spec.md")
+                and relative.count("/") == prefix.count("/") + 1
+            }
+        )
+        return [self.root / SPECS_DIR / name for name in names]
+
+    def contract_validator(self) -> ContractValidator:
+        with self._lock:
+            if self._validator is None:
+                self._validator = ContractValidator(ContractLoader(root=self.root))
+            return self._validator
+
+
+class _ScanCache:
+    """Hands every gate in one selfcheck run the same scan for its root."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._scans: dict[Path, _WorkspaceScan] = {}
+
+    def get(self, root: Path) -> _WorkspaceScan:
+        with self._lock:
+            scan = self._scans.get(root)
+            if scan is None:
+                scan = self._scans[root] = _WorkspaceScan(root)
+            return scan
+
+
+def _contracts_check(scans: _ScanCache, context: CLIContext, _run: CheckRun) -> CheckResult:
+    """Validate every contract fixture against its schema."""
+
+    start = time.perf_counter()
+    scan = scans.get(context.root)
+    contracts_dir = context.root / ".sentinel" / "contracts"
+    if not any(contracts_dir.glob("*.yaml")):
+        return _pending(
+            "contracts",
+            "Contract validation not configured yet. Add schemas to enable this gate.",
+            contracts_path=str(contracts_dir),
+        )
+
+    results = scan.contract_validator().validate_all()
+    duration = time.perf_counter() - start
+    if not results:
+        return _pending("contracts", "No contract fixtures found yet.", contracts_path=str(contracts_dir))
+
+    failures = [result.to_dict() for result in results if not result.ok]
+    data = {
+        "message": f"{len(results)} fixture(s) validated.",
+        "fixtures": len(results),
+        "failures": failures[:MAX_REPORTED_FAILURES],
+    }
+    if not failures:
+        return CheckResult(name="contracts", status="ok", duration=duration, data=data)
+    return CheckResult(
+        name="contracts",
+        status="fail",
+        duration=duration,
+        data=data,
+        error=build_error_payload(
+            code="contracts.failed",
+            message=f"{len(failures)} of {len(results)} contract fixture(s) failed validation.",
+            remediation="Run `sentinel contracts validate` for the full report.",
         ),
-        "capsule": _placeholder_check(
-            "capsule", "Capsule generator dry-run not configured yet. Add capsule metadata to enable this gate."
+    )
+
+
+def _context_check(scans: _ScanCache, context: CLIContext, _run: CheckRun) -> CheckResult:
+    """Lint capsules and prompts against the context limits."""
+
+    start = time.perf_counter()
+    scan = scans.get(context.root)
+    if not scan.has_limits:
+        return _pending(
+            "context",
+            "Context lint not configured yet. Copy context budgets to enable this gate.",
+            config_path=str(context.root / DEFAULT_CONFIG),
+        )
+
+    try:
+        summary = lint_context(root=context.root, limits=scan.limits(), files=scan.files())
+    except (ContextLimitsError, ContextLintError) as error:
+        return CheckResult(
+            name="context",
+            status="fail",
+            duration=time.perf_counter() - start,
+            error=error.payload,
+        )
+
+    data = summary.to_dict()
+    data["diagnostics"] = data["diagnostics"][:MAX_REPORTED_FAILURES]
+    data["message"] = f"{summary.checked_files} file(s) linted, {summary.warnings} warning(s)."
+    duration = time.perf_counter() - start
+    if not summary.should_fail():
+        return CheckResult(name="context", status="ok", duration=duration, data=data)
+    return CheckResult(
+        name="context",
+        status="fail",
+        duration=duration,
+        data=data,
+        error=build_error_payload(
+            code="context.failed",
+            message=f"Context lint reported {summary.errors} error(s).",
+            remediation="Run `sentinel context lint` for the full report.",
         ),
-        "sentinels": _sentinel_check,
-        "mcp": _mcp_check,
+    )
+
+
+def _capsule_check(scans: _ScanCache, context: CLIContext, _run: CheckRun) -> CheckResult:
+    """Render every Spec-Kit feature's capsule without writing it."""
+
+    start = time.perf_counter()
+    spec_dirs = scans.get(context.root).spec_dirs()
+    if not spec_dirs:
+        return _pending(
+            "capsule",
+            "Capsule generator dry-run not configured yet. Add Spec-Kit features to enable this gate.",
+            specs_path=str(context.root / SPECS_DIR),
+        )
+
+    generator = CapsuleGenerator(root=context.root)
+    failures: list[dict[str, object]] = []
+    for spec_dir in spec_dirs:
+        try:
+            generator.generate(spec_dir, SELFCHECK_DECISION, write=False)
+        except SentinelKitError as error:
+            failures.append({"spec": spec_dir.relative_to(context.root).as_posix(), "error": serialize_error(error)})
+
+    duration = time.perf_counter() - start
+    data = {
+        "message": f"{len(spec_dirs) - len(failures)} of {len(spec_dirs)} capsule(s) render.",
+        "specs": len(spec_dirs),
+        "failures": failures[:MAX_REPORTED_FAILURES],
     }
+    if not failures:
+        return CheckResult(name="capsule", status="ok", duration=duration, data=data)
+    return CheckResult(
+        name="capsule",
+        status="fail",
+        duration=duration,
+        data=data,
+        error=build_error_payload(
+            code="capsule.failed",
+            message=f"{len(failures)} of {len(spec_dirs)} capsule(s) failed to render.",
+            remediation="Run `sentinel capsule generate <spec> --decision <id> --dry-run` on the failing spec.",
+        ),
+    )
 
 
-def _placeholder_check(name: str, message: str):
-    def runner(context: CLIContext) -> CheckResult:
-        data = {"message": message, "root": str(context.root)}
-        return CheckResult(name=name, status="pending", duration=0.0, data=data)
+def _pending(name: str, message: str, **details: str) -> CheckResult:
+    return CheckResult(name=name, status="pending", duration=0.0, data={"message": message, **details})
 
-    return runner
 
+def _sentinel_check(context: CLIContext, run: CheckRun) -> CheckResult:
+    """Run the sentinel pytest suite in a child process and surface status.
 
-def _sentinel_check(context: CLIContext) -> CheckResult:
-    """Run sentinel pytest suite and surface status."""
+    A child process keeps pytest's ``chdir`` and module state away from the
+    other checks and lets the scheduler kill the run when it times out.
+    """
 
     tests_dir = context.root / "tests" / "sentinels"
     if not tests_dir.exists() or not any(tests_dir.rglob("test_*.py")):
@@ -119,33 +406,44 @@ def _sentinel_check(context: CLIContext) -> CheckResult:
         )
 
     start = time.perf_counter()
-    try:
-        exit_code, summary = run_sentinel_pytest(root=context.root, quiet=True)
-        status = "ok" if exit_code == 0 else "fail"
-        error = None
-        if status == "fail":
-            error = build_error_payload(code="sentinels.failed", message="Sentinel tests failed.")
-        return CheckResult(
-            name="sentinels",
-            status=status,
-            duration=time.perf_counter() - start,
-            data=summary,
-            error=error,
-        )
-    except Exception as exc:  # pragma: no cover - defensive
+    command, env = sentinel_pytest_command(context.root)
+    completed = run_cancellable(command, run, cwd=context.root, env=env)
+    duration = time.perf_counter() - start
+    if completed is None:
         return CheckResult(
             name="sentinels",
             status="fail",
-            duration=time.perf_counter() - start,
-            error=build_error_payload(code="sentinels.error", message=str(exc)),
+            duration=duration,
+            error=build_error_payload(code="sentinels.timeout", message="Sentinel tests were cancelled."),
         )
 
+    summary = {
+        "ok": completed.returncode == 0,
+        "root": str(context.root),
+        "args": sentinel_pytest_args(),
+        "exit_code": completed.returncode,
+    }
+    if completed.returncode == 0:
+        return CheckResult(name="sentinels", status="ok", duration=duration, data=summary)
+    summary["output"] = "\n".join(completed.stdout.splitlines()[-OUTPUT_TAIL_LINES:])
+    return CheckResult(
+        name="sentinels",
+        status="fail",
+        duration=duration,
+        data=summary,
+        error=build_error_payload(code="sentinels.failed", message="Sentinel tests failed."),
+    )
+
 
-def _mcp_check(context: CLIContext) -> CheckResult:
+def _mcp_check(context: CLIContext, run: CheckRun) -> CheckResult:
     """Run MCP smoke tests and surface status."""
 
+    reuse = {}
+    sentinels = run.dependencies.get("sentinels")
+    if sentinels is not None and sentinels.status != "pending" and sentinels.data is not None:
+        reuse["sentinel_run"] = sentinels.data
     start = time.perf_counter()
-    summary = run_smoke(context.root)
+    summary = _smoke(context.root, reuse, run.cancel)
     duration = time.perf_counter() - start
     data = summary.to_dict()
     if summary.ok:
@@ -169,6 +467,21 @@ def _mcp_check(context: CLIContext) -> CheckResult:
     return CheckResult(name="mcp", status="fail", duration=duration, data=data, error=error)
 
 
+def _smoke(root: Path, reuse: Mapping[str, object], cancel: threading.Event) -> SmokeSummary:
+    """Prefer a server already listening on the default socket; spawn one otherwise.
+
+    *cancel* is the check's cancel event; once set, the smoke run stops and
+    kills any server it spawned.
+    """
+
+    socket_path = root / DEFAULT_SOCKET
+    if socket_path.exists():
+        summary = run_smoke(root, reuse=reuse, connect=socket_path, profile="light", cancel=cancel)
+        if cancel.is_set() or not summary.steps or summary.steps[0].name != "connect":
+            return summary
+    return run_smoke(root, reuse=reuse, cancel=cancel)
+
+
 def _diagnose_mcp_pending(summary: SmokeSummary, context: CLIContext) -> str | None:
     """Return a skip reason when MCP is not configured for this workspace."""
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import json
 import os
+import sys
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Annotated, Optional
@@ -17,6 +18,36 @@ from .state import get_context
 app = typer.Typer(help="Sentinel regression helpers.")
 
 
+SENTINEL_TESTS = "tests/sentinels"
+
+
+def sentinel_pytest_args(*, marker: str | None = None, junit: Path | None = None) -> list[str]:
+    """Return the pytest arguments for the sentinel suite, relative to the repository root."""
+
+    args: list[str] = ["-q", SENTINEL_TESTS]
+    if marker:
+        args.extend(["-m", marker])
+    if junit:
+        junit.parent.mkdir(parents=True, exist_ok=True)
+        args.append(f"--junitxml={junit}")
+    return args
+
+
+def sentinel_pytest_command(root: Path, *, marker: str | None = None) -> tuple[list[str], dict[str, str]]:
+    """Return ``(argv, env)`` that run the sentinel suite in a child process rooted at *root*.
+
+    The child gets *root* and the SentinelKit sources on ``PYTHONPATH`` so it
+    imports the same code as an in-process run.
+    """
+
+    env = os.environ.copy()
+    entries = [str(root), str(Path(__file__).resolve().parents[2])]
+    if env.get("PYTHONPATH"):
+        entries.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(entries)
+    return [sys.executable, "-m", "pytest", *sentinel_pytest_args(marker=marker)], env
+
+
 def run_sentinel_pytest(
     *,
     root: Path,
@@ -25,15 +56,14 @@ def run_sentinel_pytest(
     json_report: Path | None = None,
     quiet: bool = False,
 ) -> tuple[int, dict]:
-    """Execute sentinel pytest suites and return (exit_code, summary)."""
+    """Execute sentinel pytest suites and return (exit_code, summary).
 
-    args: list[str] = ["-q", "tests/sentinels"]
-    if marker:
-        args.extend(["-m", marker])
-    if junit:
-        junit.parent.mkdir(parents=True, exist_ok=True)
-        args.append(f"--junitxml={junit}")
+    Runs in-process and changes the working directory for the duration, so it
+    must not run alongside other threads; use :func:`sentinel_pytest_command`
+    to run the suite in a child process instead.
+    """
 
+    args = sentinel_pytest_args(marker=marker, junit=junit)
     cwd = Path.cwd()
     try:
         os.chdir(root)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from typing import Optional
 
 import typer
 
-from sentinelkit.scripts.snippets import SnippetSyncError, sync_snippets
-from sentinelkit.utils.errors import serialize_error
+from sentinelkit.scripts.snippets import check_snippets, sync_snippets
+from sentinelkit.utils.errors import SentinelKitError, serialize_error
 
 from .state import get_context
 
@@ -24,21 +25,53 @@ def sync(
         help="Comma-separated markers to sync (defaults to all).",
         show_default=False,
     ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Print a unified diff of pending changes and exit 1 on drift without writing anything.",
+    ),
 ) -> None:
     context = get_context(ctx)
     markers = [m.strip() for m in marker.split(",")] if marker else None
     try:
-        updated = sync_snippets(root=context.root, markers=markers)
-    except SnippetSyncError as error:
+        if check:
+            drift = check_snippets(root=context.root, markers=markers)
+        else:
+            updated = sync_snippets(root=context.root, markers=markers)
+    except SentinelKitError as error:
         payload = serialize_error(error)
         if context.format == "json":
-            typer.echo({"ok": False, "error": payload})
+            typer.echo(json.dumps({"ok": False, "error": payload}, indent=2))
         else:
             typer.secho(f"Snippet sync failed -> {payload['message']}", fg="red")
         raise typer.Exit(1)
 
+    if check:
+        _emit_check(context.format, drift)
+        if drift:
+            raise typer.Exit(1)
+        return
+
     if context.format == "json":
-        typer.echo({"ok": True, "updated": [str(path) for path in updated]})
+        typer.echo(json.dumps({"ok": True, "updated": [str(path) for path in updated]}, indent=2))
     else:
         for path in updated:
             typer.secho(f"synced snippet -> {path}", fg="green")
+        if not updated:
+            typer.echo("snippets already up to date")
+
+
+def _emit_check(output_format: str, drift) -> None:
+    if output_format == "json":
+        payload = {
+            "ok": not drift,
+            "drift": [{"path": str(item.target), "diff": item.diff} for item in drift],
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+    for item in drift:
+        typer.echo(item.diff, nl=False)
+    if drift:
+        typer.secho(f"{len(drift)} file(s) out of sync; run `sentinel snippets sync`.", fg="red", err=True)
+    else:
+        typer.echo("snippets in sync")
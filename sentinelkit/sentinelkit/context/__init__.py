@@ -1,9 +1,10 @@
 """Context-related helpers for SentinelKit (placeholder)."""
 
-from . import allowed_context, limits, lint
+from . import allowed_context, limits, lint, mount
 
 __all__ = [
     "allowed_context",
     "limits",
     "lint",
+    "mount",
 ]
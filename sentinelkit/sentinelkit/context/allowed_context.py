@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
@@ -15,11 +18,22 @@ __all__ = [
     "build_allowed_context",
     "normalize_include",
     "assert_include_exists",
+    "IncludeExpansion",
+    "IncludeMatch",
+    "LineCountCache",
+    "clear_expansion_cache",
+    "compile_glob",
+    "expand_include",
+    "extract_allowed_context",
+    "shared_line_counts",
 ]
 
 DEFAULT_CONTEXT_DIR = Path(".sentinel/context")
 EXCLUDED_SUBPATHS = frozenset({"limits"})
 GLOB_MARKERS = frozenset({"*", "?", "["})
+DEFAULT_MAX_MATCHES = 500
+SKIPPED_DIRS = frozenset({".git"})
+_READ_CHUNK = 1 << 20
 
 
 @dataclass(slots=True, frozen=True)
@@ -30,6 +44,9 @@ class AllowedContextEntry:
     absolute_path: Path
     line_count: int
     is_glob: bool = False
+    byte_size: int = 0
+    match_count: int = 0
+    truncated: bool = False
 
     def to_dict(self) -> dict[str, str | int | bool]:
         """Serialize the entry for JSON output."""
@@ -38,9 +55,102 @@ class AllowedContextEntry:
             "absolute": str(self.absolute_path),
             "lineCount": self.line_count,
             "isGlob": self.is_glob,
+            "byteSize": self.byte_size,
+            "matchCount": self.match_count,
+            "truncated": self.truncated,
         }
 
 
+@dataclass(slots=True, frozen=True)
+class IncludeMatch:
+    """A concrete file mounted through an Allowed Context entry."""
+
+    relative_path: str
+    absolute_path: Path
+    line_count: int
+    byte_size: int
+
+    def to_dict(self) -> dict[str, str | int]:
+        return {"path": self.relative_path, "lineCount": self.line_count, "byteSize": self.byte_size}
+
+
+@dataclass(slots=True, frozen=True)
+class IncludeExpansion:
+    """Files matched by one Allowed Context entry, in sorted path order.
+
+    ``truncated`` is True when the walk stopped at ``max_matches``; totals then
+    cover only the files that were returned.
+    """
+
+    pattern: str
+    matches: tuple[IncludeMatch, ...]
+    truncated: bool = False
+
+    @property
+    def total_lines(self) -> int:
+        return sum(match.line_count for match in self.matches)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(match.byte_size for match in self.matches)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "pattern": self.pattern,
+            "matches": [match.to_dict() for match in self.matches],
+            "truncated": self.truncated,
+            "totalLines": self.total_lines,
+            "totalBytes": self.total_bytes,
+        }
+
+
+class LineCountCache:
+    """Thread-safe (lines, bytes) cache keyed by path and validated by mtime + size.
+
+    Lines are counted from raw bytes in fixed-size chunks, so large or binary
+    files never need to be decoded or held in memory.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self.hits += 1
+                return cached[2], stat.st_size
+        lines = _count_lines(path)
+        with self._lock:
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, lines)
+            self.misses += 1
+        return lines, stat.st_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+shared_line_counts = LineCountCache()
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedWalk:
+    paths: tuple[str, ...]
+    truncated: bool
+    dir_stamps: tuple[tuple[Path, int], ...]
+
+
+_WALK_CACHE: dict[tuple[Path, str, int], _CachedWalk] = {}
+_WALK_LOCK = threading.Lock()
+
+
 class AllowedContextError(SentinelKitError):
     """Raised when Allowed Context operations fail."""
 
@@ -50,6 +160,7 @@ def discover_allowed_context(
     *,
     root: Path | str | None = None,
     context_dir: Path | str | None = None,
+    max_matches: int = DEFAULT_MAX_MATCHES,
 ) -> list[AllowedContextEntry]:
     """Return deterministic Allowed Context entries (context docs + optional seeds).
 
@@ -61,6 +172,8 @@ def discover_allowed_context(
         Repository root. Defaults to auto-discovery from this module location.
     context_dir:
         Directory containing shared context docs relative to the repo root.
+    max_matches:
+        Upper bound on files counted per glob entry.
     """
 
     repo_root = _resolve_root(root)
@@ -69,13 +182,13 @@ def discover_allowed_context(
 
     merged: dict[str, AllowedContextEntry] = {}
     for relative in defaults:
-        entry = _build_entry(repo_root, relative)
+        entry = _build_entry(repo_root, relative, max_matches=max_matches)
         merged[relative] = entry
 
     for raw in paths or []:
         normalized = normalize_include(repo_root, raw)
         assert_include_exists(repo_root, normalized)
-        entry = _build_entry(repo_root, normalized)
+        entry = _build_entry(repo_root, normalized, max_matches=max_matches)
         merged.setdefault(normalized, entry)
 
     return [merged[key] for key in sorted(merged)]
@@ -150,6 +263,193 @@ def assert_include_exists(root: Path | str, normalized: str) -> None:
         )
 
 
+def expand_include(
+    root: Path | str,
+    normalized: str,
+    *,
+    max_matches: int = DEFAULT_MAX_MATCHES,
+    line_counts: LineCountCache | None = None,
+) -> IncludeExpansion:
+    """Return the files an Allowed Context entry mounts, with line counts and sizes.
+
+    Files map to themselves, directories to every file below them, and glob
+    patterns to their matches. Directories are walked in sorted order and the walk
+    stops after ``max_matches`` files, so huge trees cost at most that many
+    matches plus the directories visited to find them; ``.git`` is never entered.
+    The matched paths are cached per process and reused while the mtimes of the
+    visited directories are unchanged; per-file counts come from *line_counts*
+    (``shared_line_counts`` by default).
+    """
+
+    root_path = _resolve_root(root)
+    key = (root_path, normalized, max_matches)
+    with _WALK_LOCK:
+        cached = _WALK_CACHE.get(key)
+    if cached is None or not _stamps_current(cached.dir_stamps):
+        cached = _walk_include(root_path, normalized, max_matches)
+        with _WALK_LOCK:
+            _WALK_CACHE[key] = cached
+
+    counter = line_counts or shared_line_counts
+    matches: list[IncludeMatch] = []
+    for relative in cached.paths:
+        absolute = root_path / relative
+        try:
+            lines, size = counter.count(absolute)
+        except OSError:
+            continue
+        matches.append(IncludeMatch(relative_path=relative, absolute_path=absolute, line_count=lines, byte_size=size))
+    return IncludeExpansion(pattern=normalized, matches=tuple(matches), truncated=cached.truncated)
+
+
+def clear_expansion_cache() -> None:
+    """Forget cached glob walks and line counts."""
+    with _WALK_LOCK:
+        _WALK_CACHE.clear()
+    shared_line_counts.clear()
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Translate a glob (``**`` spans directories, ``*``/``?`` do not) into a regex."""
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            body = pattern[index + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            index = end + 1
+        else:
+            parts.append(re.escape(char))
+            index += 1
+    return re.compile("".join(parts))
+
+
+def extract_allowed_context(markdown: str) -> list[str]:
+    """Return the list items under a Markdown document's ``Allowed Context`` heading."""
+    section = _extract_section(markdown, "Allowed Context")
+    if not section:
+        return []
+    entries: list[str] = []
+    current: list[str] = []
+    for raw_line in section.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if _is_list_prefix(line):
+            if current:
+                entries.append(" ".join(current).strip())
+                current.clear()
+            current.append(line.split(maxsplit=1)[1] if " " in line else "")
+        else:
+            if current:
+                current.append(line)
+    if current:
+        entries.append(" ".join(current).strip())
+    return [entry for entry in (entry.strip() for entry in entries) if entry]
+
+
+def _is_list_prefix(line: str) -> bool:
+    return bool(re.match(r"^([-*]|\d+\.)\s+.+", line))
+
+
+def _extract_section(markdown: str, heading: str) -> str:
+    pattern = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+    lines = markdown.splitlines()
+    capturing = False
+    depth = 0
+    bucket: list[str] = []
+    for raw_line in lines:
+        match = pattern.match(raw_line)
+        if match:
+            title = match.group(2).strip().lower()
+            hashes = len(match.group(1))
+            if title == heading.lower():
+                capturing = True
+                depth = hashes
+                continue
+            if capturing and hashes <= depth:
+                break
+        if capturing:
+            bucket.append(raw_line)
+    return "\n".join(bucket).strip()
+
+
+def _walk_include(root: Path, normalized: str, max_matches: int) -> _CachedWalk:
+    if not _has_glob(normalized):
+        target = root / normalized
+        if target.is_file():
+            return _CachedWalk(paths=(normalized,), truncated=False, dir_stamps=())
+        if not target.is_dir():
+            return _CachedWalk(paths=(), truncated=False, dir_stamps=())
+        pattern = f"{normalized.rstrip('/')}/**" if normalized not in ("", ".") else "**"
+    else:
+        pattern = normalized
+
+    base = _glob_base(pattern)
+    base_dir = root if base in ("", ".") else root / base
+    prefix = "" if base in ("", ".") else f"{base}/"
+    remainder = pattern[len(prefix) :]
+    matcher = compile_glob(remainder)
+    max_depth = None if "**" in remainder else remainder.count("/") + 1
+
+    paths: list[str] = []
+    stamps: list[tuple[Path, int]] = []
+    truncated = False
+
+    def walk(directory: Path, relative: str, depth: int) -> bool:
+        nonlocal truncated
+        try:
+            stamps.append((directory, directory.stat().st_mtime_ns))
+            with os.scandir(directory) as iterator:
+                children = sorted(iterator, key=lambda item: item.name)
+        except OSError:
+            return True
+        for child in children:
+            child_relative = f"{relative}{child.name}"
+            if child.is_dir(follow_symlinks=False):
+                if child.name in SKIPPED_DIRS:
+                    continue
+                if max_depth is None or depth + 1 < max_depth:
+                    if not walk(Path(child.path), f"{child_relative}/", depth + 1):
+                        return False
+            elif child.is_file() and matcher.fullmatch(child_relative):
+                if len(paths) >= max_matches:
+                    truncated = True
+                    return False
+                paths.append(f"{prefix}{child_relative}")
+        return True
+
+    if base_dir.is_dir():
+        walk(base_dir, "", 0)
+    return _CachedWalk(paths=tuple(paths), truncated=truncated, dir_stamps=tuple(stamps))
+
+
+def _stamps_current(stamps: tuple[tuple[Path, int], ...]) -> bool:
+    for directory, mtime_ns in stamps:
+        try:
+            if directory.stat().st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
 def _resolve_root(root: Path | str | None) -> Path:
     if root is None:
         return _auto_repo_root()
@@ -212,8 +512,11 @@ def _list_context_relpaths(root: Path, context_root: Path) -> list[str]:
     return sorted(rel_paths)
 
 
-def _build_entry(root: Path, relative: str) -> AllowedContextEntry:
+def _build_entry(root: Path, relative: str, *, max_matches: int = DEFAULT_MAX_MATCHES) -> AllowedContextEntry:
     has_glob = _has_glob(relative)
+    byte_size = 0
+    match_count = 0
+    truncated = False
     if has_glob:
         base = _glob_base(relative)
         try:
@@ -232,7 +535,11 @@ def _build_entry(root: Path, relative: str) -> AllowedContextEntry:
                     message=f"Allowed Context entry '{relative}' escapes repository root",
                 )
             )
-        line_count = 0
+        expansion = expand_include(root, relative, max_matches=max_matches)
+        line_count = expansion.total_lines
+        byte_size = expansion.total_bytes
+        match_count = len(expansion.matches)
+        truncated = expansion.truncated
     else:
         try:
             absolute = (root / relative).resolve()
@@ -252,7 +559,8 @@ def _build_entry(root: Path, relative: str) -> AllowedContextEntry:
             )
         try:
             if absolute.is_file():
-                line_count = _count_lines(absolute)
+                line_count, byte_size = shared_line_counts.count(absolute)
+                match_count = 1
             else:
                 line_count = 0
         except OSError as error:
@@ -267,20 +575,20 @@ def _build_entry(root: Path, relative: str) -> AllowedContextEntry:
         absolute_path=absolute,
         line_count=line_count,
         is_glob=has_glob,
+        byte_size=byte_size,
+        match_count=match_count,
+        truncated=truncated,
     )
 
 
 def _count_lines(path: Path) -> int:
-    try:
-        text = path.read_text(encoding="utf-8")
-        if not text:
-            return 0
-        return text.count("\n") + 1
-    except UnicodeDecodeError:
-        data = path.read_bytes()
-        if not data:
-            return 0
-        return data.count(b"\n") + 1
+    newlines = 0
+    empty = True
+    with path.open("rb") as handle:
+        while chunk := handle.read(_READ_CHUNK):
+            empty = False
+            newlines += chunk.count(b"\n")
+    return 0 if empty else newlines + 1
 
 
 def _glob_base(pattern: str) -> str:
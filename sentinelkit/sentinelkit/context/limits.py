@@ -11,6 +11,7 @@ from typing import Any, Mapping, Sequence
 import jsonschema
 import yaml
 
+from sentinelkit.context.allowed_context import DEFAULT_MAX_MATCHES
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
 
 __all__ = [
@@ -55,6 +56,10 @@ class ContextLimits:
     overrides: tuple[CapsuleRule, ...]
     config_path: Path
     schema_path: Path
+    max_glob_matches: int = DEFAULT_MAX_MATCHES
+    max_include_lines: int | None = None
+    max_mounted_lines: int | None = None
+    max_mounted_bytes: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize configuration for JSON output."""
@@ -62,6 +67,10 @@ class ContextLimits:
             "defaultMaxLines": self.default_max_lines,
             "warningThreshold": self.warning_threshold,
             "forbiddenPaths": list(self.forbidden_paths),
+            "maxGlobMatches": self.max_glob_matches,
+            "maxIncludeLines": self.max_include_lines,
+            "maxMountedLines": self.max_mounted_lines,
+            "maxMountedBytes": self.max_mounted_bytes,
             "artifacts": [
                 {
                     "name": rule.name,
@@ -94,14 +103,35 @@ def load_context_limits(
     config_path: Path | str | None = None,
     schema_path: Path | str | None = None,
 ) -> ContextLimits:
-    """Load and validate the context limit configuration."""
+    """Load and validate the context limit configuration.
+
+    Results are cached per process while the config and schema files keep
+    their mtime and size, so long-lived processes (``sentinel daemon``) see
+    edits without re-parsing on every call.
+    """
 
     repo_root = _resolve_root(root)
     config = _resolve_path(repo_root, config_path or DEFAULT_CONFIG)
     schema = _resolve_path(repo_root, schema_path or DEFAULT_SCHEMA)
+    return _load_limits(config, _file_stamp(config), schema, _file_stamp(schema))
+
+
+FileStamp = tuple[int, int] | None
+
+
+def _file_stamp(path: Path) -> FileStamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
+@lru_cache(maxsize=16)
+def _load_limits(config: Path, config_stamp: FileStamp, schema: Path, schema_stamp: FileStamp) -> ContextLimits:
+    # The stamps are only part of the cache key; failed loads raise and are not cached.
     raw = _read_config(config)
-    validator = _get_validator(schema)
+    validator = _get_validator(schema, schema_stamp)
     _validate_payload(raw, validator, config)
     normalized = _normalize_config(raw)
     return ContextLimits(
@@ -112,6 +142,10 @@ def load_context_limits(
         overrides=normalized["overrides"],
         config_path=config,
         schema_path=schema,
+        max_glob_matches=normalized["max_glob_matches"],
+        max_include_lines=normalized["max_include_lines"],
+        max_mounted_lines=normalized["max_mounted_lines"],
+        max_mounted_bytes=normalized["max_mounted_bytes"],
     )
 
 
@@ -174,7 +208,7 @@ def _read_config(path: Path) -> Mapping[str, Any]:
 
 
 @lru_cache(maxsize=4)
-def _get_validator(schema_path: Path) -> jsonschema.Validator:
+def _get_validator(schema_path: Path, stamp: FileStamp = None) -> jsonschema.Validator:
     try:
         schema_text = schema_path.read_text(encoding="utf-8")
     except OSError as error:
@@ -249,6 +283,10 @@ def _normalize_config(raw: Mapping[str, Any]) -> dict[str, Any]:
         "forbidden_paths": forbidden_paths,
         "artifacts": artifacts,
         "overrides": overrides,
+        "max_glob_matches": int(raw.get("maxGlobMatches", DEFAULT_MAX_MATCHES)),
+        "max_include_lines": int(raw["maxIncludeLines"]) if "maxIncludeLines" in raw else None,
+        "max_mounted_lines": int(raw["maxMountedLines"]) if "maxMountedLines" in raw else None,
+        "max_mounted_bytes": int(raw["maxMountedBytes"]) if "maxMountedBytes" in raw else None,
     }
 
 
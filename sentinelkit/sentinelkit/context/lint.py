@@ -10,7 +10,12 @@ from typing import Iterable, Literal, Sequence
 
 from sentinelkit.context.allowed_context import (
     AllowedContextError,
+    IncludeExpansion,
+    IncludeMatch,
     assert_include_exists,
+    compile_glob,
+    expand_include,
+    extract_allowed_context,
     normalize_include,
 )
 from sentinelkit.context.limits import (
@@ -21,11 +26,12 @@ from sentinelkit.context.limits import (
     load_context_limits,
 )
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
-from sentinelkit.utils.paths import normalize_path
+from sentinelkit.utils.paths import normalize_path, walk_files
 
 __all__ = ["Diagnostic", "LintSummary", "ContextLintError", "lint_context"]
 
 Severity = Literal["error", "warning"]
+HEAVIEST_CONTRIBUTORS = 3
 
 
 @dataclass(slots=True, frozen=True)
@@ -99,21 +105,32 @@ def lint_context(
     root: Path | str | None = None,
     config_path: Path | str | None = None,
     schema_path: Path | str | None = None,
+    limits: ContextLimits | None = None,
+    files: Sequence[str] | None = None,
 ) -> LintSummary:
-    """Run the context linter and return diagnostics."""
+    """Run the context linter and return diagnostics.
+
+    Callers that already loaded the limits, or listed the repository's files
+    (repo-relative POSIX paths, as ``walk_files`` returns them), can pass them
+    in. Otherwise the tree is walked here the same way, skipping the forbidden
+    paths, so every caller matches artifact globs against the same file list.
+    """
 
     repo_root = _resolve_root(root)
-    try:
-        limits = load_context_limits(
-            root=repo_root,
-            config_path=config_path,
-            schema_path=schema_path,
-        )
-    except ContextLimitsError as error:
-        raise ContextLintError(error.payload) from error
+    if limits is None:
+        try:
+            limits = load_context_limits(
+                root=repo_root,
+                config_path=config_path,
+                schema_path=schema_path,
+            )
+        except ContextLimitsError as error:
+            raise ContextLintError(error.payload) from error
 
+    if files is None:
+        files = walk_files(repo_root, skip=limits.forbidden_paths)
     include_filter = _normalize_include_filter(repo_root, capsules)
-    targets = _collect_artifact_targets(repo_root, limits, include_filter)
+    targets = _collect_artifact_targets(repo_root, limits, include_filter, files)
 
     diagnostics: list[Diagnostic] = []
     for target in targets:
@@ -176,6 +193,7 @@ def _collect_artifact_targets(
     root: Path,
     limits: ContextLimits,
     include_filter: set[str] | None,
+    files: Sequence[str],
 ) -> list[_ArtifactTarget]:
     targets: list[_ArtifactTarget] = []
     override_matchers = [
@@ -186,10 +204,7 @@ def _collect_artifact_targets(
     seen: set[str] = set()
     for rule in limits.artifacts:
         for pattern in rule.globs:
-            for path in root.glob(pattern):
-                if not path.is_file():
-                    continue
-                relative = path.resolve().relative_to(root).as_posix()
+            for relative in _match_artifacts(pattern, files):
                 if include_filter and relative not in include_filter:
                     continue
                 if relative in seen:
@@ -199,7 +214,7 @@ def _collect_artifact_targets(
                 targets.append(
                     _ArtifactTarget(
                         rule=rule,
-                        path=path.resolve(),
+                        path=root / relative,
                         relative_path=relative,
                         max_lines=limit,
                     )
@@ -207,6 +222,11 @@ def _collect_artifact_targets(
     return targets
 
 
+def _match_artifacts(pattern: str, files: Sequence[str]) -> list[str]:
+    matcher = compile_glob(normalize_path(pattern))
+    return [relative for relative in files if matcher.fullmatch(relative)]
+
+
 def _resolve_max_lines(
     relative_path: str,
     rule: ContextRule,
@@ -267,7 +287,7 @@ def _evaluate_target(root: Path, target: _ArtifactTarget, limits: ContextLimits)
             )
 
     if target.rule.enforce_allowed_context:
-        entries = _extract_allowed_context(content)
+        entries = extract_allowed_context(content)
         if not entries:
             diagnostics.append(
                 Diagnostic(
@@ -279,69 +299,21 @@ def _evaluate_target(root: Path, target: _ArtifactTarget, limits: ContextLimits)
             )
         else:
             diagnostics.extend(
-                _validate_allowed_context(entries, root, limits.forbidden_paths, target.relative_path)
+                _validate_allowed_context(entries, root, limits, target.relative_path)
             )
 
     return diagnostics
 
 
-def _extract_allowed_context(markdown: str) -> list[str]:
-    section = _extract_section(markdown, "Allowed Context")
-    if not section:
-        return []
-    entries: list[str] = []
-    current: list[str] = []
-    for raw_line in section.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        if _is_list_prefix(line):
-            if current:
-                entries.append(" ".join(current).strip())
-                current.clear()
-            current.append(line.split(maxsplit=1)[1] if " " in line else "")
-        else:
-            if current:
-                current.append(line)
-    if current:
-        entries.append(" ".join(current).strip())
-    return [entry for entry in (entry.strip() for entry in entries) if entry]
-
-
-def _is_list_prefix(line: str) -> bool:
-    return bool(re.match(r"^([-*]|\d+\.)\s+.+", line))
-
-
-def _extract_section(markdown: str, heading: str) -> str:
-    pattern = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
-    lines = markdown.splitlines()
-    capturing = False
-    depth = 0
-    bucket: list[str] = []
-    for raw_line in lines:
-        match = pattern.match(raw_line)
-        if match:
-            title = match.group(2).strip().lower()
-            hashes = len(match.group(1))
-            if title == heading.lower():
-                capturing = True
-                depth = hashes
-                continue
-            if capturing and hashes <= depth:
-                break
-        if capturing:
-            bucket.append(raw_line)
-    return "\n".join(bucket).strip()
-
-
 def _validate_allowed_context(
     entries: Iterable[str],
     root: Path,
-    forbidden: Sequence[str],
+    limits: ContextLimits,
     relative_path: str,
 ) -> list[Diagnostic]:
     diagnostics: list[Diagnostic] = []
     seen: set[str] = set()
+    expansions: list[IncludeExpansion] = []
     for entry in entries:
         try:
             normalized = normalize_include(root, entry)
@@ -367,7 +339,7 @@ def _validate_allowed_context(
                 )
             )
             continue
-        if _is_forbidden(normalized, forbidden):
+        if _is_forbidden(normalized, limits.forbidden_paths):
             diagnostics.append(
                 Diagnostic(
                     path=relative_path,
@@ -385,7 +357,104 @@ def _validate_allowed_context(
                     severity="warning",
                 )
             )
+            continue
         seen.add(normalized)
+        expansion = expand_include(root, normalized, max_matches=limits.max_glob_matches)
+        expansions.append(expansion)
+        diagnostics.extend(_validate_include_volume(expansion, limits, relative_path))
+    diagnostics.extend(_validate_mounted_volume(expansions, limits, relative_path))
+    return diagnostics
+
+
+def _validate_include_volume(
+    expansion: IncludeExpansion,
+    limits: ContextLimits,
+    relative_path: str,
+) -> list[Diagnostic]:
+    """Check what an include actually mounts: glob matches, the match cap, and line budget."""
+    normalized = expansion.pattern
+    diagnostics: list[Diagnostic] = []
+    if not expansion.matches and any(marker in normalized for marker in "*?["):
+        diagnostics.append(
+            Diagnostic(
+                path=relative_path,
+                code="EMPTY_GLOB",
+                message=f"{normalized} matches no files",
+                severity="warning",
+            )
+        )
+    if expansion.truncated:
+        diagnostics.append(
+            Diagnostic(
+                path=relative_path,
+                code="GLOB_MATCH_LIMIT",
+                message=(
+                    f"{normalized} matches more than {limits.max_glob_matches} files; "
+                    "only the first ones are counted"
+                ),
+                severity="warning",
+            )
+        )
+    if limits.max_include_lines is not None and expansion.total_lines > limits.max_include_lines:
+        diagnostics.append(
+            Diagnostic(
+                path=relative_path,
+                code="INCLUDE_MAX_LINES",
+                message=(
+                    f"{normalized} mounts {expansion.total_lines} lines across "
+                    f"{len(expansion.matches)} file(s), over the {limits.max_include_lines} line budget"
+                ),
+                severity="error",
+            )
+        )
+    return diagnostics
+
+
+def _validate_mounted_volume(
+    expansions: Sequence[IncludeExpansion],
+    limits: ContextLimits,
+    relative_path: str,
+) -> list[Diagnostic]:
+    """Total every file the capsule mounts (each counted once) against the aggregate budgets."""
+    if limits.max_mounted_lines is None and limits.max_mounted_bytes is None:
+        return []
+    files: dict[str, IncludeMatch] = {}
+    for expansion in expansions:
+        for match in expansion.matches:
+            files.setdefault(match.relative_path, match)
+    total_lines = sum(match.line_count for match in files.values())
+    total_bytes = sum(match.byte_size for match in files.values())
+
+    diagnostics: list[Diagnostic] = []
+    checks = (
+        ("MOUNTED_MAX_LINES", "lines", total_lines, limits.max_mounted_lines, lambda match: match.line_count),
+        ("MOUNTED_MAX_BYTES", "bytes", total_bytes, limits.max_mounted_bytes, lambda match: match.byte_size),
+    )
+    for code, unit, total, budget, weight in checks:
+        if budget is None:
+            continue
+        ratio = total / budget
+        if ratio > 1:
+            severity: Severity = "error"
+            summary = f"mounts {total} {unit} from {len(files)} file(s), over the budget of {budget}"
+        elif ratio >= limits.warning_threshold:
+            code = "MOUNTED_NEAR_LIMIT"
+            severity = "warning"
+            summary = f"mounts {total} {unit}, {ratio * 100:.1f}% of the budget of {budget}"
+        else:
+            continue
+        heaviest = sorted(files.values(), key=lambda match: (-weight(match), match.relative_path))
+        contributors = ", ".join(
+            f"{match.relative_path} ({weight(match)})" for match in heaviest[:HEAVIEST_CONTRIBUTORS]
+        )
+        diagnostics.append(
+            Diagnostic(
+                path=relative_path,
+                code=code,
+                message=f"{summary}; heaviest: {contributors}",
+                severity=severity,
+            )
+        )
     return diagnostics
 
 
@@ -0,0 +1,247 @@
+"""Materialize Allowed Context entries into budgeted, deduplicated file contents."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from sentinelkit.context.allowed_context import (
+    DEFAULT_MAX_MATCHES,
+    AllowedContextError,
+    assert_include_exists,
+    expand_include,
+    extract_allowed_context,
+    normalize_include,
+)
+from sentinelkit.utils.errors import build_error_payload
+
+__all__ = [
+    "ContextMount",
+    "MountResult",
+    "MountedFile",
+    "ReadCache",
+    "approx_tokens",
+    "shared_read_cache",
+]
+
+CHARS_PER_TOKEN = 4
+
+
+def approx_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for mount budgets."""
+    return _tokens_for(len(text))
+
+
+def _tokens_for(chars: int) -> int:
+    return (chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedRead:
+    mtime_ns: int
+    size: int
+    text: str | None
+
+
+class ReadCache:
+    """Thread-safe cache of decoded file contents validated by mtime and size.
+
+    Binary (non UTF-8) files are cached as ``None`` so they are skipped without
+    being decoded again.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _CachedRead] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path) -> str | None:
+        stat = path.stat()
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                self.hits += 1
+                return cached.text
+        try:
+            text: str | None = path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            text = None
+        with self._lock:
+            self._entries[path] = _CachedRead(mtime_ns=stat.st_mtime_ns, size=stat.st_size, text=text)
+            self.misses += 1
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+shared_read_cache = ReadCache()
+
+
+@dataclass(slots=True, frozen=True)
+class MountedFile:
+    """One mounted file; ``content`` holds at most ``line_count`` lines."""
+
+    path: str
+    content: str
+    line_count: int
+    total_lines: int
+    truncated: bool = False
+
+    def to_dict(self, *, include_content: bool = True) -> dict[str, object]:
+        data: dict[str, object] = {
+            "path": self.path,
+            "lineCount": self.line_count,
+            "totalLines": self.total_lines,
+            "truncated": self.truncated,
+        }
+        if include_content:
+            data["content"] = self.content
+        return data
+
+
+@dataclass(slots=True)
+class MountResult:
+    """Materialized Allowed Context in mount order."""
+
+    files: list[MountedFile] = field(default_factory=list)
+    omitted: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    capped: list[str] = field(default_factory=list)
+    total_lines: int = 0
+    total_tokens: int = 0
+
+    @property
+    def truncated(self) -> bool:
+        return bool(self.omitted) or any(item.truncated for item in self.files)
+
+    def to_dict(self, *, include_content: bool = True) -> dict[str, object]:
+        return {
+            "files": [item.to_dict(include_content=include_content) for item in self.files],
+            "omitted": list(self.omitted),
+            "skipped": list(self.skipped),
+            "errors": list(self.errors),
+            "capped": list(self.capped),
+            "totalLines": self.total_lines,
+            "approxTokens": self.total_tokens,
+            "truncated": self.truncated,
+        }
+
+
+class ContextMount:
+    """Resolve Allowed Context entries and load their contents under a budget.
+
+    Entries are expanded in the order given (directories and globs in sorted path
+    order) and each file is mounted once, at its first occurrence. Files are added
+    whole until the next one would exceed ``max_lines`` or ``max_tokens``; that
+    file is cut at the last line that still fits and every later file is listed
+    in ``omitted``. The same inputs therefore always produce the same mount.
+    Entries that match more than ``max_matches`` files are listed in ``capped``.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        max_lines: int | None = None,
+        max_tokens: int | None = None,
+        read_cache: ReadCache | None = None,
+        max_matches: int = DEFAULT_MAX_MATCHES,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.max_matches = max_matches
+        self.max_lines = max_lines
+        self.max_tokens = max_tokens
+        self.read_cache = read_cache or shared_read_cache
+
+    def mount(self, entries: Sequence[str]) -> MountResult:
+        result = MountResult()
+        budget_hit = False
+        for relative in self._resolve_files(entries, result):
+            if budget_hit:
+                result.omitted.append(relative)
+                continue
+            try:
+                text = self.read_cache.read(self.root / relative)
+            except OSError as error:
+                result.errors.append(f"{relative}: {error}")
+                continue
+            if text is None:
+                result.skipped.append(relative)
+                continue
+            mounted = self._fit(relative, text, result)
+            if mounted is None:
+                budget_hit = True
+                result.omitted.append(relative)
+                continue
+            result.files.append(mounted)
+            result.total_lines += mounted.line_count
+            result.total_tokens += approx_tokens(mounted.content)
+            budget_hit = mounted.truncated
+        return result
+
+    def mount_capsule(self, capsule_path: Path | str) -> MountResult:
+        """Mount the Allowed Context listed in a capsule markdown file."""
+        path = Path(capsule_path)
+        absolute = path if path.is_absolute() else self.root / path
+        try:
+            markdown = absolute.read_text(encoding="utf-8")
+        except OSError as error:
+            raise AllowedContextError(
+                build_error_payload(
+                    code="ALLOWED_CONTEXT_READ",
+                    message=f"Unable to read capsule '{capsule_path}': {error}",
+                )
+            ) from error
+        return self.mount(extract_allowed_context(markdown))
+
+    def _resolve_files(self, entries: Iterable[str], result: MountResult) -> list[str]:
+        ordered: dict[str, None] = {}
+        for raw in entries:
+            try:
+                normalized = normalize_include(self.root, raw)
+                assert_include_exists(self.root, normalized)
+            except AllowedContextError as error:
+                result.errors.append(f"{raw}: {error}")
+                continue
+            expansion = expand_include(self.root, normalized, max_matches=self.max_matches)
+            if expansion.truncated:
+                result.capped.append(normalized)
+            for match in expansion.matches:
+                ordered.setdefault(match.relative_path, None)
+        return list(ordered)
+
+    def _fit(self, relative: str, text: str, result: MountResult) -> MountedFile | None:
+        lines = text.splitlines(keepends=True)
+        total = len(lines)
+        line_room = None if self.max_lines is None else self.max_lines - result.total_lines
+        token_room = None if self.max_tokens is None else self.max_tokens - result.total_tokens
+        fits_lines = line_room is None or total <= line_room
+        fits_tokens = token_room is None or approx_tokens(text) <= token_room
+        if fits_lines and fits_tokens:
+            return MountedFile(path=relative, content=text, line_count=total, total_lines=total)
+
+        keep = total if line_room is None else max(0, min(total, line_room))
+        if token_room is not None:
+            chars = 0
+            for index in range(keep):
+                chars += len(lines[index])
+                if _tokens_for(chars) > token_room:
+                    keep = index
+                    break
+        if keep == 0:
+            return None
+        return MountedFile(
+            path=relative,
+            content="".join(lines[:keep]),
+            line_count=keep,
+            total_lines=total,
+            truncated=True,
+        )
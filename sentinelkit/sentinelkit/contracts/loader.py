@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterator
@@ -11,6 +12,9 @@ import yaml
 
 __all__ = ["ContractLoader", "ContractSchema"]
 
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+_YAML_LOCK = threading.Lock()
+
 
 @dataclass(slots=True)
 class ContractSchema:
@@ -39,17 +43,19 @@ class ContractLoader:
         if not force_reload and self._schema_cache:
             return self._schema_cache
 
-        self._schema_cache.clear()
         if not self.contracts_dir.exists():
             raise FileNotFoundError(f"Contracts directory not found: {self.contracts_dir}")
 
+        # Built aside and swapped in whole, so a concurrent caller never sees a partial cache.
+        schemas: Dict[str, ContractSchema] = {}
         for file_path in sorted(self.contracts_dir.glob("*.yaml")):
             schema = self._load_yaml(file_path)
             name = schema.get("contract") or file_path.stem
             definition = schema.get("schema") or schema
-            self._schema_cache[name] = ContractSchema(name=name, schema=definition, path=file_path)
+            schemas[name] = ContractSchema(name=name, schema=definition, path=file_path)
 
-        return self._schema_cache
+        self._schema_cache = schemas
+        return schemas
 
     def get_schema(self, contract_id: str, *, force_reload: bool = False) -> ContractSchema:
         schemas = self.load_schemas(force_reload=force_reload)
@@ -111,10 +117,23 @@ class ContractLoader:
 
     @staticmethod
     def _load_yaml(path: Path) -> dict:
+        """Parse a schema file, reusing the process-wide parse while (mtime, size) is unchanged.
+
+        Parsed schemas are shared between loaders and must be treated as read-only.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _YAML_LOCK:
+            cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         try:
-            return yaml.safe_load(path.read_text()) or {}
+            parsed = yaml.safe_load(path.read_text()) or {}
         except yaml.YAMLError as exc:
             raise ValueError(f"Failed to parse YAML schema '{path}': {exc}") from exc
+        with _YAML_LOCK:
+            _YAML_CACHE[path] = (stamp, parsed)
+        return parsed
 
     @staticmethod
     def load_fixture(path: Path) -> dict:
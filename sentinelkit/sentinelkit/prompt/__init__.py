@@ -1,5 +1,5 @@
 """Prompt rendering namespace."""
 
-from .render import PromptRenderer, PromptRenderingError
+from .render import PromptBundle, PromptRenderer, PromptRenderingError
 
-__all__ = ["PromptRenderer", "PromptRenderingError"]
+__all__ = ["PromptBundle", "PromptRenderer", "PromptRenderingError"]
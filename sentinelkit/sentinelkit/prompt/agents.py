@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 import json
+import os
 from pathlib import Path
+import threading
 
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
 
-__all__ = ["AgentRegistry", "load_agents"]
+__all__ = ["AgentRegistry", "AgentRegistryCache", "AgentRegistryCacheStats", "load_agents", "registry_cache"]
 
 
 class AgentRegistryError(SentinelKitError):
@@ -33,8 +35,83 @@ class AgentRegistry:
     lookup: dict[str, AgentMetadata]
 
 
+@dataclass(slots=True)
+class AgentRegistryCacheStats:
+    """Counters describing how often the cached registry was reused or rebuilt."""
+
+    hits: int = 0
+    reloads: int = 0
+    last_reload_reason: str | None = None
+
+
+@dataclass(slots=True)
+class _CachedRegistry:
+    registry: AgentRegistry
+    listing: tuple[str, ...]
+    sources: dict[Path, tuple[int, int] | None] = field(default_factory=dict)
+
+
+class AgentRegistryCache:
+    """Process-wide cache of parsed agent registries keyed by repository root.
+
+    A cached registry is reused while the ``.sentinel/agents`` listing and the
+    (mtime, size) of every file it was built from (``agent.json`` plus the
+    ROLE/PLAYBOOK prompts) are unchanged, so a hit costs one directory scan and a
+    handful of ``stat`` calls instead of re-reading and parsing every agent.
+    Failed loads are never cached.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _CachedRegistry] = {}
+        self._stats = AgentRegistryCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, root: Path | str) -> AgentRegistry:
+        root_path = Path(root).resolve()
+        agents_dir = root_path / ".sentinel/agents"
+        listing = _list_agent_dirs(agents_dir)
+        with self._lock:
+            cached = self._entries.get(root_path)
+        if cached is not None:
+            reason = _staleness(cached, listing)
+            if reason is None:
+                with self._lock:
+                    self._stats.hits += 1
+                return cached.registry
+        else:
+            reason = "cold"
+
+        # Stamps are taken before each file is read, so an edit racing the load
+        # only causes one extra reload later, never a stale hit.
+        sources: dict[Path, tuple[int, int] | None] = {}
+        registry = _load_registry(root_path, sources)
+        entry = _CachedRegistry(registry=registry, listing=listing, sources=sources)
+        with self._lock:
+            self._entries[root_path] = entry
+            self._stats.reloads += 1
+            self._stats.last_reload_reason = reason
+        return registry
+
+    def stats(self) -> AgentRegistryCacheStats:
+        """Return a snapshot of the hit/reload counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = AgentRegistryCacheStats()
+
+
+registry_cache = AgentRegistryCache()
+
+
 def load_agents(*, root: Path | str) -> AgentRegistry:
-    root_path = Path(root).resolve()
+    """Parse every agent under ``.sentinel/agents`` (uncached; see ``registry_cache``)."""
+    return _load_registry(Path(root).resolve(), None)
+
+
+def _load_registry(root_path: Path, sources: dict[Path, tuple[int, int] | None] | None) -> AgentRegistry:
     agents_dir = root_path / ".sentinel/agents"
     if not agents_dir.exists():
         raise AgentRegistryError(
@@ -50,7 +127,7 @@ def load_agents(*, root: Path | str) -> AgentRegistry:
         if not entry.is_dir():
             continue
         try:
-            agents.append(_load_agent(entry, root_path))
+            agents.append(_load_agent(entry, root_path, sources))
         except AgentRegistryError as error:
             errors.append(f"[{entry.name}] {error.payload.message}")
 
@@ -63,8 +140,39 @@ def load_agents(*, root: Path | str) -> AgentRegistry:
     return AgentRegistry(agents=agents, lookup=lookup)
 
 
-def _load_agent(agent_dir: Path, root: Path) -> AgentMetadata:
+def _list_agent_dirs(agents_dir: Path) -> tuple[str, ...]:
+    try:
+        with os.scandir(agents_dir) as entries:
+            return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+    except OSError:
+        return ()
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _staleness(cached: _CachedRegistry, listing: tuple[str, ...]) -> str | None:
+    if listing != cached.listing:
+        return "listing_changed"
+    for path, stamp in cached.sources.items():
+        if _stamp(path) != stamp:
+            return "file_changed"
+    return None
+
+
+def _load_agent(
+    agent_dir: Path,
+    root: Path,
+    sources: dict[Path, tuple[int, int] | None] | None = None,
+) -> AgentMetadata:
     config_path = agent_dir / "agent.json"
+    if sources is not None:
+        sources[config_path] = _stamp(config_path)
     try:
         config = json.loads(config_path.read_text(encoding="utf-8"))
     except OSError as error:
@@ -103,6 +211,8 @@ def _load_agent(agent_dir: Path, root: Path) -> AgentMetadata:
             build_error_payload(code="agents.prompts_invalid", message="prompt_files must be an array of strings.")
         )
 
+    if sources is not None:
+        sources.update((root / path, _stamp(root / path)) for path in prompt_files)
     prompts = [_read_prompt(root / path) for path in prompt_files]
     role = _find_prompt(prompts, "ROLE.md")
     playbook = _find_prompt(prompts, "PLAYBOOK.md")
@@ -0,0 +1,130 @@
+"""Shared Jinja environments with bytecode caching and optional precompiled templates."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
+
+__all__ = ["COMPILED_DIRNAME", "clear_environments", "compile_templates", "default_cache_dir", "get_environment"]
+
+COMPILED_DIRNAME = "_compiled"
+MANIFEST_NAME = "manifest.json"
+
+_ENVIRONMENTS: dict[tuple[Path, Path | None], Environment] = {}
+_LOCK = threading.Lock()
+
+
+def default_cache_dir(root: Path) -> Path:
+    """Return the per-repository bytecode cache location (``.sentinel/cache/jinja``)."""
+    return root / ".sentinel" / "cache" / "jinja"
+
+
+def get_environment(template_dir: Path | str, *, cache_dir: Path | str | None = None) -> Environment:
+    """Return the process-wide environment for *template_dir*, creating it on first use.
+
+    Templates compile once per process (Jinja keeps them in its own LRU cache) and
+    once per checkout when *cache_dir* is given, because compiled bytecode is
+    stored there keyed by source checksum. A ``_compiled`` directory produced by
+    :func:`compile_templates` is preferred while its manifest still matches the
+    sources and the installed Jinja version.
+    """
+    directory = Path(template_dir).resolve()
+    cache_path = Path(cache_dir).resolve() if cache_dir else None
+    key = (directory, cache_path)
+    with _LOCK:
+        env = _ENVIRONMENTS.get(key)
+        if env is None:
+            env = _build_environment(_build_loader(directory), _bytecode_cache(cache_path))
+            _ENVIRONMENTS[key] = env
+        return env
+
+
+def compile_templates(template_dir: Path | str, target: Path | str | None = None) -> Path:
+    """Precompile every template in *template_dir* into importable modules.
+
+    Intended for packaging: run it before building a wheel so installs never
+    compile templates at all. Returns the directory holding the modules.
+    """
+    directory = Path(template_dir).resolve()
+    output = Path(target) if target else directory / COMPILED_DIRNAME
+    output.mkdir(parents=True, exist_ok=True)
+    env = _build_environment(FileSystemLoader(str(directory)), None)
+    names = env.list_templates(filter_func=_is_source)
+    env.compile_templates(str(output), zip=None, filter_func=_is_source, ignore_errors=False)
+    manifest = {"jinja2": jinja2.__version__, "templates": _source_hashes(directory, names)}
+    (output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return output
+
+
+def clear_environments() -> None:
+    """Drop every shared environment (tests and template hot-swaps)."""
+    with _LOCK:
+        _ENVIRONMENTS.clear()
+
+
+def _build_environment(loader: BaseLoader, bytecode_cache: FileSystemBytecodeCache | None) -> Environment:
+    return Environment(
+        loader=loader,
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+def _build_loader(directory: Path) -> BaseLoader:
+    source_loader = FileSystemLoader(str(directory))
+    compiled = directory / COMPILED_DIRNAME
+    if _manifest_is_current(compiled, directory):
+        return ChoiceLoader([ModuleLoader(str(compiled)), source_loader])
+    return source_loader
+
+
+def _bytecode_cache(cache_dir: Path | None) -> FileSystemBytecodeCache | None:
+    if cache_dir is None:
+        return None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Read-only checkouts still render; they just recompile per process.
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
+
+
+def _manifest_is_current(compiled: Path, directory: Path) -> bool:
+    try:
+        manifest = json.loads((compiled / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get("jinja2") != jinja2.__version__:
+        return False
+    recorded = manifest.get("templates")
+    if not isinstance(recorded, dict):
+        return False
+    return recorded == _source_hashes(directory, list(recorded))
+
+
+def _is_source(name: str) -> bool:
+    return not name.startswith(f"{COMPILED_DIRNAME}/")
+
+
+def _source_hashes(directory: Path, names: list[str]) -> dict[str, str | None]:
+    hashes: dict[str, str | None] = {}
+    for name in names:
+        try:
+            hashes[name] = hashlib.sha256((directory / name).read_bytes()).hexdigest()
+        except OSError:
+            hashes[name] = None
+    return hashes
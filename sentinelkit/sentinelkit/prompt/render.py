@@ -5,16 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
 
 from sentinelkit.context.lint import lint_context
+from sentinelkit.context.mount import ContextMount, MountResult
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
 
 from . import agents as agent_loader
+from .environment import default_cache_dir, get_environment
 
-__all__ = ["PromptRenderer", "PromptRenderingError"]
+__all__ = ["PromptBundle", "PromptRenderer", "PromptRenderingError", "normalized_chunks"]
 
 TEMPLATE_DIR = Path(__file__).with_name("templates")
 
@@ -28,6 +30,16 @@ class CapsuleContext:
     path: str
     content: str
     allowed_context: list[str]
+    mounted: MountResult | None = None
+
+
+@dataclass(slots=True)
+class PromptBundle:
+    """Router prompt plus per-agent prompts rendered from one capsule pass."""
+
+    capsule: CapsuleContext
+    router: str
+    agents: dict[str, str]
 
 
 class PromptRenderer:
@@ -40,38 +52,86 @@ class PromptRenderer:
         template_dir: Path | str | None = None,
         config_path: Path | str | None = None,
         schema_path: Path | str | None = None,
+        bytecode_cache: bool = True,
+        context_mount: ContextMount | None = None,
     ) -> None:
         self.root = Path(root).resolve()
         self.config_path = Path(config_path) if config_path else None
         self.schema_path = Path(schema_path) if schema_path else None
         directory = Path(template_dir) if template_dir else TEMPLATE_DIR
-        self.env = Environment(
-            loader=FileSystemLoader(str(directory)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.context_mount = context_mount
+        self.env = get_environment(directory, cache_dir=default_cache_dir(self.root) if bytecode_cache else None)
 
     def render_router_prompt(self, capsule_path: Path | str) -> str:
+        return "".join(self.stream_router_prompt(capsule_path))
+
+    def render_agent_prompt(self, capsule_path: Path | str, agent_id: str) -> str:
+        return "".join(self.stream_agent_prompt(capsule_path, agent_id))
+
+    def stream_router_prompt(self, capsule_path: Path | str) -> Iterator[str]:
+        """Return the router prompt as normalized chunks from ``template.generate()``.
+
+        Validation (lint, registry, router lookup) happens before this returns, so
+        errors surface before any output is written.
+        """
+        capsule = self._build_capsule_context(capsule_path)
+        registry = agent_loader.registry_cache.get(self.root)
+        return self._stream_router(capsule, registry)
+
+    def stream_agent_prompt(self, capsule_path: Path | str, agent_id: str) -> Iterator[str]:
+        """Return an agent prompt as normalized chunks (see ``stream_router_prompt``)."""
+        capsule = self._build_capsule_context(capsule_path)
+        registry = agent_loader.registry_cache.get(self.root)
+        return self._stream_agent(capsule, registry, agent_id)
+
+    def render_bundle(self, capsule_path: Path | str, agents: Sequence[str] | None = None) -> PromptBundle:
+        """Render the router prompt plus one prompt per agent from a single capsule pass.
+
+        The capsule is linted, read, and parsed once and the registry is fetched
+        once. ``agents`` defaults to every non-router agent in roster order.
+        """
         capsule = self._build_capsule_context(capsule_path)
-        registry = agent_loader.load_agents(root=self.root)
+        registry = agent_loader.registry_cache.get(self.root)
+        agent_ids = list(agents) if agents is not None else [
+            agent.id for agent in registry.agents if agent.id.lower() != "router"
+        ]
+        return PromptBundle(
+            capsule=capsule,
+            router="".join(self._stream_router(capsule, registry)),
+            agents={agent_id: "".join(self._stream_agent(capsule, registry, agent_id)) for agent_id in agent_ids},
+        )
+
+    def write_router_log(self, capsule_path: Path | str, payload_path: Path | str) -> Path:
+        payload = self._read_router_payload(payload_path)
+        self._validate_router_payload(payload)
+        capsule_abs = self._resolve_path(capsule_path)
+        capsule_rel = self._relative_path(capsule_abs)
+        log_dir = (self.root / ".sentinel/router_log").resolve()
+        log_dir.mkdir(parents=True, exist_ok=True)
+        slug = capsule_abs.parent.name or capsule_abs.stem
+        timestamp = self._timestamp()
+        log_path = log_dir / f"{timestamp}-{slug}.jsonl"
+        record = {"timestamp": timestamp, "capsule": capsule_rel, "payload": payload}
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record))
+            handle.write("\n")
+        return log_path
+
+    # Internal helpers -----------------------------------------------------
+
+    def _stream_router(self, capsule: CapsuleContext, registry: agent_loader.AgentRegistry) -> Iterator[str]:
         router_agent = registry.lookup.get("router")
         if router_agent is None:
             raise PromptRenderingError(
                 build_error_payload(code="prompts.router_missing", message="Router agent is not defined.")
             )
         template = self._get_template("router.md.j2")
-        capsule_data = {
-            "path": capsule.path,
-            "content": capsule.content,
-            "allowed_context": capsule.allowed_context,
-        }
         payload = {
             "router": {
                 "role": router_agent.role,
                 "playbook": router_agent.playbook,
             },
-            "capsule": capsule_data,
+            "capsule": _capsule_data(capsule),
             "agents": [
                 {
                     "id": agent.id,
@@ -83,11 +143,11 @@ class PromptRenderer:
                 for agent in registry.agents
             ],
         }
-        return template.render(**payload).strip() + "\n"
+        return normalized_chunks(template.generate(**payload))
 
-    def render_agent_prompt(self, capsule_path: Path | str, agent_id: str) -> str:
-        capsule = self._build_capsule_context(capsule_path)
-        registry = agent_loader.load_agents(root=self.root)
+    def _stream_agent(
+        self, capsule: CapsuleContext, registry: agent_loader.AgentRegistry, agent_id: str
+    ) -> Iterator[str]:
         agent = registry.lookup.get(agent_id.lower())
         if agent is None:
             raise PromptRenderingError(
@@ -97,11 +157,6 @@ class PromptRenderer:
                 )
             )
         template = self._get_template("agent.md.j2")
-        capsule_data = {
-            "path": capsule.path,
-            "content": capsule.content,
-            "allowed_context": capsule.allowed_context,
-        }
         payload = {
             "agent": {
                 "id": agent.id,
@@ -111,27 +166,9 @@ class PromptRenderer:
                 "playbook": agent.playbook,
                 "mount_paths": agent.mount_paths,
             },
-            "capsule": capsule_data,
+            "capsule": _capsule_data(capsule),
         }
-        return template.render(**payload).strip() + "\n"
-
-    def write_router_log(self, capsule_path: Path | str, payload_path: Path | str) -> Path:
-        payload = self._read_router_payload(payload_path)
-        self._validate_router_payload(payload)
-        capsule_abs = self._resolve_path(capsule_path)
-        capsule_rel = self._relative_path(capsule_abs)
-        log_dir = (self.root / ".sentinel/router_log").resolve()
-        log_dir.mkdir(parents=True, exist_ok=True)
-        slug = capsule_abs.parent.name or capsule_abs.stem
-        timestamp = self._timestamp()
-        log_path = log_dir / f"{timestamp}-{slug}.jsonl"
-        record = {"timestamp": timestamp, "capsule": capsule_rel, "payload": payload}
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record))
-            handle.write("\n")
-        return log_path
-
-    # Internal helpers -----------------------------------------------------
+        return normalized_chunks(template.generate(**payload))
 
     def _build_capsule_context(self, capsule_path: Path | str) -> CapsuleContext:
         capsule_abs = self._resolve_path(capsule_path)
@@ -139,7 +176,8 @@ class PromptRenderer:
         self._lint_capsule(capsule_rel)
         text = capsule_abs.read_text(encoding="utf-8")
         allowed = self._extract_allowed_context(text)
-        return CapsuleContext(path=capsule_rel, content=text.strip(), allowed_context=allowed)
+        mounted = self.context_mount.mount(allowed) if self.context_mount else None
+        return CapsuleContext(path=capsule_rel, content=text.strip(), allowed_context=allowed, mounted=mounted)
 
     def _lint_capsule(self, capsule_rel: str) -> None:
         summary = lint_context(
@@ -252,3 +290,37 @@ class PromptRenderer:
         from datetime import datetime, timezone
 
         return datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+
+def _capsule_data(capsule: CapsuleContext) -> dict[str, object]:
+    return {
+        "path": capsule.path,
+        "content": capsule.content,
+        "allowed_context": capsule.allowed_context,
+        "mounted": capsule.mounted,
+    }
+
+
+def normalized_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield *chunks* as ``"".join(chunks).strip() + "\\n"`` without joining them.
+
+    Leading whitespace is dropped until the first visible character; trailing
+    whitespace is held back until more content proves it is interior, so only
+    whitespace runs are ever buffered.
+    """
+    started = False
+    pending = ""
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        body = chunk.rstrip()
+        if body:
+            yield pending + body
+            pending = chunk[len(body) :]
+        else:
+            pending += chunk
+    yield "\n"
+
@@ -1,5 +1,19 @@
 """Runbook utilities."""
 
-from .updater import RunbookSection, RunbookUpdateResult, RunbookUpdater
+from .updater import (
+    RunbookCompactResult,
+    RunbookNote,
+    RunbookRetention,
+    RunbookSection,
+    RunbookUpdater,
+    RunbookUpdateResult,
+)
 
-__all__ = ["RunbookSection", "RunbookUpdateResult", "RunbookUpdater"]
+__all__ = [
+    "RunbookCompactResult",
+    "RunbookNote",
+    "RunbookRetention",
+    "RunbookSection",
+    "RunbookUpdateResult",
+    "RunbookUpdater",
+]
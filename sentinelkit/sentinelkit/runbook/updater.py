@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
+
+import portalocker
+from portalocker import exceptions as portalocker_exceptions
 
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
+from sentinelkit.utils.io import atomic_write_text
+from sentinelkit.utils.journal import Journal
 
-__all__ = ["RunbookSection", "RunbookUpdateResult", "RunbookUpdater"]
+__all__ = [
+    "DEFAULT_RETENTION",
+    "RunbookCompactResult",
+    "RunbookNote",
+    "RunbookRetention",
+    "RunbookSection",
+    "RunbookUpdateResult",
+    "RunbookUpdater",
+]
 
 
 @dataclass(slots=True)
@@ -29,6 +44,16 @@ class RunbookSection:
         return f"- _No entries yet. Use `sentinel runbook append --section {self.slug} --note ...`_"
 
 
+@dataclass(slots=True)
+class RunbookNote:
+    """A note to add through :meth:`RunbookUpdater.append_many`."""
+
+    section: str
+    note: str
+    author: str
+    timestamp: datetime | None = None
+
+
 @dataclass(slots=True)
 class RunbookUpdateResult:
     """Details about an applied (or previewed) runbook update."""
@@ -42,6 +67,37 @@ class RunbookUpdateResult:
     dry_run: bool
     output_path: Path | None
     content: str
+    archived: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class RunbookRetention:
+    """Which notes stay in IMPLEMENTATION.md; the rest move to quarterly archives.
+
+    ``keep_per_section`` keeps the newest N notes of each section and
+    ``max_age_days`` archives notes older than that. ``max_bytes`` makes
+    ``append``/``flush`` apply the policy automatically once the runbook grows
+    past that size, so appends keep rewriting a bounded file.
+    """
+
+    keep_per_section: int | None = None
+    max_age_days: int | None = None
+    max_bytes: int | None = None
+
+    @property
+    def archives_anything(self) -> bool:
+        return self.keep_per_section is not None or self.max_age_days is not None
+
+
+@dataclass(slots=True)
+class RunbookCompactResult:
+    """Outcome of moving old notes into the quarterly archives."""
+
+    path: Path
+    archived: int
+    archives: dict[Path, int] = field(default_factory=dict)
+    dry_run: bool = False
+    wrote_file: bool = False
 
 
 class RunbookUpdaterError(SentinelKitError):
@@ -79,13 +135,32 @@ SECTION_ORDER: tuple[RunbookSection, ...] = (
 SECTION_REGISTRY = {section.slug: section for section in SECTION_ORDER}
 
 DEFAULT_RUNBOOK_HEADER = "# Implementation Notes"
+ARCHIVE_DIRNAME = "archive"
+DEFAULT_RETENTION = RunbookRetention(keep_per_section=50, max_bytes=64 * 1024)
+NOTE_PATTERN = re.compile(r"^- \[(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2})Z\] \(")
 
 
 class RunbookUpdater:
     """Append structured notes to IMPLEMENTATION.md sections."""
 
-    def __init__(self, path: Path | str = Path(".sentinel/docs/IMPLEMENTATION.md")) -> None:
+    def __init__(
+        self,
+        path: Path | str = Path(".sentinel/docs/IMPLEMENTATION.md"),
+        *,
+        lock_timeout: float = 10.0,
+        journal_path: Path | str | None = None,
+        retention: RunbookRetention | None = None,
+        archive_dir: Path | str | None = None,
+    ) -> None:
         self.path = Path(path)
+        self.retention = retention
+        self.archive_dir = Path(archive_dir) if archive_dir else self.path.parent / ARCHIVE_DIRNAME
+        self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        self.lock_timeout = lock_timeout
+        self.journal = Journal(
+            journal_path or self.path.with_suffix(self.path.suffix + ".journal"),
+            lock_timeout=lock_timeout,
+        )
 
     def append(
         self,
@@ -97,20 +172,131 @@ class RunbookUpdater:
         dry_run: bool = False,
         output_path: Path | str | None = None,
     ) -> RunbookUpdateResult:
-        target = _get_section(section)
-        normalized_note = _normalize_text(note, "note")
-        normalized_author = _normalize_text(author, "author")
-        timestamp_value = timestamp or datetime.now(timezone.utc)
-        timestamp_str = timestamp_value.strftime("%Y-%m-%d %H:%MZ")
-
-        content = self._read_or_initialize()
-        ensured = _ensure_sections(content)
-        updated = _insert_note(
-            ensured,
-            section=target,
-            note_line=_format_note(timestamp_str, normalized_author, normalized_note),
+        pending = _prepare_note(section=section, note=note, author=author, timestamp=timestamp)
+        with self._locked():
+            return self._apply([pending], dry_run=dry_run, output_path=output_path)[0]
+
+    def append_many(
+        self,
+        notes: Sequence[RunbookNote],
+        *,
+        dry_run: bool = False,
+        output_path: Path | str | None = None,
+    ) -> list[RunbookUpdateResult]:
+        """Insert *notes* (in order, across any sections) with one read and one write.
+
+        Every note is validated before the runbook is touched, so a bad entry leaves
+        the file unchanged.
+        """
+        if not notes:
+            raise RunbookUpdaterError(
+                build_error_payload(code="runbook.empty_batch", message="No runbook notes provided to append.")
+            )
+        pending = [
+            _prepare_note(section=item.section, note=item.note, author=item.author, timestamp=item.timestamp)
+            for item in notes
+        ]
+        with self._locked():
+            return self._apply(pending, dry_run=dry_run, output_path=output_path)
+
+    def enqueue(
+        self,
+        *,
+        section: str,
+        note: str,
+        author: str,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Validate a note and queue it in the journal without rewriting the runbook."""
+        pending = _prepare_note(section=section, note=note, author=author, timestamp=timestamp)
+        self.journal.append(
+            {
+                "section": pending.section.slug,
+                "timestamp": pending.timestamp,
+                "author": pending.author,
+                "note": pending.note,
+            }
         )
 
+    def flush(self) -> list[RunbookUpdateResult]:
+        """Compact every journaled note into the runbook with a single write."""
+        with self._locked(), self.journal.pending() as records:
+            if not records:
+                return []
+            notes = [
+                _PendingNote(
+                    section=_get_section(str(record.get("section", ""))),
+                    timestamp=_normalize_text(record.get("timestamp"), "timestamp"),
+                    author=_normalize_text(record.get("author"), "author"),
+                    note=_normalize_text(record.get("note"), "note"),
+                )
+                for record in records
+            ]
+            return self._apply(notes, dry_run=False, output_path=None)
+
+    def compact(
+        self,
+        retention: RunbookRetention | None = None,
+        *,
+        now: datetime | None = None,
+        dry_run: bool = False,
+    ) -> RunbookCompactResult:
+        """Move notes outside *retention* into ``archive/IMPLEMENTATION-YYYY-Qn.md``.
+
+        Archives are written before the runbook, and notes already present in an
+        archive are not added twice, so an interrupted compaction is safe to rerun.
+        Notes without a parseable timestamp always stay in the runbook.
+        """
+        policy = retention or self.retention
+        if policy is None or not policy.archives_anything:
+            raise RunbookUpdaterError(
+                build_error_payload(
+                    code="runbook.invalid_retention",
+                    message="Compaction needs keep_per_section or max_age_days.",
+                    remediation="Pass --keep and/or --max-age-days.",
+                )
+            )
+        with self._locked():
+            if not self.path.exists():
+                return RunbookCompactResult(path=self.path, archived=0, dry_run=dry_run)
+            index = _SectionIndex.parse(self.path.read_text(encoding="utf-8"))
+            archives = self._rotate(index, policy, now=now, dry_run=dry_run)
+            archived = sum(archives.values())
+            wrote_file = bool(archived) and not dry_run
+            if wrote_file:
+                atomic_write_text(self.path, index.render())
+            return RunbookCompactResult(
+                path=self.path,
+                archived=archived,
+                archives=archives,
+                dry_run=dry_run,
+                wrote_file=wrote_file,
+            )
+
+    def _apply(
+        self,
+        notes: list[_PendingNote],
+        *,
+        dry_run: bool,
+        output_path: Path | str | None,
+    ) -> list[RunbookUpdateResult]:
+        index = _SectionIndex.parse(self._read_or_initialize())
+        index.ensure_sections()
+        for pending in notes:
+            index.insert_note(pending.section, pending.line)
+        updated = index.render()
+        archived = 0
+        policy = self.retention
+        if (
+            policy is not None
+            and policy.max_bytes is not None
+            and policy.archives_anything
+            and len(updated.encode("utf-8")) > policy.max_bytes
+        ):
+            archived = sum(self._rotate(index, policy, now=None, dry_run=dry_run).values())
+            if archived:
+                updated = index.render()
+
         preview_path: Path | None = None
         if output_path:
             preview_path = Path(output_path)
@@ -119,21 +305,68 @@ class RunbookUpdater:
 
         wrote_file = False
         if not dry_run:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            self.path.write_text(updated, encoding="utf-8", newline="\n")
+            atomic_write_text(self.path, updated)
             wrote_file = True
 
-        return RunbookUpdateResult(
-            section=target,
-            path=self.path,
-            timestamp=timestamp_str,
-            author=normalized_author,
-            note=normalized_note,
-            wrote_file=wrote_file,
-            dry_run=dry_run,
-            output_path=preview_path,
-            content=updated,
-        )
+        return [
+            RunbookUpdateResult(
+                section=pending.section,
+                path=self.path,
+                timestamp=pending.timestamp,
+                author=pending.author,
+                note=pending.note,
+                wrote_file=wrote_file,
+                dry_run=dry_run,
+                output_path=preview_path,
+                content=updated,
+                archived=archived,
+            )
+            for pending in notes
+        ]
+
+    def _rotate(
+        self,
+        index: _SectionIndex,
+        policy: RunbookRetention,
+        *,
+        now: datetime | None,
+        dry_run: bool,
+    ) -> dict[Path, int]:
+        """Remove expired notes from *index* and merge them into their quarterly archives."""
+        expired = index.extract_expired(policy, now or datetime.now(timezone.utc))
+        archives: dict[Path, int] = {}
+        for quarter, notes in expired.items():
+            archive_path = self.archive_dir / f"IMPLEMENTATION-{quarter}.md"
+            archives[archive_path] = len(notes)
+            if dry_run:
+                continue
+            if archive_path.exists():
+                content = archive_path.read_text(encoding="utf-8")
+            else:
+                content = f"# Implementation Notes Archive ({quarter})\n"
+            archive = _SectionIndex.parse(content)
+            present = {line for body in archive.bodies for line in body}
+            for section, line in notes:
+                if line not in present:
+                    archive.append_note(section, line)
+                    present.add(line)
+            atomic_write_text(archive_path, archive.render())
+        return archives
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with portalocker.Lock(str(self.lock_path), timeout=self.lock_timeout, mode="w"):
+                yield
+        except portalocker_exceptions.LockException as exc:
+            raise RunbookUpdaterError(
+                build_error_payload(
+                    code="runbook.lock_timeout",
+                    message="Runbook is locked by another process. Please retry after it finishes.",
+                    remediation=f"If the lock file is stale, delete {self.lock_path.name} manually before rerunning.",
+                )
+            ) from exc
 
     def _read_or_initialize(self) -> str:
         if self.path.exists():
@@ -141,6 +374,30 @@ class RunbookUpdater:
         return f"{DEFAULT_RUNBOOK_HEADER}\n"
 
 
+@dataclass(slots=True)
+class _PendingNote:
+    """A validated note waiting to be inserted into its section."""
+
+    section: RunbookSection
+    timestamp: str
+    author: str
+    note: str
+
+    @property
+    def line(self) -> str:
+        return _format_note(self.timestamp, self.author, self.note)
+
+
+def _prepare_note(*, section: str, note: str, author: str, timestamp: datetime | None) -> _PendingNote:
+    timestamp_value = timestamp or datetime.now(timezone.utc)
+    return _PendingNote(
+        section=_get_section(section),
+        timestamp=timestamp_value.strftime("%Y-%m-%d %H:%MZ"),
+        note=_normalize_text(note, "note"),
+        author=_normalize_text(author, "author"),
+    )
+
+
 def _get_section(slug: str) -> RunbookSection:
     normalized = slug.lower().strip()
     if normalized not in SECTION_REGISTRY:
@@ -167,29 +424,150 @@ def _normalize_text(value: str, label: str) -> str:
     return collapsed
 
 
-def _ensure_sections(content: str) -> str:
-    lines = content.splitlines()
-    if not lines:
-        lines = [DEFAULT_RUNBOOK_HEADER, ""]
-    elif not lines[0].startswith("# "):
-        lines.insert(0, DEFAULT_RUNBOOK_HEADER)
-        lines.insert(1, "")
-
-    insertion_idx = _find_first_heading_index(lines)
-    for section in SECTION_ORDER:
-        if section.heading in lines:
-            continue
-        block = _build_section_block(section)
-        lines[insertion_idx:insertion_idx] = block
-        insertion_idx += len(block)
-    return _normalize_lines(lines)
-
-
-def _find_first_heading_index(lines: list[str]) -> int:
-    for idx, line in enumerate(lines):
+class _SectionIndex:
+    """Runbook split once into a preamble and ``## `` sections, indexed by heading.
+
+    Parsing is a single pass over the lines; lookups are dict hits, and inserting a
+    note only touches its own section's body, so a batch of notes costs one parse
+    and one render regardless of how long the runbook has grown.
+    """
+
+    __slots__ = ("_cleaned", "bodies", "headings", "positions", "preamble")
+
+    def __init__(self, preamble: list[str], headings: list[str], bodies: list[list[str]]) -> None:
+        self.preamble = preamble
+        self.headings = headings
+        self.bodies = bodies
+        self.positions: dict[str, int] = {}
+        self._cleaned: set[int] = set()
+        self._reindex()
+
+    @classmethod
+    def parse(cls, content: str) -> _SectionIndex:
+        lines = content.splitlines()
+        if not lines:
+            lines = [DEFAULT_RUNBOOK_HEADER, ""]
+        elif not lines[0].startswith("# "):
+            lines[0:0] = [DEFAULT_RUNBOOK_HEADER, ""]
+        return cls(*_split_sections(lines))
+
+    def ensure_sections(self) -> None:
+        """Add missing managed sections, in order, ahead of the first existing section."""
+        missing: list[str] = []
+        for section in SECTION_ORDER:
+            if section.heading not in self.positions:
+                missing.extend(_build_section_block(section))
+        if missing:
+            preamble, headings, bodies = _split_sections(missing)
+            self.preamble.extend(preamble)
+            self.headings[0:0] = headings
+            self.bodies[0:0] = bodies
+            self._cleaned = {idx + len(headings) for idx in self._cleaned}
+        self._strip_tail()
+        self._reindex()
+
+    def insert_note(self, section: RunbookSection, note_line: str) -> None:
+        position = self.positions.get(section.heading)
+        if position is None:  # pragma: no cover - ensured earlier
+            raise RunbookUpdaterError(
+                build_error_payload(
+                    code="runbook.missing_section",
+                    message=f"Section '{section.title}' was not initialized.",
+                )
+            )
+        body = self.bodies[position]
+        if position not in self._cleaned:
+            placeholder = section.placeholder.strip()
+            body[:] = [line for line in body if line.strip() != placeholder]
+            self._cleaned.add(position)
+        while body and body[-1].strip() == "":
+            body.pop()
+        body.extend(("", note_line, ""))
+
+    def append_note(self, section: RunbookSection, note_line: str) -> None:
+        """Add *note_line* at the end of *section*, appending the section if it is missing."""
+        if section.heading not in self.positions:
+            self.headings.append(section.heading)
+            self.bodies.append(["", f"> {section.description}", ""])
+            self.positions[section.heading] = len(self.headings) - 1
+        self.insert_note(section, note_line)
+
+    def extract_expired(
+        self,
+        policy: RunbookRetention,
+        now: datetime,
+    ) -> dict[str, list[tuple[RunbookSection, str]]]:
+        """Drop notes outside *policy* from each managed section, grouped by archive quarter."""
+        cutoff = now - timedelta(days=policy.max_age_days) if policy.max_age_days is not None else None
+        expired: dict[str, list[tuple[RunbookSection, str]]] = {}
+        for section in SECTION_ORDER:
+            position = self.positions.get(section.heading)
+            if position is None:
+                continue
+            body = self.bodies[position]
+            stamped = [(idx, stamp) for idx, line in enumerate(body) if (stamp := _note_timestamp(line)) is not None]
+            overflow = len(stamped) - policy.keep_per_section if policy.keep_per_section is not None else 0
+            # Back-dated notes (``append --timestamp``) can sit below newer ones, so
+            # the overflow is the oldest notes by timestamp, ties broken by position.
+            oldest = {idx for idx, _stamp in sorted(stamped, key=lambda item: (item[1], item[0]))[: max(overflow, 0)]}
+            drop: set[int] = set()
+            for idx, stamp in stamped:
+                if idx in oldest or (cutoff is not None and stamp < cutoff):
+                    drop.add(idx)
+                    expired.setdefault(_quarter(stamp), []).append((section, body[idx]))
+            if not drop:
+                continue
+            kept: list[str] = []
+            for idx, line in enumerate(body):
+                if idx in drop:
+                    if kept and not kept[-1].strip():
+                        kept.pop()
+                    continue
+                kept.append(line)
+            if len(drop) == len(stamped) and not any(line.startswith("- ") for line in kept):
+                while kept and not kept[-1].strip():
+                    kept.pop()
+                kept.extend(("", section.placeholder, ""))
+                self._cleaned.discard(position)
+            body[:] = kept
+        return expired
+
+    def render(self) -> str:
+        lines = list(self.preamble)
+        for heading, body in zip(self.headings, self.bodies, strict=True):
+            lines.append(heading)
+            lines.extend(body)
+        return _normalize_lines(lines)
+
+    def _strip_tail(self) -> None:
+        """Drop trailing whitespace at the end of the document, as ``render`` will."""
+        container = self.bodies[-1] if self.bodies else self.preamble
+        while container and not container[-1].strip():
+            container.pop()
+        if container:
+            container[-1] = container[-1].rstrip()
+        elif self.headings:
+            self.headings[-1] = self.headings[-1].rstrip()
+
+    def _reindex(self) -> None:
+        self.positions.clear()
+        for idx, heading in enumerate(self.headings):
+            self.positions.setdefault(heading, idx)
+
+
+def _split_sections(lines: list[str]) -> tuple[list[str], list[str], list[list[str]]]:
+    preamble: list[str] = []
+    headings: list[str] = []
+    bodies: list[list[str]] = []
+    current = preamble
+    for line in lines:
         if line.startswith("## "):
-            return idx
-    return len(lines)
+            headings.append(line)
+            current = []
+            bodies.append(current)
+        else:
+            current.append(line)
+    return preamble, headings, bodies
 
 
 def _build_section_block(section: RunbookSection) -> list[str]:
@@ -204,39 +582,18 @@ def _build_section_block(section: RunbookSection) -> list[str]:
     ]
 
 
-def _insert_note(content: str, *, section: RunbookSection, note_line: str) -> str:
-    lines = content.splitlines()
+def _note_timestamp(line: str) -> datetime | None:
+    match = NOTE_PATTERN.match(line)
+    if match is None:
+        return None
     try:
-        start = lines.index(section.heading)
-    except ValueError as exc:  # pragma: no cover - ensured earlier
-        raise RunbookUpdaterError(
-            build_error_payload(
-                code="runbook.missing_section",
-                message=f"Section '{section.title}' was not initialized.",
-            )
-        ) from exc
-    end = _find_section_end(lines, start)
+        return datetime.strptime(match.group("timestamp"), "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
 
-    body = lines[start + 1 : end]
-    placeholder = section.placeholder.strip()
-    cleaned: list[str] = [line for line in body if line.strip() != placeholder]
 
-    while cleaned and cleaned[-1].strip() == "":
-        cleaned.pop()
-    cleaned.append("")
-    cleaned.append(note_line)
-    cleaned.append("")
-
-    lines[start + 1 : end] = cleaned
-    return _normalize_lines(lines)
-
-
-def _find_section_end(lines: list[str], start: int) -> int:
-    for idx in range(start + 1, len(lines)):
-        line = lines[idx]
-        if line.startswith("## "):
-            return idx
-    return len(lines)
+def _quarter(stamp: datetime) -> str:
+    return f"{stamp.year}-Q{(stamp.month - 1) // 3 + 1}"
 
 
 def _format_note(timestamp: str, author: str, note: str) -> str:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import io
+import re
 import shutil
 import sys
 from dataclasses import dataclass
@@ -13,12 +15,18 @@ from typing import Literal, Sequence
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
 
 __all__ = [
+    "MarkdownDocument",
     "MarkdownSurgeonError",
+    "SnippetEdit",
+    "apply_snippet",
+    "render_snippets",
     "synchronize_snippet",
+    "synchronize_snippets",
     "main",
 ]
 
 Mode = Literal["replace", "insert", "append"]
+MARKER_PATTERN = re.compile(r"<!-- ([^<>\n]+?):(start|end) -->")
 
 
 @dataclass(slots=True)
@@ -36,10 +44,54 @@ class MarkdownSurgeonError(SentinelKitError):
     """Raised when snippet synchronization fails."""
 
 
-def synchronize_snippet(options: SurgeonOptions) -> None:
-    """Synchronize a snippet into a Markdown document."""
+@dataclass(slots=True)
+class SnippetEdit:
+    """One marker block to synchronize into an in-memory document."""
+
+    marker: str
+    snippet: str
+    heading: str | None = None
+    mode: Mode = "replace"
+
+
+def synchronize_snippet(options: SurgeonOptions) -> bool:
+    """Synchronize a snippet into a Markdown document.
+
+    Returns False (and leaves the file and its backup alone) when the document
+    already contains the snippet.
+    """
+
+    edit = SnippetEdit(
+        marker=options.marker,
+        snippet=_load_snippet(options),
+        heading=options.heading,
+        mode=options.mode,
+    )
+    return synchronize_snippets(options.file, [edit], backup=options.backup)
+
+
+def synchronize_snippets(file: Path, edits: Sequence[SnippetEdit], *, backup: bool = True) -> bool:
+    """Apply every edit to one in-memory copy of *file*, then back up and write it once.
+
+    The document is validated once after all edits. Nothing is written, and no
+    backup is taken, when the result is identical to the file on disk. Returns
+    whether the file was rewritten.
+    """
+
+    target = file.resolve()
+    original, doc = render_snippets(target, edits)
+    if doc == original:
+        return False
+    if backup:
+        shutil.copyfile(target, target.with_suffix(f"{target.suffix}.bak"))
+    target.write_text(doc, encoding="utf-8", newline="\n")
+    return True
+
 
-    target = options.file.resolve()
+def render_snippets(file: Path, edits: Sequence[SnippetEdit]) -> tuple[str, str]:
+    """Return ``(current, updated)`` text for *file* with *edits* applied, without writing."""
+
+    target = file.resolve()
     if not target.exists():
         raise MarkdownSurgeonError(
             build_error_payload(
@@ -48,52 +100,262 @@ def synchronize_snippet(options: SurgeonOptions) -> None:
             )
         )
 
-    snippet = _load_snippet(options).strip()
-    if not snippet:
-        raise MarkdownSurgeonError(
-            build_error_payload(
-                code="md_surgeon.empty_snippet",
-                message="Snippet content is empty.",
-            )
-        )
-
-    _ensure_balanced_fences(snippet, source="snippet")
-
-    doc = _normalize_newlines(target.read_text(encoding="utf-8"))
-    start_marker = f"<!-- {options.marker}:start -->"
-    end_marker = f"<!-- {options.marker}:end -->"
-
-    start_idx = doc.find(start_marker)
-    end_idx = doc.find(end_marker)
+    original = target.read_text(encoding="utf-8")
+    document = MarkdownDocument(original)
+    for edit in edits:
+        document.apply(edit)
+    document.validate()
+    return original, document.render()
+
+
+def apply_snippet(doc: str, edit: SnippetEdit) -> str:
+    """Return *doc* with *edit* applied (replacing, inserting, or appending its marker block)."""
+
+    document = MarkdownDocument(doc)
+    document.apply(edit)
+    return document.render()
+
+
+@dataclass(slots=True, frozen=True)
+class _PendingReplace:
+    start: int
+    end: int
+    text: str
+
+
+class MarkdownDocument:
+    """Markdown text indexed in one pass for repeated marker edits.
+
+    The scan records every ``<!-- X:start -->`` / ``<!-- X:end -->`` offset, the
+    first line of every H2-H6 heading, and per-line fence counts. Replacing a marker
+    block only records the new text for its span, so any number of replacements
+    costs one final :meth:`render`, and fence balance is recomputed from the index
+    plus just the lines each replaced span touches. Inserting or appending a new
+    block (a one-off per marker) rebuilds the text and re-indexes it, so later edits
+    see the new markers exactly as a sequential rewrite would. Marker or heading
+    text inside replacement snippets is not indexed.
+    """
+
+    __slots__ = (
+        "_ends",
+        "_fence_prefix",
+        "_headings",
+        "_line_starts",
+        "_pending",
+        "_replacement_chars",
+        "_starts",
+        "_text",
+    )
 
-    if options.backup:
-        backup = target.with_suffix(f"{target.suffix}.bak")
-        shutil.copyfile(target, backup)
+    def __init__(self, text: str) -> None:
+        self._pending: dict[str, _PendingReplace] = {}
+        self._index(_normalize_newlines(text))
+
+    def block(self, marker: str) -> tuple[int, int] | None:
+        """Offsets of the start and end marker comments, when both exist in order.
+
+        Like a rewrite would, this ignores marker comments that sit inside a block
+        already replaced by another marker.
+        """
+        pending = self._pending.get(marker)
+        if pending is not None:
+            return pending.start, pending.end - len(_marker_comments(marker)[1])
+        start = self._first_visible(self._starts.get(marker, ()))
+        end = self._first_visible(self._ends.get(marker, ()))
+        if start is None or end is None or end <= start:
+            return None
+        return start, end
+
+    def heading_line(self, heading: str) -> int | None:
+        return self._headings.get(heading.strip().lower())
+
+    def apply(self, edit: SnippetEdit) -> None:
+        snippet = _normalize_newlines(edit.snippet).strip()
+        if not snippet:
+            raise MarkdownSurgeonError(
+                build_error_payload(
+                    code="md_surgeon.empty_snippet",
+                    message="Snippet content is empty.",
+                )
+            )
+        _ensure_balanced_fences(snippet, source="snippet")
+
+        if self.block(edit.marker) is not None:
+            if edit.mode == "insert":
+                raise MarkdownSurgeonError(
+                    build_error_payload(
+                        code="md_surgeon.insert_existing",
+                        message="Markers already exist; use replace mode.",
+                    )
+                )
+            self.replace_block(edit.marker, snippet)
+        elif edit.heading:
+            self.insert_after_heading(edit.marker, edit.heading, snippet)
+        elif edit.mode == "append":
+            self.append_block(edit.marker, snippet)
+        else:
+            raise MarkdownSurgeonError(
+                build_error_payload(
+                    code="md_surgeon.no_markers",
+                    message="No existing markers; provide --heading or use append mode.",
+                )
+            )
 
-    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-        if options.mode == "insert":
+    def replace_block(self, marker: str, snippet: str) -> None:
+        span = self.block(marker)
+        if span is None:
+            raise MarkdownSurgeonError(
+                build_error_payload(code="md_surgeon.no_markers", message=f"Markers for {marker} not found.")
+            )
+        start_marker, end_marker = _marker_comments(marker)
+        start, end = span[0], span[1] + len(end_marker)
+        # Visible markers never sit inside another pending block, so the only possible
+        # overlap is this block enclosing earlier replacements, which it overwrites.
+        for other in [key for key, pending in self._pending.items() if start <= pending.start and pending.end <= end]:
+            del self._pending[other]
+        self._pending[marker] = _PendingReplace(start=start, end=end, text=f"{start_marker}\n{snippet}\n{end_marker}")
+
+    def insert_after_heading(self, marker: str, heading: str, snippet: str) -> None:
+        if self._pending:
+            self._reset(self.render())
+        line = self.heading_line(heading)
+        if line is None:
             raise MarkdownSurgeonError(
                 build_error_payload(
-                    code="md_surgeon.insert_existing",
-                    message="Markers already exist; use replace mode.",
+                    code="md_surgeon.heading_missing",
+                    message=f'Heading "{heading}" not found.',
                 )
             )
-        doc = _replace_block(doc, start_idx, end_idx, start_marker, end_marker, snippet)
-    elif options.heading:
-        doc = _insert_after_heading(doc, options.heading, start_marker, end_marker, snippet)
-    elif options.mode == "append":
-        doc = _append_block(doc, start_marker, end_marker, snippet)
-    else:
-        raise MarkdownSurgeonError(
-            build_error_payload(
-                code="md_surgeon.no_markers",
-                message="No existing markers; provide --heading or use append mode.",
+        text = self._text
+        start_marker, end_marker = _marker_comments(marker)
+        block = f"{start_marker}\n{snippet}\n{end_marker}"
+        if line + 1 < len(self._line_starts):
+            offset = self._line_starts[line + 1]
+            self._reset(f"{text[:offset]}\n{block}\n\n{text[offset:]}")
+        else:
+            self._reset(f"{text}\n\n{block}\n")
+
+    def append_block(self, marker: str, snippet: str) -> None:
+        text = self.render()
+        start_marker, end_marker = _marker_comments(marker)
+        sep = "" if text.endswith("\n") else "\n"
+        self._reset(f"{text}{sep}\n\n{start_marker}\n{snippet}\n{end_marker}\n")
+
+    def render(self) -> str:
+        if not self._pending:
+            return self._text
+        parts: list[str] = []
+        cursor = 0
+        for pending in sorted(self._pending.values(), key=lambda item: item.start):
+            parts.append(self._text[cursor : pending.start])
+            parts.append(pending.text)
+            cursor = pending.end
+        parts.append(self._text[cursor:])
+        return "".join(parts)
+
+    def fence_counts(self) -> tuple[int, int]:
+        """Backtick and tilde fence lines in the rendered document."""
+        ticks, tildes = self._fence_prefix[-1]
+        for first, last in self._touched_line_ranges():
+            old_ticks, old_tildes = self._fences_between(first, last)
+            new_ticks, new_tildes = _count_fences(self._render_lines(first, last))
+            ticks += new_ticks - old_ticks
+            tildes += new_tildes - old_tildes
+        return ticks, tildes
+
+    def validate(self) -> None:
+        ticks, tildes = self.fence_counts()
+        if ticks % 2 != 0 or tildes % 2 != 0:
+            raise MarkdownSurgeonError(
+                build_error_payload(
+                    code="md_surgeon.unbalanced_fence",
+                    message="document has unbalanced code fences.",
+                )
+            )
+        replacement_chars = self._replacement_chars
+        for pending in self._pending.values():
+            replacement_chars += pending.text.count("\uFFFD")
+            replacement_chars -= self._text.count("\uFFFD", pending.start, pending.end)
+        if replacement_chars:
+            raise MarkdownSurgeonError(
+                build_error_payload(
+                    code="md_surgeon.replacement_char",
+                    message="Replacement character detected; check encoding.",
+                )
             )
-        )
 
-    _ensure_balanced_fences(doc, source="document")
-    _ensure_no_replacement_chars(doc)
-    target.write_text(doc, encoding="utf-8", newline="\n")
+    def _first_visible(self, offsets: Sequence[int]) -> int | None:
+        for offset in offsets:
+            if not any(pending.start <= offset < pending.end for pending in self._pending.values()):
+                return offset
+        return None
+
+    def _reset(self, text: str) -> None:
+        self._pending = {}
+        self._index(text)
+
+    def _index(self, text: str) -> None:
+        self._text = text
+        self._line_starts = []
+        self._fence_prefix = [(0, 0)]
+        self._starts: dict[str, list[int]] = {}
+        self._ends: dict[str, list[int]] = {}
+        self._headings: dict[str, int] = {}
+        ticks = tildes = 0
+        offset = 0
+        for number, line in enumerate(text.split("\n")):
+            self._line_starts.append(offset)
+            if line.startswith("```"):
+                ticks += 1
+            elif line.startswith("~~~"):
+                tildes += 1
+            elif line.startswith("#"):
+                hashes, _, title = line.strip().partition(" ")
+                if title and 2 <= len(hashes) <= 6:
+                    self._headings.setdefault(title.lower(), number)
+            if "<!--" in line:
+                for match in MARKER_PATTERN.finditer(line):
+                    bucket = self._starts if match.group(2) == "start" else self._ends
+                    bucket.setdefault(match.group(1), []).append(offset + match.start())
+            self._fence_prefix.append((ticks, tildes))
+            offset += len(line) + 1
+        self._replacement_chars = text.count("\uFFFD")
+
+    def _line_of(self, offset: int) -> int:
+        return bisect.bisect_right(self._line_starts, offset) - 1
+
+    def _touched_line_ranges(self) -> list[tuple[int, int]]:
+        ranges: list[tuple[int, int]] = []
+        for pending in sorted(self._pending.values(), key=lambda item: item.start):
+            first, last = self._line_of(pending.start), self._line_of(pending.end)
+            if ranges and first <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], max(last, ranges[-1][1]))
+            else:
+                ranges.append((first, last))
+        return ranges
+
+    def _fences_between(self, first: int, last: int) -> tuple[int, int]:
+        before, after = self._fence_prefix[first], self._fence_prefix[last + 1]
+        return after[0] - before[0], after[1] - before[1]
+
+    def _render_lines(self, first: int, last: int) -> str:
+        """Rendered text of original lines *first*..*last* (inclusive)."""
+        start = self._line_starts[first]
+        end = self._line_starts[last + 1] - 1 if last + 1 < len(self._line_starts) else len(self._text)
+        parts: list[str] = []
+        cursor = start
+        for pending in sorted(self._pending.values(), key=lambda item: item.start):
+            if pending.start < start or pending.end > end:
+                continue
+            parts.append(self._text[cursor : pending.start])
+            parts.append(pending.text)
+            cursor = pending.end
+        parts.append(self._text[cursor:end])
+        return "".join(parts)
+
+
+def _marker_comments(marker: str) -> tuple[str, str]:
+    return f"<!-- {marker}:start -->", f"<!-- {marker}:end -->"
 
 
 def _load_snippet(options: SurgeonOptions) -> str:
@@ -127,70 +389,22 @@ def _load_snippet(options: SurgeonOptions) -> str:
     return _normalize_newlines(buffer)
 
 
-def _replace_block(
-    doc: str,
-    start_idx: int,
-    end_idx: int,
-    start_marker: str,
-    end_marker: str,
-    snippet: str,
-) -> str:
-    head = doc[:start_idx]
-    tail = doc[end_idx + len(end_marker) :]
-    return f"{head}{start_marker}\n{snippet}\n{end_marker}{tail}"
-
-
-def _insert_after_heading(
-    doc: str,
-    heading: str,
-    start_marker: str,
-    end_marker: str,
-    snippet: str,
-) -> str:
-    lines = doc.split("\n")
-    heading_idx = _find_heading_index(lines, heading)
-    if heading_idx is None:
-        raise MarkdownSurgeonError(
-            build_error_payload(
-                code="md_surgeon.heading_missing",
-                message=f'Heading "{heading}" not found.',
-            )
-        )
-    insert_line = heading_idx + 1
-    block = [start_marker, snippet, end_marker]
-    block_lines = ["", *block, ""]
-    new_lines = lines[:insert_line] + block_lines + lines[insert_line:]
-    return "\n".join(new_lines)
-
-
-def _append_block(doc: str, start_marker: str, end_marker: str, snippet: str) -> str:
-    sep = "" if doc.endswith("\n") else "\n"
-    return f"{doc}{sep}\n\n{start_marker}\n{snippet}\n{end_marker}\n"
-
-
-def _find_heading_index(lines: Sequence[str], heading: str) -> int | None:
-    trimmed = heading.strip().lower()
-    for idx, line in enumerate(lines):
-        if not line.startswith("#"):
-            continue
-        stripped = line.strip()
-        if not stripped:
-            continue
-        hashes, _, title = stripped.partition(" ")
-        if not hashes or not title:
-            continue
-        if 2 <= len(hashes) <= 6 and title.lower() == trimmed:
-            return idx
-    return None
-
-
 def _normalize_newlines(text: str) -> str:
     return text.replace("\r\n", "\n")
 
 
+def _count_fences(markdown: str) -> tuple[int, int]:
+    ticks = tildes = 0
+    for line in markdown.split("\n"):
+        if line.startswith("```"):
+            ticks += 1
+        elif line.startswith("~~~"):
+            tildes += 1
+    return ticks, tildes
+
+
 def _ensure_balanced_fences(markdown: str, *, source: str) -> None:
-    ticks = sum(1 for line in markdown.splitlines() if line.startswith("```"))
-    tildes = sum(1 for line in markdown.splitlines() if line.startswith("~~~"))
+    ticks, tildes = _count_fences(markdown)
     if ticks % 2 != 0 or tildes % 2 != 0:
         raise MarkdownSurgeonError(
             build_error_payload(
@@ -200,16 +414,6 @@ def _ensure_balanced_fences(markdown: str, *, source: str) -> None:
         )
 
 
-def _ensure_no_replacement_chars(markdown: str) -> None:
-    if "\uFFFD" in markdown:
-        raise MarkdownSurgeonError(
-            build_error_payload(
-                code="md_surgeon.replacement_char",
-                message="Replacement character detected; check encoding.",
-            )
-        )
-
-
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Synchronize Markdown snippets (md-surgeon).")
     parser.add_argument("--file", required=True, type=Path, help="Markdown file to update.")
@@ -244,7 +448,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     try:
-        synchronize_snippet(options)
+        changed = synchronize_snippet(options)
     except MarkdownSurgeonError as error:
         print(f"md-surgeon: {error.payload.message}", file=sys.stderr)
         if error.payload.remediation:
@@ -254,7 +458,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(f"md-surgeon: {error}", file=sys.stderr)
         return 1
 
-    print(f"md-surgeon: ok -> {args.file.name} [marker={args.marker}]")
+    status = "ok" if changed else "unchanged"
+    print(f"md-surgeon: {status} -> {args.file.name} [marker={args.marker}]")
     return 0
 
 
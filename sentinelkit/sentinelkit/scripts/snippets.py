@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import difflib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from sentinelkit.scripts.md_surgeon import SurgeonOptions, synchronize_snippet
+from sentinelkit.scripts.md_surgeon import (
+    SnippetEdit,
+    render_snippets,
+    synchronize_snippets,
+)
 from sentinelkit.utils.errors import SentinelKitError, build_error_payload
 
-__all__ = ["SnippetMapping", "sync_snippets", "DEFAULT_SNIPPETS"]
+__all__ = ["DEFAULT_SNIPPETS", "SnippetDrift", "SnippetMapping", "check_snippets", "sync_snippets"]
 
 
 class SnippetSyncError(SentinelKitError):
@@ -25,6 +30,14 @@ class SnippetMapping:
     mode: str = "replace"
 
 
+@dataclass(slots=True, frozen=True)
+class SnippetDrift:
+    """A target whose managed snippets differ from their sources."""
+
+    target: Path
+    diff: str
+
+
 DEFAULT_SNIPPETS: tuple[SnippetMapping, ...] = (
     SnippetMapping(
         marker="SENTINEL:WORKFLOW-BADGE",
@@ -66,11 +79,50 @@ def sync_snippets(
     mappings: Sequence[SnippetMapping] = DEFAULT_SNIPPETS,
     markers: Iterable[str] | None = None,
 ) -> list[Path]:
-    """Synchronize documentation snippets using md-surgeon."""
+    """Synchronize documentation snippets using md-surgeon.
+
+    Mappings are grouped by target so each file is read, backed up, validated,
+    and written once no matter how many markers it carries. Returns the targets
+    that actually changed.
+    """
+
+    grouped = _group_edits(Path(root).resolve(), mappings, markers)
+    return [target for target, edits in grouped.items() if synchronize_snippets(target, edits)]
+
+
+def check_snippets(
+    *,
+    root: Path | str,
+    mappings: Sequence[SnippetMapping] = DEFAULT_SNIPPETS,
+    markers: Iterable[str] | None = None,
+) -> list[SnippetDrift]:
+    """Report targets that ``sync_snippets`` would change, as unified diffs, without writing."""
 
     root_path = Path(root).resolve()
+    drift: list[SnippetDrift] = []
+    for target, edits in _group_edits(root_path, mappings, markers).items():
+        current, updated = render_snippets(target, edits)
+        if current == updated:
+            continue
+        label = _display_path(root_path, target)
+        diff = difflib.unified_diff(
+            current.splitlines(keepends=True),
+            updated.splitlines(keepends=True),
+            fromfile=f"a/{label}",
+            tofile=f"b/{label}",
+        )
+        drift.append(SnippetDrift(target=target, diff="".join(_terminate_lines(diff))))
+    return drift
+
+
+def _group_edits(
+    root_path: Path,
+    mappings: Sequence[SnippetMapping],
+    markers: Iterable[str] | None,
+) -> dict[Path, list[SnippetEdit]]:
     selected = {marker.upper() for marker in (markers or [])}
-    touched: list[Path] = []
+    edits_by_target: dict[Path, list[SnippetEdit]] = {}
+    snippet_cache: dict[Path, str] = {}
 
     for mapping in mappings:
         if selected and mapping.marker.upper() not in selected:
@@ -91,13 +143,26 @@ def sync_snippets(
                     message=f"Target '{target_path}' does not exist.",
                 )
             )
-        options = SurgeonOptions(
-            file=target_path,
-            marker=mapping.marker,
-            content_path=snippet_path,
-            heading=mapping.heading,
-            mode=mapping.mode,
+        if snippet_path not in snippet_cache:
+            snippet_cache[snippet_path] = snippet_path.read_text(encoding="utf-8")
+        edits_by_target.setdefault(target_path, []).append(
+            SnippetEdit(
+                marker=mapping.marker,
+                snippet=snippet_cache[snippet_path],
+                heading=mapping.heading,
+                mode=mapping.mode,
+            )
         )
-        synchronize_snippet(options)
-        touched.append(target_path)
-    return touched
+    return edits_by_target
+
+
+def _display_path(root_path: Path, target: Path) -> str:
+    try:
+        return target.relative_to(root_path).as_posix()
+    except ValueError:
+        return target.as_posix()
+
+
+def _terminate_lines(lines: Iterable[str]) -> Iterable[str]:
+    for line in lines:
+        yield line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n"
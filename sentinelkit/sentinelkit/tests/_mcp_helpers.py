@@ -0,0 +1,36 @@
+"""Shared helpers for MCP socket tests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from sentinelkit.cli.mcp.server import DEFAULT_SOCKET, serve_socket
+
+
+@contextmanager
+def running_socket_server(root: Path) -> Iterator[Path]:
+    """Serve *root* on its default socket from a background event loop."""
+    path = root / DEFAULT_SOCKET
+    loop = asyncio.new_event_loop()
+    ready = asyncio.Event()
+    task = loop.create_task(serve_socket(path, root=root, ready=ready))
+
+    def _run() -> None:
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(ready.wait(), loop).result(timeout=10)
+        yield path
+    finally:
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(timeout=10)
+        loop.close()
@@ -1,5 +1,5 @@
 """Utility helpers exposed by SentinelKit."""
 
-from . import errors, io, jsonfmt
+from . import errors, io, jsonfmt, stats
 
-__all__ = ["io", "errors", "jsonfmt"]
+__all__ = ["errors", "io", "jsonfmt", "stats"]
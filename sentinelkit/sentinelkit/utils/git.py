@@ -0,0 +1,187 @@
+"""Git metadata helpers that avoid spawning ``git`` on hot paths."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["clear_cache", "head_commit", "short_head_hash"]
+
+SHORT_HASH_LENGTH = 7
+SHA_PATTERN = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})?$")
+
+
+@dataclass(slots=True, frozen=True)
+class _GitDirs:
+    git_dir: Path
+    common_dir: Path
+
+
+@dataclass(slots=True, frozen=True)
+class _HeadEntry:
+    stamp: tuple[int, ...]
+    commit: str | None
+
+
+_DIR_CACHE: dict[Path, _GitDirs | None] = {}
+_HEAD_CACHE: dict[Path, _HeadEntry] = {}
+_LOCK = threading.Lock()
+
+
+def head_commit(cwd: Path | str) -> str | None:
+    """Return the full commit id for HEAD of the repository containing *cwd*.
+
+    ``.git/HEAD``, the loose ref it points at, and ``packed-refs`` are read
+    directly. The result is cached per process and reused while the mtimes of
+    those files are unchanged; HEAD alone is not enough because a commit on the
+    current branch only touches the ref. ``git rev-parse`` runs only when the
+    files cannot be interpreted (unusual ref storage, missing objects, etc.).
+    """
+
+    start = Path(cwd).resolve()
+    dirs = _find_git_dirs(start)
+    if dirs is None:
+        # Without a .git marker only an explicit GIT_DIR can make git succeed.
+        return _rev_parse(start, "HEAD") if os.environ.get("GIT_DIR") else None
+
+    head_path = dirs.git_dir / "HEAD"
+    try:
+        head_text = head_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return _rev_parse(start, "HEAD")
+
+    ref = head_text[5:].strip() if head_text.startswith("ref:") else None
+    stamp = _stamp(head_path, *(_ref_paths(dirs, ref) if ref else ()))
+    with _LOCK:
+        cached = _HEAD_CACHE.get(dirs.git_dir)
+    if cached is not None and cached.stamp == stamp:
+        return cached.commit
+
+    if ref is None:
+        commit = head_text if SHA_PATTERN.match(head_text) else None
+    else:
+        commit = _read_loose_ref(dirs, ref) or _read_packed_ref(dirs, ref)
+    if commit is None:
+        commit = _rev_parse(start, "HEAD")
+
+    with _LOCK:
+        _HEAD_CACHE[dirs.git_dir] = _HeadEntry(stamp=stamp, commit=commit)
+    return commit
+
+
+def short_head_hash(cwd: Path | str, *, length: int = SHORT_HASH_LENGTH) -> str | None:
+    """Return the abbreviated HEAD commit id, or None outside a repository."""
+
+    commit = head_commit(cwd)
+    return commit[:length] if commit else None
+
+
+def clear_cache() -> None:
+    """Forget cached repository locations and HEAD resolutions."""
+
+    with _LOCK:
+        _DIR_CACHE.clear()
+        _HEAD_CACHE.clear()
+
+
+def _find_git_dirs(start: Path) -> _GitDirs | None:
+    with _LOCK:
+        if start in _DIR_CACHE:
+            return _DIR_CACHE[start]
+
+    found: _GitDirs | None = None
+    for candidate in (start, *start.parents):
+        marker = candidate / ".git"
+        if marker.is_dir():
+            found = _GitDirs(git_dir=marker, common_dir=_common_dir(marker))
+            break
+        if marker.is_file():
+            git_dir = _read_gitdir_file(marker)
+            if git_dir is not None:
+                found = _GitDirs(git_dir=git_dir, common_dir=_common_dir(git_dir))
+            break
+
+    with _LOCK:
+        _DIR_CACHE[start] = found
+    return found
+
+
+def _read_gitdir_file(marker: Path) -> Path | None:
+    """Resolve the ``gitdir: <path>`` pointer used by worktrees and submodules."""
+    try:
+        text = marker.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    target = Path(text[7:].strip())
+    if not target.is_absolute():
+        target = (marker.parent / target).resolve()
+    return target if target.is_dir() else None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    try:
+        pointer = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common = Path(pointer)
+    return common if common.is_absolute() else (git_dir / common).resolve()
+
+
+def _ref_paths(dirs: _GitDirs, ref: str) -> tuple[Path, ...]:
+    return (dirs.git_dir / ref, dirs.common_dir / ref, dirs.common_dir / "packed-refs")
+
+
+def _stamp(*paths: Path) -> tuple[int, ...]:
+    stamp: list[int] = []
+    for path in paths:
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(-1)
+    return tuple(stamp)
+
+
+def _read_loose_ref(dirs: _GitDirs, ref: str) -> str | None:
+    for base in (dirs.git_dir, dirs.common_dir):
+        try:
+            value = (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if SHA_PATTERN.match(value):
+            return value
+    return None
+
+
+def _read_packed_ref(dirs: _GitDirs, ref: str) -> str | None:
+    try:
+        lines = (dirs.common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if not line or line[0] in "#^":
+            continue
+        sha, _, name = line.partition(" ")
+        if name.strip() == ref and SHA_PATTERN.match(sha):
+            return sha
+    return None
+
+
+def _rev_parse(cwd: Path, rev: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", rev],
+            cwd=str(cwd),
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
@@ -1,10 +1,58 @@
-"""I/O helper placeholders."""
+"""I/O helpers."""
 
 from __future__ import annotations
 
-__all__ = ["read_text"]
+import os
+import threading
+from pathlib import Path
 
+__all__ = ["atomic_write_bytes", "atomic_write_text", "read_text"]
 
-def read_text(path: str) -> str:
-    """Read the contents of a file (stub)."""
-    raise NotImplementedError("IO helpers are pending implementation.")
\ No newline at end of file
+
+def read_text(path: Path | str, *, encoding: str = "utf-8") -> str:
+    """Read *path* as text; the counterpart of :func:`atomic_write_text`."""
+    return Path(path).read_text(encoding=encoding)
+
+
+def atomic_write_text(path: Path | str, content: str, *, encoding: str = "utf-8", fsync: bool = True) -> None:
+    """Replace *path* with *content* so readers see the old or new file, never a partial one."""
+    atomic_write_bytes(path, content.encode(encoding), fsync=fsync)
+
+
+def atomic_write_bytes(path: Path | str, data: bytes, *, fsync: bool = True) -> None:
+    """Write *data* to a sibling temp file, fsync it, and rename it over *path*.
+
+    The rename is atomic on POSIX and Windows when source and target share a
+    directory. The directory itself is fsynced where the platform allows it so the
+    rename survives a power loss, not just a process crash. Pass ``fsync=False``
+    for rebuildable caches that only need atomicity.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, target)
+        if fsync:
+            _fsync_directory(target.parent)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _fsync_directory(directory: Path) -> None:
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
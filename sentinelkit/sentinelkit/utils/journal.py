@@ -0,0 +1,135 @@
+"""Append-only JSONL journal used to batch Markdown mutations."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Mapping
+
+import portalocker
+from portalocker import exceptions as portalocker_exceptions
+
+from .errors import SentinelKitError, build_error_payload
+from .io import atomic_write_bytes
+
+__all__ = ["Journal", "JournalError"]
+
+
+class JournalError(SentinelKitError):
+    """Raised when journal records cannot be written or read back."""
+
+
+class Journal:
+    """Durable queue of JSON records that writers append to and a compactor drains.
+
+    ``append`` holds the journal lock only for one appended line + fsync, so
+    many writers can queue records without waiting on the (much slower) Markdown
+    rewrite. ``pending`` moves the journal aside under the same lock and yields its
+    records; they are deleted only once the caller's block completes, so a failed
+    compaction leaves them queued for the next attempt, and the next drain takes
+    them together with anything queued since. If the process dies after the caller
+    wrote the target but before the batch file is removed, the batch is replayed on
+    the next drain (at-least-once delivery).
+    """
+
+    def __init__(self, path: Path | str, *, lock_timeout: float = 10.0) -> None:
+        self.path = Path(path)
+        self.batch_path = self.path.with_name(f"{self.path.name}.batch")
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.lock_timeout = lock_timeout
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Durably queue *record*."""
+        line = (json.dumps(dict(record), separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(), self.path.open("ab+") as handle:
+            _drop_torn_tail(handle)
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def __len__(self) -> int:
+        return len(_read_records(self.batch_path)) + len(_read_records(self.path))
+
+    @contextmanager
+    def pending(self) -> Iterator[list[dict[str, Any]]]:
+        """Yield queued records (oldest first) and discard them if the block succeeds.
+
+        Callers must serialize drains themselves (normally by holding the target's
+        own lock); writers may keep appending while the block runs.
+        """
+        with self._locked():
+            if self.path.exists():
+                if self.batch_path.exists():
+                    # A batch left by a failed drain stays first; records queued since
+                    # are folded in behind it so nothing waits for a second drain.
+                    leftover = _complete_lines(self.batch_path.read_bytes())
+                    atomic_write_bytes(self.batch_path, leftover + self.path.read_bytes())
+                    self.path.unlink()
+                else:
+                    os.replace(self.path, self.batch_path)
+        records = _read_records(self.batch_path)
+        yield records
+        self.batch_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        try:
+            with portalocker.Lock(str(self.lock_path), timeout=self.lock_timeout, mode="a"):
+                yield
+        except portalocker_exceptions.LockException as exc:
+            raise JournalError(
+                build_error_payload(
+                    code="journal.lock_timeout",
+                    message=f"Journal '{self.path.name}' is locked by another process.",
+                    remediation=f"If the lock file is stale, delete {self.lock_path.name} manually before rerunning.",
+                )
+            ) from exc
+
+
+def _drop_torn_tail(handle: BinaryIO) -> None:
+    """Truncate a partial record left by a writer that died mid-append."""
+    size = handle.seek(0, os.SEEK_END)
+    if size == 0:
+        return
+    handle.seek(size - 1)
+    if handle.read(1) == b"\n":
+        return
+    handle.seek(0)
+    data = handle.read()
+    handle.truncate(data.rfind(b"\n") + 1)
+
+
+def _complete_lines(data: bytes) -> bytes:
+    """Drop a torn final record so more records can follow it."""
+    return data[: data.rfind(b"\n") + 1]
+
+
+def _read_records(path: Path) -> list[dict[str, Any]]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    records: list[dict[str, Any]] = []
+    lines = data.split(b"\n")
+    for number, raw in enumerate(lines, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as exc:
+            if number == len(lines):
+                # A torn final line means a writer died mid-append; it was never acknowledged.
+                break
+            raise JournalError(
+                build_error_payload(
+                    code="journal.corrupt",
+                    message=f"{path}:{number}: journal record is not valid JSON.",
+                    remediation="Remove or repair the damaged line, then rerun the flush.",
+                )
+            ) from exc
+        if isinstance(record, dict):
+            records.append(record)
+    return records
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Iterable
 
-__all__ = ["normalize_path", "relative_to_root", "resolve_under_root"]
+__all__ = ["ALWAYS_SKIPPED_DIRS", "normalize_path", "relative_to_root", "resolve_under_root", "walk_files"]
+
+ALWAYS_SKIPPED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
 
 
 def normalize_path(value: str) -> str:
@@ -32,3 +36,22 @@ def relative_to_root(root: Path, target: Path) -> str:
     """Return POSIX-relative path."""
 
     return target.resolve().relative_to(root.resolve()).as_posix()
+
+
+def walk_files(root: Path, *, skip: Iterable[str] = ()) -> list[str]:
+    """Return every file under *root* as a sorted repo-relative POSIX path.
+
+    Directories named in ``ALWAYS_SKIPPED_DIRS``, and directories whose relative
+    path is listed in *skip*, are not descended into.
+    """
+
+    skipped = set(skip)
+    files: list[str] = []
+    for directory, dirnames, filenames in os.walk(root):
+        relative_dir = Path(directory).relative_to(root).as_posix()
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        dirnames[:] = sorted(
+            name for name in dirnames if name not in ALWAYS_SKIPPED_DIRS and f"{prefix}{name}" not in skipped
+        )
+        files.extend(f"{prefix}{name}" for name in sorted(filenames))
+    return files
@@ -0,0 +1,21 @@
+"""Small numeric helpers shared by timing reports."""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+__all__ = ["percentile"]
+
+
+def percentile(values: Sequence[float], percentile: float) -> float:
+    """Linear-interpolated percentile (same as numpy's default method); ``0.0`` when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percentile / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
@@ -0,0 +1,138 @@
+"""Tests for the warm CLI daemon and the forwarding client."""
+
+from __future__ import annotations
+
+import json
+import socket
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from typer.testing import CliRunner
+
+from sentinelkit.cli import client
+from sentinelkit.cli.daemon import SentinelDaemon
+from sentinelkit.cli.main import app
+from sentinelkit.utils.errors import SentinelKitError
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+
+runner = CliRunner()
+
+
+@contextmanager
+def running_daemon(root: Path) -> Iterator[SentinelDaemon]:
+    daemon = SentinelDaemon(root, idle_timeout=None)
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.serve_forever, kwargs={"ready": ready}, daemon=True)
+    thread.start()
+    assert ready.wait(30), "daemon did not start"
+    try:
+        yield daemon
+    finally:
+        client.request(root, {"op": "stop"})
+        thread.join(10)
+
+
+def _stale_socket(root: Path) -> Path:
+    path = root / client.DAEMON_SOCKET
+    path.parent.mkdir(parents=True, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.close()
+    return path
+
+
+def test_forwarded_command_matches_in_process_run(repo_root: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    argv = ["--root", str(repo_root), "--format", "json", "contracts", "validate"]
+    local = runner.invoke(app, argv)
+
+    with running_daemon(repo_root) as daemon:
+        assert (repo_root / client.DAEMON_SOCKET).stat().st_mode & 0o777 == 0o600
+        exit_code = client.forward(argv)
+        forwarded = capsys.readouterr().out
+        assert daemon.served == 1
+
+    assert exit_code == local.exit_code
+    assert json.loads(forwarded) == json.loads(local.stdout)
+    assert not (repo_root / client.DAEMON_SOCKET).exists()
+
+
+def test_forward_falls_back_to_in_process(
+    repo_root: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    root = ["--root", str(repo_root)]
+    assert client.forward([*root, "contracts", "validate"]) is None
+
+    with running_daemon(repo_root) as daemon:
+        assert client.forward([*root, "mcp", "smoke"]) is None
+        assert client.forward([*root, "selfcheck"]) is None
+        monkeypatch.setenv(client.NO_DAEMON_ENV, "1")
+        assert client.forward([*root, "contracts", "validate"]) is None
+        assert daemon.served == 0
+
+    monkeypatch.delenv(client.NO_DAEMON_ENV)
+    _stale_socket(repo_root)
+    assert client.forward([*root, "contracts", "validate"]) is None
+    assert capsys.readouterr().err == ""
+
+
+def test_daemon_reports_unusable_caller_state(repo_root: Path) -> None:
+    with running_daemon(repo_root) as daemon:
+        for state in ({"cwd": str(repo_root / "gone"), "env": {}}, {"cwd": str(repo_root), "env": ["PATH"]}):
+            response = client.request(repo_root, {"op": "run", "argv": ["--help"], **state}, timeout=30)
+            assert response is not None
+            assert response["ok"] is False
+            assert response["exit_code"] == 1
+            assert response["error"]["code"] == "daemon.invalid_state"
+            assert response["stderr"].startswith("[sentinel] Cannot run in the caller's environment")
+        assert daemon.served == 0
+        assert client.request(repo_root, {"op": "ping"}) is not None
+
+
+def test_daemon_claims_stale_socket_but_not_a_live_one(repo_root: Path) -> None:
+    _stale_socket(repo_root)
+
+    with running_daemon(repo_root) as daemon:
+        assert client.request(repo_root, {"op": "ping"})["pid"] == daemon.status()["pid"]
+        with pytest.raises(SentinelKitError) as excinfo:
+            SentinelDaemon(repo_root).serve_forever()
+
+    assert excinfo.value.payload.code == "daemon.already_running"
+
+
+def test_daemon_status_exits_nonzero_when_not_running(repo_root: Path) -> None:
+    result = runner.invoke(app, ["--root", str(repo_root), "--format", "json", "daemon", "status"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout) == {"ok": False, "running": False, "root": str(repo_root.resolve())}
+
+
+def test_daemon_start_status_stop_lifecycle(repo_root: Path) -> None:
+    def sentinel(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "sentinelkit.cli.main", "--root", str(repo_root), "--format", "json", *args],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+
+    started = sentinel("daemon", "start", "--idle-timeout", "60")
+    try:
+        assert started.returncode == 0, started.stderr
+        payload = json.loads(started.stdout)
+        assert payload["started"] is True
+
+        status = sentinel("daemon", "status")
+        assert status.returncode == 0
+        assert json.loads(status.stdout)["pid"] == payload["pid"]
+    finally:
+        stopped = sentinel("daemon", "stop")
+
+    assert json.loads(stopped.stdout)["stopped"] is True
+    assert not (repo_root / client.DAEMON_SOCKET).exists()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import shutil
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from sentinelkit.cli.main import app
@@ -89,6 +91,82 @@ def test_decision_append_dry_run(tmp_path: Path) -> None:
     assert '"dry_run": true' in payload
 
 
+def test_decision_append_from_jsonl(tmp_path: Path) -> None:
+    root = _init_repo(tmp_path)
+    batch = root / "batch.jsonl"
+    batch.write_text(
+        "\n".join(
+            json.dumps(
+                {
+                    "author": "Builder",
+                    "scope": ["docs"],
+                    "decision": f"Imported decision {number}",
+                    "rationale": "Bulk migration",
+                    "outputs": "docs/imported.md",
+                }
+            )
+            for number in range(2)
+        ),
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(
+        app,
+        ["--root", str(root), "--format", "json", "decisions", "append", "--from-jsonl", str(batch)],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert [entry["id"] for entry in json.loads(result.stdout)["decisions"]] == ["D-0003", "D-0004"]
+    ledger = (root / ".sentinel" / "DECISIONS.md").read_text(encoding="utf-8")
+    assert "Imported decision 1" in ledger
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("decision", 5, "'decision' must be a string"),
+        ("outputs", [{"a": 1}], "'outputs' must be a string or a list of strings"),
+        ("scope", 3, "'scope' must be a string or a list of strings"),
+    ],
+)
+def test_decision_append_from_jsonl_rejects_non_string_fields(
+    tmp_path: Path, field: str, value: object, message: str
+) -> None:
+    root = _init_repo(tmp_path)
+    batch = root / "batch.jsonl"
+    record = {"author": "Builder", "scope": "docs", "decision": "Migrate", "rationale": "Bulk migration"}
+    record[field] = value
+    batch.write_text(json.dumps(record), encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["--root", str(root), "--format", "json", "decisions", "append", "--from-jsonl", str(batch), "--dry-run"],
+    )
+
+    assert result.exit_code == 1
+    error = json.loads(result.stdout)["error"]
+    assert error["code"] == "decision.batch_parse"
+    assert error["message"] == f"{batch}:1: {message}"
+
+
+def test_decision_search_and_show_commands(tmp_path: Path) -> None:
+    root = _init_repo(tmp_path)
+
+    search = runner.invoke(
+        app,
+        ["--root", str(root), "--format", "json", "decisions", "search", "--path", "docs/sample.md", "--limit", "1"],
+    )
+    assert search.exit_code == 0, search.stdout
+    assert [entry["id"] for entry in json.loads(search.stdout)["decisions"]] == ["D-0001"]
+
+    show = runner.invoke(app, ["--root", str(root), "decisions", "show", "D-0002"])
+    assert show.exit_code == 0, show.stdout
+    assert "Decision: Add second entry" in show.stdout
+
+    missing = runner.invoke(app, ["--root", str(root), "decisions", "chain", "D-0042"])
+    assert missing.exit_code == 1
+
+
 def test_runbook_append_command(tmp_path: Path) -> None:
     root = _init_repo(tmp_path)
     result = runner.invoke(
@@ -146,3 +224,81 @@ def test_runbook_append_dry_run(tmp_path: Path) -> None:
     assert runbook.read_text(encoding="utf-8") == original
     assert preview.exists()
     assert '"dry_run": true' in result.stdout
+
+
+def test_queue_and_flush_commands(tmp_path: Path) -> None:
+    root = _init_repo(tmp_path)
+    base = ["--root", str(root), "--format", "json"]
+    for number in range(2):
+        queued = runner.invoke(
+            app,
+            [
+                *base,
+                "decisions",
+                "append",
+                "--author",
+                "Builder",
+                "--scope",
+                "docs",
+                "--decision",
+                f"Queued {number}",
+                "--rationale",
+                "Batch",
+                "--outputs",
+                "docs/a.md",
+                "--queue",
+            ],
+        )
+        assert queued.exit_code == 0, queued.stdout
+        assert json.loads(queued.stdout)["queued"] is True
+    runbook_queued = runner.invoke(
+        app,
+        [*base, "runbook", "append", "--section", "gaps", "--note", "queued note", "--author", "Router", "--queue"],
+    )
+    assert runbook_queued.exit_code == 0, runbook_queued.stdout
+
+    flushed = runner.invoke(app, [*base, "decisions", "flush"])
+    assert flushed.exit_code == 0, flushed.stdout
+    assert [item["id"] for item in json.loads(flushed.stdout)["decisions"]] == ["D-0003", "D-0004"]
+
+    runbook_flushed = runner.invoke(app, [*base, "runbook", "flush"])
+    assert runbook_flushed.exit_code == 0, runbook_flushed.stdout
+    assert json.loads(runbook_flushed.stdout)["sections"] == ["gaps"]
+    assert "queued note" in (root / ".sentinel" / "docs" / "IMPLEMENTATION.md").read_text(encoding="utf-8")
+
+
+def test_runbook_compact_command(tmp_path: Path) -> None:
+    root = _init_repo(tmp_path)
+    for day in (1, 2, 3):
+        appended = runner.invoke(
+            app,
+            [
+                "--root",
+                str(root),
+                "runbook",
+                "append",
+                "--section",
+                "gaps",
+                "--note",
+                f"gap {day}",
+                "--author",
+                "QA",
+                "--timestamp",
+                f"2025-07-0{day}T12:00Z",
+            ],
+        )
+        assert appended.exit_code == 0, appended.stdout
+
+    base = ["--root", str(root), "--format", "json", "runbook", "compact", "--keep", "1"]
+    preview = runner.invoke(app, [*base, "--dry-run"])
+    assert preview.exit_code == 0, preview.stdout
+    assert json.loads(preview.stdout)["archived"] == 2
+    archive = root / ".sentinel" / "docs" / "archive" / "IMPLEMENTATION-2025-Q3.md"
+    assert not archive.exists()
+
+    result = runner.invoke(app, base)
+    assert result.exit_code == 0, result.stdout
+    payload = json.loads(result.stdout)
+    assert payload["archives"] == {str(archive): 2}
+    assert "gap 1" in archive.read_text(encoding="utf-8")
+    assert "gap 1" not in (root / ".sentinel" / "docs" / "IMPLEMENTATION.md").read_text(encoding="utf-8")
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 
 from typer.testing import CliRunner
 
 from sentinelkit.cli import selfcheck as selfcheck_module
 from sentinelkit.cli.main import app
-from sentinelkit.cli.mcp.smoke import SmokeStep, SmokeSummary
+from sentinelkit.cli.mcp.smoke import SmokeStep, SmokeSummary, run_smoke
 from sentinelkit.cli.state import CLIContext, EnvironmentInfo
 
 runner = CliRunner()
@@ -42,6 +44,21 @@ def test_mcp_smoke_command(repo_root: Path) -> None:
     assert not preview_file.exists()
 
 
+def test_mcp_smoke_stops_when_cancelled(repo_root: Path) -> None:
+    cancel = threading.Event()
+    timer = threading.Timer(0.2, cancel.set)
+    timer.start()
+    started = time.perf_counter()
+    try:
+        summary = run_smoke(repo_root, cancel=cancel)
+    finally:
+        timer.cancel()
+
+    assert time.perf_counter() - started < 10
+    assert summary.ok is False
+    assert [step.name for step in summary.steps][-1] == "cancelled"
+
+
 def test_selfcheck_reports_mcp_success(monkeypatch, repo_root: Path) -> None:
     summary = SmokeSummary(
         ok=True,
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import json
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
 
 from typer.testing import CliRunner
 
 from sentinelkit.cli import main as cli_main
 from sentinelkit.cli import selfcheck as selfcheck_module
-from sentinelkit.cli.executor import CheckResult
-from sentinelkit.cli.state import CLIContext
+from sentinelkit.cli.executor import (
+    CheckResult,
+    CheckRun,
+    CheckSpec,
+    run_cancellable,
+    run_checks,
+)
+from sentinelkit.cli.history import HISTORY_ENV
+from sentinelkit.cli.mcp.smoke import SmokeSummary
+from sentinelkit.cli.state import CLIContext, EnvironmentInfo
 from sentinelkit.tests._selfcheck_helpers import make_check
 from sentinelkit.utils.errors import build_error_payload
 
@@ -49,3 +62,214 @@ def test_exit_code_nonzero_on_failure(monkeypatch):
     monkeypatch.setattr(selfcheck_module, "_build_checks", lambda: {"contracts": _failing_check})
     result = runner.invoke(cli_main.app, ["selfcheck"])
     assert result.exit_code == 1
+
+
+def test_no_record_leaves_history_alone(monkeypatch, tmp_path):
+    monkeypatch.setattr(selfcheck_module, "_build_checks", lambda: {"contracts": _ok_check})
+    monkeypatch.setenv(HISTORY_ENV, str(tmp_path / "history.jsonl"))
+    result = runner.invoke(cli_main.app, ["--root", str(tmp_path), "--format", "json", "selfcheck", "--no-record"])
+    assert result.exit_code == 0, result.output
+    assert not selfcheck_module.SelfcheckHistory(tmp_path).path.exists()
+
+
+def _context(root) -> CLIContext:
+    return CLIContext(
+        root=root,
+        format="json",
+        env=EnvironmentInfo(is_ci=False, platform="test", python_version="3.12"),
+    )
+
+
+def test_run_checks_passes_dependency_results(tmp_path):
+    order: list[str] = []
+
+    def first(_context, _run):
+        order.append("first")
+        return make_check(status="ok", name="first", message="from first")
+
+    def second(_context, run: CheckRun):
+        order.append("second")
+        return make_check(status="ok", name="second", message=run.dependencies["first"].data["message"])
+
+    results = run_checks(
+        _context(tmp_path),
+        {"second": CheckSpec(second, depends_on=("first",)), "first": CheckSpec(first)},
+        show_status=False,
+    )
+
+    assert order == ["first", "second"]
+    assert {result.name: result.data["message"] for result in results} == {
+        "first": "from first",
+        "second": "from first",
+    }
+
+
+def test_run_checks_overlaps_independent_checks(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waits(name):
+        def runner(_context):
+            barrier.wait()
+            return make_check(status="ok", name=name)
+
+        return runner
+
+    results = run_checks(_context(tmp_path), {"a": waits("a"), "b": waits("b")}, show_status=False)
+    assert [result.status for result in results] == ["ok", "ok"]
+
+
+def test_run_checks_times_out_and_cancels(tmp_path):
+    cancelled = threading.Event()
+
+    def hangs(_context, run: CheckRun):
+        run.cancel.wait(5)
+        cancelled.set()
+        return make_check(status="ok", name="slow")
+
+    def after(_context, run: CheckRun):
+        return make_check(status="ok", name="after", message=run.dependencies["slow"].error.code)
+
+    start = time.perf_counter()
+    results = run_checks(
+        _context(tmp_path),
+        {"slow": CheckSpec(hangs, timeout=0.2), "after": CheckSpec(after, depends_on=("slow",))},
+        show_status=False,
+    )
+
+    assert time.perf_counter() - start < 3
+    by_name = {result.name: result for result in results}
+    assert by_name["slow"].status == "fail"
+    assert by_name["slow"].error.code == "slow.timeout"
+    assert by_name["after"].data["message"] == "slow.timeout"
+    assert cancelled.wait(2)
+
+
+def test_run_checks_rejects_cycles_and_unknown_dependencies(tmp_path):
+    def never(_context, _run):  # pragma: no cover - must not be scheduled
+        raise AssertionError("should not run")
+
+    results = run_checks(
+        _context(tmp_path),
+        {
+            "a": CheckSpec(never, depends_on=("b",)),
+            "b": CheckSpec(never, depends_on=("a",)),
+            "c": CheckSpec(never, depends_on=("missing",)),
+            "d": lambda _context: make_check(status="ok", name="d"),
+        },
+        show_status=False,
+    )
+
+    codes = {result.name: result.error.code if result.error else None for result in results}
+    assert codes == {"a": "a.dependency_cycle", "b": "b.dependency_cycle", "c": "c.dependency_unknown", "d": None}
+
+
+def test_run_cancellable_kills_child_process(tmp_path):
+    run = CheckRun()
+    timer = threading.Timer(0.2, run.cancel.set)
+    timer.start()
+    start = time.perf_counter()
+    completed = run_cancellable([sys.executable, "-c", "import time; time.sleep(30)"], run, cwd=tmp_path)
+    assert completed is None
+    assert time.perf_counter() - start < 10
+
+
+def test_sentinel_check_runs_in_child_process(repo_root):
+    cwd = Path.cwd()
+    result = selfcheck_module._build_checks()["sentinels"](_context(repo_root))
+    assert Path.cwd() == cwd
+    assert result.status == "ok", result.data
+    assert result.data["exit_code"] == 0
+
+
+def test_mcp_check_reuses_sentinel_result(monkeypatch, repo_root):
+    seen: dict[str, object] = {}
+
+    def fake_smoke(root, *, reuse=None, **_kwargs):
+        seen.update(reuse or {})
+        return SmokeSummary(ok=True, command=["server"], steps=[], tool_results=dict(reuse or {}))
+
+    monkeypatch.setattr(selfcheck_module, "run_smoke", fake_smoke)
+    sentinels = make_check(status="ok", name="sentinels", message="pass")
+    spec = selfcheck_module._build_checks()["mcp"]
+    assert spec.depends_on == ("sentinels",)
+
+    result = spec(_context(repo_root), CheckRun(dependencies={"sentinels": sentinels}))
+
+    assert result.status == "ok"
+    assert seen == {"sentinel_run": {"message": "pass"}}
+
+
+def _run_gates(root):
+    checks = selfcheck_module._build_checks()
+    gates = {name: checks[name] for name in ("contracts", "context", "capsule")}
+    return {result.name: result for result in run_checks(_context(root), gates, show_status=False)}
+
+
+def test_gates_share_one_repository_scan(monkeypatch, repo_root):
+    walks: list[Path] = []
+    original = selfcheck_module.walk_files
+
+    def counting_walk(root, *, skip=()):
+        walks.append(root)
+        return original(root, skip=skip)
+
+    monkeypatch.setattr(selfcheck_module, "walk_files", counting_walk)
+    (repo_root / ".specify" / "specs" / "001-demo").mkdir(parents=True)
+    (repo_root / ".specify" / "specs" / "001-demo" / "spec.md").write_text("# Spec\n", encoding="utf-8")
+
+    results = _run_gates(repo_root)
+
+    assert walks == [repo_root]
+    assert results["contracts"].status == "ok"
+    assert results["contracts"].data["fixtures"] == 1
+    assert results["context"].status == "pending"
+    assert results["capsule"].status == "fail"
+    assert results["capsule"].data["failures"][0]["error"]["code"] == "capsule.missing_files"
+
+
+def test_contracts_gate_fails_on_invalid_fixture(repo_root):
+    fixture = repo_root / ".sentinel" / "contracts" / "fixtures" / "sample.v1" / "bad.json"
+    fixture.write_text('{"metadata": {"ProducedBy": "TEST-AGENT"}, "value": "nope"}', encoding="utf-8")
+
+    result = _run_gates(repo_root)["contracts"]
+
+    assert result.status == "fail"
+    assert result.error.code == "contracts.failed"
+    assert [failure["fixture"] for failure in result.data["failures"]] == [str(fixture)]
+
+
+def test_context_gate_lints_the_same_files_as_the_cli(repo_root):
+    limits_dir = repo_root / ".sentinel" / "context" / "limits"
+    limits_dir.mkdir(parents=True)
+    shutil.copy(Path(".sentinel/context/limits/context-limits.schema.json"), limits_dir)
+    (limits_dir / "context-limits.json").write_text(
+        json.dumps(
+            {
+                "defaultMaxLines": 5,
+                "forbiddenPaths": ["specs/private"],
+                "artifacts": [{"name": "specs", "globs": ["specs/**"]}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    for relative, lines in (("specs/a.md", 1), ("specs/nested/b.md", 9), ("specs/private/c.md", 9)):
+        path = repo_root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("line\n" * lines, encoding="utf-8")
+
+    gate = _run_gates(repo_root)["context"]
+    cli = runner.invoke(cli_main.app, ["--root", str(repo_root), "--format", "json", "context", "lint"])
+
+    cli_payload = json.loads(cli.stdout)
+    assert cli_payload["checkedFiles"] == gate.data["checkedFiles"] == 2
+    assert cli_payload["diagnostics"] == gate.data["diagnostics"]
+    assert [diag["path"] for diag in cli_payload["diagnostics"]] == ["specs/nested/b.md"]
+
+
+def test_gates_report_pending_without_configuration(tmp_path):
+    results = _run_gates(tmp_path)
+    assert {name: result.status for name, result in results.items()} == {
+        "contracts": "pending",
+        "context": "pending",
+        "capsule": "pending",
+    }
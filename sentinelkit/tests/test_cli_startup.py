@@ -0,0 +1,90 @@
+"""Import-time checks for CLI startup (``python -X importtime``)."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies only some subcommands need; none may load just to start the CLI.
+HEAVY_MODULES = ("pytest", "jinja2", "jsonschema", "yaml", "rich", "importlib.metadata")
+
+
+def _profile(code: str) -> tuple[dict[str, int], set[str]]:
+    """Run *code* under ``-X importtime``.
+
+    Returns cumulative import time (microseconds) per module plus every module
+    loaded by the end of the run. ``-X importtime`` does not log modules loaded
+    through ``importlib.import_module`` (how lazy subcommands load), so the
+    final ``sys.modules`` is reported as well.
+    """
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        "print('loaded-modules:', ' '.join(sorted(sys.modules)), file=sys.stderr)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    timings: dict[str, int] = {}
+    loaded: set[str] = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith("loaded-modules:"):
+            loaded.update(line.split()[1:])
+            continue
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        timings[module.strip()] = max(timings.get(module.strip(), 0), int(cumulative))
+    return timings, loaded | set(timings)
+
+
+def _slowest(timings: dict[str, int], count: int = 10) -> str:
+    ranked = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:count]
+    return ", ".join(f"{name}={micros / 1000:.1f}ms" for name, micros in ranked)
+
+
+def test_cli_entrypoint_import_stays_light() -> None:
+    timings, loaded = _profile("import sentinelkit.cli.main")
+
+    heavy = sorted(module for module in HEAVY_MODULES if module in loaded)
+    assert not heavy, f"CLI startup imports {heavy}; slowest imports: {_slowest(timings)}"
+    assert "sentinelkit.cli.main" in timings
+
+
+def test_forwarding_client_imports_only_the_standard_library() -> None:
+    timings, loaded = _profile("import sentinelkit.cli.client")
+
+    third_party = sorted(module for module in ("typer", "click", *HEAVY_MODULES) if module in loaded)
+    assert not third_party, f"client startup imports {third_party}; slowest imports: {_slowest(timings)}"
+    assert "sentinelkit.cli.main" not in loaded
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["decisions", "--help"], "sentinelkit.cli.decisions"),
+        (["runbook", "--help"], "sentinelkit.cli.runbook"),
+    ],
+)
+def test_subcommands_import_only_their_module(argv: list[str], expected: str) -> None:
+    code = (
+        "import sys\n"
+        "from sentinelkit.cli.main import app\n"
+        f"sys.argv = ['sentinel', *{argv!r}]\n"
+        "try:\n"
+        "    app()\n"
+        "except SystemExit as exc:\n"
+        "    assert not exc.code, exc.code\n"
+    )
+    timings, loaded = _profile(code)
+
+    assert expected in loaded
+    assert "sentinelkit.cli.selfcheck" not in loaded
+    heavy = sorted(module for module in ("pytest", "jinja2", "jsonschema") if module in loaded)
+    assert not heavy, f"`sentinel {' '.join(argv)}` imports {heavy}; slowest imports: {_slowest(timings)}"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import portalocker
 import pytest
 
 from sentinelkit.cli import decision_log
+from sentinelkit.cli.decision_index import load_index
 from sentinelkit.cli.decision_log import DecisionLedger, DecisionLedgerError, DecisionPayload
 
 FIXTURE_LEDGER = Path(__file__).parent / "fixtures" / "DECISIONS.sample.md"
@@ -105,3 +107,262 @@ def test_lock_contention_raises_error(tmp_path: Path, monkeypatch: pytest.Monkey
             ledger.append(payload)
 
     assert excinfo.value.payload.code == "decision.lock_timeout"
+
+
+def test_append_writes_sidecar_index_and_matches_full_rewrite(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    original = ledger_path.read_text(encoding="utf-8")
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+
+    payload = DecisionPayload(
+        author="Builder",
+        scope="docs",
+        decision="Indexed append",
+        rationale="Avoid rewriting the ledger",
+        outputs=["docs/sample.md"],
+        date_override="2025-02-01",
+    )
+    result = ledger.append(payload)
+
+    expected = decision_log._render_updated_ledger(original, "D-0004", result.entry)
+    assert ledger_path.read_text(encoding="utf-8") == expected
+
+    index = load_index(tmp_path / "cache" / "decisions.index.json")
+    assert index is not None
+    assert index.next_id == "D-0004"
+    assert set(index.entries) == {"D-0001", "D-0002", "D-0003"}
+    assert index.matches(ledger_path)
+    data = ledger_path.read_bytes()
+    assert data[index.entries["D-0003"] :].startswith(b"ID: D-0003")
+
+
+def test_append_keeps_crlf_line_endings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger_path.write_bytes(ledger_path.read_bytes().replace(b"\n", b"\r\n"))
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+
+    for decision in ("First", "Second"):
+        payload = DecisionPayload(
+            author="Builder",
+            scope="docs",
+            decision=decision,
+            rationale="Windows checkout",
+            outputs=["docs/sample.md"],
+        )
+        ledger.append(payload)
+
+    data = ledger_path.read_bytes()
+    assert data.count(b"\n") == data.count(b"\r\n")
+    assert b"## NEXT_ID\r\nD-0005" in data
+    index = load_index(tmp_path / "cache" / "decisions.index.json")
+    assert index is not None and index.newline == "\r\n"
+    assert data[index.entries["D-0004"] :].startswith(b"ID: D-0004\r\n")
+    text = ledger_path.read_text(encoding="utf-8")
+    assert text.index("Decision: First") < text.index("Decision: Second")
+
+
+def test_index_rebuilds_after_manual_edit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+    payload = DecisionPayload(
+        author="Builder",
+        scope="docs",
+        decision="First",
+        rationale="seed index",
+        outputs=["docs/sample.md"],
+    )
+    ledger.append(payload)
+
+    text = ledger_path.read_text(encoding="utf-8").replace("## NEXT_ID\nD-0004", "## NEXT_ID\nD-0002")
+    ledger_path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(DecisionLedgerError) as excinfo:
+        ledger.append(payload)
+    assert excinfo.value.payload.code == "decision.duplicate_id"
+
+
+def test_query_indexes_outputs_and_supersedes_chain(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+    ledger.append(
+        DecisionPayload(
+            author="Router",
+            scope="src/app",
+            decision="Replace sample ledger entry",
+            rationale="Second entry was wrong",
+            outputs=["src/app/main.py", "docs/sample.md"],
+            supersedes="D-0002",
+        )
+    )
+
+    assert [entry.id for entry in ledger.query(output="docs/sample.md")] == ["D-0001", "D-0002", "D-0003"]
+    assert [entry.id for entry in ledger.query(output="src")] == ["D-0003"]
+    assert [entry.id for entry in ledger.query(text="WRONG")] == ["D-0003"]
+    assert [entry.id for entry in ledger.query(author="scribe")] == ["D-0002"]
+    assert [entry.id for entry in ledger.chain("D-0002")] == ["D-0002", "D-0003"]
+    assert ledger.get("d-0001").decision == "Create sample decision ledger"
+
+    with pytest.raises(DecisionLedgerError) as excinfo:
+        ledger.get("D-0099")
+    assert excinfo.value.payload.code == "decision.not_found"
+
+
+def test_chain_includes_siblings_that_supersede_the_same_decision(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger = DecisionLedger(_copy_fixture(tmp_path))
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+    for supersedes in ("D-0001", "D-0001", "D-0003"):
+        ledger.append(
+            DecisionPayload(
+                author="Router",
+                scope="docs",
+                decision=f"Replace {supersedes}",
+                rationale="Split follow-up",
+                outputs=["docs/sample.md"],
+                supersedes=supersedes,
+            )
+        )
+
+    # D-0003 and D-0004 both supersede D-0001; D-0005 supersedes D-0003. D-0002 is unrelated.
+    expected = ["D-0001", "D-0003", "D-0004", "D-0005"]
+    assert [entry.id for entry in ledger.chain("D-0004")] == expected
+    assert [entry.id for entry in ledger.chain("D-0005")] == expected
+    assert [entry.id for entry in ledger.chain("D-0002")] == ["D-0002"]
+
+
+def test_append_many_allocates_consecutive_ids_in_one_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger = DecisionLedger(ledger_path)
+    calls: list[Path] = []
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda cwd: calls.append(cwd) or "abcdef1")
+
+    payloads = [
+        DecisionPayload(
+            author="Builder",
+            scope="docs",
+            decision=f"Bulk import {number}",
+            rationale="Migration",
+            outputs=[f"docs/{number}.md"],
+        )
+        for number in range(3)
+    ]
+    results = ledger.append_many(payloads)
+
+    assert [result.id for result in results] == ["D-0003", "D-0004", "D-0005"]
+    assert len(calls) == 1
+    text = ledger_path.read_text(encoding="utf-8")
+    assert "## NEXT_ID\nD-0006" in text
+    assert text.strip().endswith(results[-1].entry)
+    assert [entry.id for entry in ledger.query(text="bulk import")] == ["D-0003", "D-0004", "D-0005"]
+
+
+def test_append_many_validates_before_writing(tmp_path: Path) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    original = ledger_path.read_text(encoding="utf-8")
+    ledger = DecisionLedger(ledger_path)
+    payloads = [
+        DecisionPayload(author="Builder", scope="docs", decision="ok", rationale="ok", outputs=["a.md"]),
+        DecisionPayload(author="Builder", scope="docs", decision="bad", rationale="bad", outputs=[]),
+    ]
+
+    with pytest.raises(DecisionLedgerError):
+        ledger.append_many(payloads)
+    assert ledger_path.read_text(encoding="utf-8") == original
+
+
+def test_enqueue_from_threads_then_flush_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+
+    def _queue(number: int) -> None:
+        ledger.enqueue(
+            DecisionPayload(
+                author="Builder",
+                scope="docs",
+                decision=f"Queued {number}",
+                rationale="Concurrent agents",
+                outputs=[f"docs/{number}.md"],
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_queue, range(8)))
+    assert len(ledger.journal) == 8
+    assert "Queued" not in ledger_path.read_text(encoding="utf-8")
+
+    results = ledger.flush()
+
+    assert [result.id for result in results] == [f"D-{number:04d}" for number in range(3, 11)]
+    text = ledger_path.read_text(encoding="utf-8")
+    assert "## NEXT_ID\nD-0011" in text
+    assert sorted(entry.decision for entry in ledger.query(text="queued")) == sorted(f"Queued {n}" for n in range(8))
+    assert len(ledger.journal) == 0
+    assert ledger.flush() == []
+
+
+def test_flush_keeps_journal_when_ledger_write_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    original = ledger_path.read_text(encoding="utf-8")
+    ledger = DecisionLedger(ledger_path)
+    ledger.enqueue(DecisionPayload(author="Builder", scope="docs", decision="d", rationale="r", outputs=["a.md"]))
+
+    def _fail(*_args, **_kwargs) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(decision_log, "atomic_write_text", _fail)
+    with pytest.raises(OSError):
+        ledger.flush()
+
+    assert ledger_path.read_text(encoding="utf-8") == original
+    assert len(ledger.journal) == 1
+
+
+def test_flush_rejects_malformed_journal_records(tmp_path: Path) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    original = ledger_path.read_text(encoding="utf-8")
+    ledger = DecisionLedger(ledger_path)
+    ledger.journal.append(
+        {"author": "Builder", "scope": "docs", "decision": "d", "rationale": "r", "outputs": "x.py", "date": 2025}
+    )
+
+    with pytest.raises(DecisionLedgerError) as excinfo:
+        ledger.flush()
+
+    assert excinfo.value.payload.code == "decision.batch_parse"
+    assert excinfo.value.payload.message == "DECISIONS.md.journal record 1: 'date' must be a string"
+    assert ledger_path.read_text(encoding="utf-8") == original
+    assert len(ledger.journal) == 1
+
+
+def test_flush_drains_leftover_batch_and_new_records_together(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ledger_path = _copy_fixture(tmp_path)
+    ledger = DecisionLedger(ledger_path)
+    monkeypatch.setattr(decision_log, "_git_short_hash", lambda _: "abcdef1")
+    ledger.enqueue(DecisionPayload(author="Builder", scope="docs", decision="first", rationale="r", outputs=["a.md"]))
+
+    def _fail(*_args, **_kwargs) -> None:
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(decision_log, "atomic_write_text", _fail)
+        with pytest.raises(OSError):
+            ledger.flush()
+    ledger.enqueue(DecisionPayload(author="Builder", scope="docs", decision="second", rationale="r", outputs=["x.py"]))
+
+    results = ledger.flush()
+
+    assert [result.id for result in results] == ["D-0003", "D-0004"]
+    text = ledger_path.read_text(encoding="utf-8")
+    assert text.index("Decision: first") < text.index("Decision: second")
+    assert "Outputs: x.py\n" in text
+    assert len(ledger.journal) == 0
@@ -0,0 +1,66 @@
+"""Tests for the git metadata helpers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sentinelkit.utils import git as git_utils
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch):
+    git_utils.clear_cache()
+
+    def _no_subprocess(*_args, **_kwargs):
+        raise AssertionError("git subprocess should not run")
+
+    monkeypatch.setattr(git_utils.subprocess, "run", _no_subprocess)
+    yield
+    git_utils.clear_cache()
+
+
+def _init_git_dir(root: Path) -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    return git_dir
+
+
+def test_reads_loose_ref_and_invalidates_on_change(tmp_path: Path) -> None:
+    git_dir = _init_git_dir(tmp_path)
+    ref = git_dir / "refs" / "heads" / "main"
+    ref.write_text(f"{SHA_A}\n", encoding="utf-8")
+    nested = tmp_path / "pkg" / "module"
+    nested.mkdir(parents=True)
+
+    assert git_utils.short_head_hash(nested) == "aaaaaaa"
+
+    ref.write_text(f"{SHA_B}\n", encoding="utf-8")
+    stat = ref.stat()
+    os.utime(ref, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert git_utils.head_commit(nested) == SHA_B
+
+
+def test_reads_packed_refs_and_detached_head(tmp_path: Path) -> None:
+    git_dir = _init_git_dir(tmp_path)
+    (git_dir / "packed-refs").write_text(
+        f"# pack-refs with: peeled fully-peeled sorted\n{SHA_B} refs/heads/main\n",
+        encoding="utf-8",
+    )
+    assert git_utils.head_commit(tmp_path) == SHA_B
+
+    git_utils.clear_cache()
+    (git_dir / "HEAD").write_text(f"{SHA_A}\n", encoding="utf-8")
+    assert git_utils.short_head_hash(tmp_path, length=10) == "a" * 10
+
+
+def test_returns_none_outside_repository(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.setattr(git_utils, "_find_git_dirs", lambda _start: None)
+    assert git_utils.short_head_hash(tmp_path) is None
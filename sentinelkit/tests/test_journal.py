@@ -0,0 +1,56 @@
+"""Tests for the atomic write and journal helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sentinelkit.utils.io import atomic_write_text, read_text
+from sentinelkit.utils.journal import Journal, JournalError
+
+
+def test_atomic_write_replaces_without_leaving_temp_files(tmp_path: Path) -> None:
+    target = tmp_path / "nested" / "file.md"
+    atomic_write_text(target, "first\n")
+    atomic_write_text(target, "second\n")
+
+    assert read_text(target) == "second\n"
+    assert [path.name for path in target.parent.iterdir()] == ["file.md"]
+
+
+def test_journal_recovers_from_torn_tail(tmp_path: Path) -> None:
+    journal = Journal(tmp_path / "queue.journal")
+    journal.append({"n": 1})
+    with journal.path.open("ab") as handle:
+        handle.write(b'{"n": 2')  # writer died mid-append
+
+    assert len(journal) == 1
+    journal.append({"n": 3})
+    with journal.pending() as records:
+        assert records == [{"n": 1}, {"n": 3}]
+    assert len(journal) == 0
+
+
+def test_journal_keeps_records_when_drain_fails(tmp_path: Path) -> None:
+    journal = Journal(tmp_path / "queue.journal")
+    journal.append({"n": 1})
+
+    with pytest.raises(RuntimeError):
+        with journal.pending():
+            raise RuntimeError("compaction failed")
+    journal.append({"n": 2})
+
+    # The leftover batch and the records queued since drain together, oldest first.
+    with journal.pending() as records:
+        assert records == [{"n": 1}, {"n": 2}]
+    assert len(journal) == 0
+
+
+def test_journal_rejects_corrupt_middle_record(tmp_path: Path) -> None:
+    journal = Journal(tmp_path / "queue.journal")
+    journal.path.write_bytes(b'{"n": 1}\nnot-json\n{"n": 2}\n')
+
+    with pytest.raises(JournalError) as excinfo:
+        len(journal)
+    assert excinfo.value.payload.code == "journal.corrupt"
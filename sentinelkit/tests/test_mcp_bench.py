@@ -0,0 +1,108 @@
+"""Tests for the MCP load-testing harness."""
+
+from __future__ import annotations
+
+import json
+import socket
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+from typer.testing import CliRunner
+
+from sentinelkit.cli.main import app
+from sentinelkit.cli.mcp.bench import BenchConfig, _histogram, run_bench
+from sentinelkit.cli.mcp.server import SentinelMCPServer, ToolResponse
+from sentinelkit.tests._mcp_helpers import running_socket_server
+
+runner = CliRunner()
+
+
+def test_mcp_bench_pipelines_requests_per_client(repo_root: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "--root",
+            str(repo_root),
+            "--format",
+            "json",
+            "mcp",
+            "bench",
+            "--clients",
+            "2",
+            "--pipeline",
+            "4",
+            "--requests",
+            "12",
+            "--op",
+            "ping",
+            "--op",
+            "tools/list",
+            "--op",
+            "sentinel_decision_query",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    payload = json.loads(result.stdout)
+    assert payload["ok"] is True
+    assert payload["total"] == 24
+    operations = {entry["name"]: entry for entry in payload["operations"]}
+    assert set(operations) == {"ping", "tools/list", "tools/call[sentinel_decision_query]"}
+    for entry in operations.values():
+        assert entry["count"] == 8
+        assert sum(bucket["count"] for bucket in entry["histogram"]) == entry["count"]
+        assert entry["latency_ms"]["p50"] <= entry["latency_ms"]["max"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_mcp_bench_shares_running_server(repo_root: Path) -> None:
+    with running_socket_server(repo_root) as path:
+        report = run_bench(repo_root, BenchConfig(clients=3, pipeline=2, requests=10, connect=path))
+
+    assert report.ok, report.to_dict()
+    assert report.total == 30
+    # Default operations cover every advertised tool except the sentinel suite run.
+    assert "tools/call[sentinel_run]" not in report.operations
+    assert "tools/call[sentinel_context_mount]" in report.operations
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_mcp_bench_records_timeouts_and_keeps_going(repo_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_query(self: SentinelMCPServer, arguments: Mapping[str, Any]) -> ToolResponse:
+        time.sleep(0.5)
+        return ToolResponse.from_json({"ok": True, "decisions": []})
+
+    monkeypatch.setattr(SentinelMCPServer, "_handle_decision_query", slow_query)
+    config = BenchConfig(clients=1, pipeline=3, requests=3, operations=("sentinel_decision_query",), timeout=0.2)
+    with running_socket_server(repo_root) as path:
+        config.connect = path
+        report = run_bench(repo_root, config)
+
+    assert report.failures == []
+    assert report.ok is False
+    query = report.operations["tools/call[sentinel_decision_query]"]
+    # Every request is still accounted for after the first one times out.
+    assert (query.errors, query.timeouts, len(query.latencies)) == (0, 3, 3)
+    assert min(query.latencies) >= 0.2
+    assert report.to_dict()["timeouts"] == 3
+
+
+def test_mcp_bench_rejects_unknown_operation(repo_root: Path) -> None:
+    result = runner.invoke(
+        app,
+        ["--root", str(repo_root), "--format", "json", "mcp", "bench", "--clients", "1", "--op", "nope"],
+    )
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout)["error"]["code"] == "mcp.bench_unknown_operation"
+
+
+def test_histogram_buckets_are_upper_bounds() -> None:
+    assert _histogram([0.0004, 0.001, 0.0011, 9.0]) == [
+        {"le_ms": 0.5, "count": 1},
+        {"le_ms": 1.0, "count": 1},
+        {"le_ms": 2.0, "count": 1},
+        {"le_ms": None, "count": 1},
+    ]
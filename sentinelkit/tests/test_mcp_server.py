@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import json
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 import pytest
 
-from sentinelkit.cli.mcp.server import SentinelMCPServer
+from sentinelkit.cli.mcp.server import SentinelMCPServer, ToolResponse, _serve_async
+
 
 @pytest.fixture()
 def server(repo_root: Path) -> SentinelMCPServer:
@@ -31,6 +35,8 @@ def test_initialize_and_tools_list(server: SentinelMCPServer) -> None:
         "sentinel_contract_validate",
         "sentinel_run",
         "sentinel_decision_log",
+        "sentinel_decision_query",
+        "sentinel_context_mount",
     }
 
 
@@ -97,6 +103,46 @@ def test_decision_log_tool_dry_run(server: SentinelMCPServer, repo_root: Path) -
     assert preview_file.exists()
 
 
+def test_decision_query_tool(server: SentinelMCPServer) -> None:
+    response = _dispatch(
+        server,
+        {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {"name": "sentinel_decision_query", "arguments": {"path": "docs"}},
+        },
+    )
+    payload = response["result"]["content"][0]["json"]
+    assert payload["ok"] is True
+    assert [entry["id"] for entry in payload["decisions"]] == ["D-0001", "D-0002"]
+
+
+def test_context_mount_tool(server: SentinelMCPServer, repo_root: Path) -> None:
+    (repo_root / "docs").mkdir()
+    (repo_root / "docs" / "a.md").write_text("one\ntwo\nthree\n", encoding="utf-8")
+    (repo_root / "docs" / "b.md").write_text("four\n", encoding="utf-8")
+    response = _dispatch(
+        server,
+        {
+            "jsonrpc": "2.0",
+            "id": 8,
+            "method": "tools/call",
+            "params": {
+                "name": "sentinel_context_mount",
+                "arguments": {"entries": ["docs/*.md", "docs/a.md"], "max_lines": 2},
+            },
+        },
+    )
+    payload = response["result"]["content"][0]["json"]
+    assert payload["ok"] is True
+    mount = payload["mount"]
+    assert [item["path"] for item in mount["files"]] == ["docs/a.md"]
+    assert mount["files"][0]["content"] == "one\ntwo\n"
+    assert mount["omitted"] == ["docs/b.md"]
+    assert mount["truncated"] is True
+
+
 def test_unknown_tool_errors(server: SentinelMCPServer) -> None:
     response = _dispatch(
         server,
@@ -108,3 +154,28 @@ def test_unknown_tool_errors(server: SentinelMCPServer) -> None:
         },
     )
     assert response["error"]["code"] == -32601
+
+
+def test_pipelined_tool_calls_run_concurrently(repo_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    delay = 1.0
+
+    def slow_validate(self: SentinelMCPServer, arguments: Mapping[str, Any]) -> ToolResponse:
+        time.sleep(delay)
+        return ToolResponse.from_json({"ok": True})
+
+    monkeypatch.setattr(SentinelMCPServer, "_handle_contract_validate", slow_validate)
+    calls = [
+        {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": "sentinel_contract_validate"}}
+        for request_id in (1, 2)
+    ]
+    reader = io.BytesIO("".join(json.dumps(call) + "\n" for call in calls).encode("utf-8"))
+    writer = io.BytesIO()
+
+    started = time.perf_counter()
+    asyncio.run(_serve_async(root=repo_root, reader=reader, writer=writer))
+    elapsed = time.perf_counter() - started
+
+    responses = [json.loads(line) for line in writer.getvalue().decode("utf-8").splitlines()]
+    assert sorted(response["id"] for response in responses) == [1, 2]
+    assert all(response["result"]["content"][0]["json"]["ok"] for response in responses)
+    assert elapsed < delay * 1.8
@@ -0,0 +1,83 @@
+"""Tests for the id-correlated JSON-RPC client shared by MCP smoke and bench."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from sentinelkit.cli.mcp.client import JsonRpcClient
+
+
+class _RecordingWriter:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    def write(self, data: bytes) -> None:
+        self.messages.append(json.loads(data))
+
+    async def drain(self) -> None:
+        return None
+
+
+def _line(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+async def _until(condition) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never became true")
+
+
+def test_client_correlates_out_of_order_responses_and_routes_notifications() -> None:
+    async def scenario() -> None:
+        reader = asyncio.StreamReader()
+        writer = _RecordingWriter()
+        client = JsonRpcClient(reader, writer, trace=False)  # type: ignore[arg-type]
+        progress: list[Any] = []
+        client.on_notification("notifications/progress", progress.append)
+
+        first = asyncio.create_task(client.request("ping"))
+        second = asyncio.create_task(client.request("tools/list"))
+        await _until(lambda: len(writer.messages) == 2)
+
+        reader.feed_data(_line({"jsonrpc": "2.0", "method": "notifications/progress", "params": {"step": 1}}))
+        reader.feed_data(_line({"jsonrpc": "2.0", "id": 2, "result": {"tools": []}}))
+        reader.feed_data(_line({"jsonrpc": "2.0", "id": 1, "result": {}}))
+        assert await second == {"tools": []}
+        assert await first == {}
+        assert progress == [{"step": 1}]
+
+        reader.feed_data(_line({"jsonrpc": "2.0", "id": "srv-1", "method": "roots/list"}))
+        await _until(lambda: len(writer.messages) == 3)
+        assert writer.messages[-1]["id"] == "srv-1"
+        assert writer.messages[-1]["error"]["code"] == -32601
+
+        third = asyncio.create_task(client.request("ping"))
+        await _until(lambda: len(writer.messages) == 4)
+        reader.feed_eof()
+        with pytest.raises(RuntimeError, match="closed the connection"):
+            await third
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_client_error_response_raises() -> None:
+    async def scenario() -> None:
+        reader = asyncio.StreamReader()
+        writer = _RecordingWriter()
+        client = JsonRpcClient(reader, writer, trace=False)  # type: ignore[arg-type]
+        pending = asyncio.create_task(client.request("tools/call", {"name": "missing"}))
+        await _until(lambda: writer.messages)
+        reader.feed_data(_line({"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Unknown tool"}}))
+        with pytest.raises(RuntimeError, match="Unknown tool"):
+            await pending
+        await client.close()
+
+    asyncio.run(scenario())
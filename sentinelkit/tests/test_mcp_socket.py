@@ -0,0 +1,128 @@
+"""Tests for the Unix socket MCP transport and smoke --connect."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+from typer.testing import CliRunner
+
+from sentinelkit.cli import selfcheck as selfcheck_module
+from sentinelkit.cli.main import app
+from sentinelkit.cli.mcp.client import JsonRpcClient
+from sentinelkit.cli.mcp.server import (
+    DEFAULT_SOCKET,
+    SentinelMCPServer,
+    ToolResponse,
+    serve_socket,
+)
+from sentinelkit.cli.mcp.smoke import run_smoke
+from sentinelkit.cli.state import CLIContext, EnvironmentInfo
+from sentinelkit.tests._mcp_helpers import running_socket_server
+from sentinelkit.utils.errors import SentinelKitError
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+
+runner = CliRunner()
+
+
+def test_mcp_smoke_connects_to_running_server(repo_root: Path) -> None:
+    with running_socket_server(repo_root) as path:
+        # Two runs against the same server: ``exit`` only closes the connection.
+        for _ in range(2):
+            result = runner.invoke(
+                app,
+                [
+                    "--root",
+                    str(repo_root),
+                    "--format",
+                    "json",
+                    "mcp",
+                    "smoke",
+                    "--connect",
+                    str(DEFAULT_SOCKET),
+                    "--profile",
+                    "light",
+                ],
+            )
+            assert result.exit_code == 0, result.stdout
+            payload = json.loads(result.stdout)
+            assert payload["ok"] is True
+            assert payload["command"] == [f"unix:{path}"]
+            steps = {step["name"]: step for step in payload["steps"]}
+            assert steps["tools.call[sentinel_run]"]["detail"] == "skipped (light profile)"
+            assert set(payload["tool_results"]) == {"sentinel_contract_validate", "sentinel_decision_log"}
+        assert path.exists()
+    assert not path.exists()
+
+
+def test_mcp_smoke_connect_reports_unreachable_socket(repo_root: Path) -> None:
+    summary = run_smoke(repo_root, connect=repo_root / "missing.sock")
+
+    assert summary.ok is False
+    assert [step.name for step in summary.steps] == ["connect"]
+
+
+def test_serve_socket_replaces_stale_socket_and_refuses_live_one(repo_root: Path) -> None:
+    path = repo_root / DEFAULT_SOCKET
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    with running_socket_server(repo_root):
+        assert run_smoke(repo_root, connect=path, profile="light").ok
+        with pytest.raises(SentinelKitError) as excinfo:
+            asyncio.run(serve_socket(path, root=repo_root))
+        assert excinfo.value.payload.code == "mcp.socket_in_use"
+
+
+def test_slow_tool_call_does_not_stall_other_connections(repo_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_validate(self: SentinelMCPServer, arguments: Mapping[str, Any]) -> ToolResponse:
+        started.set()
+        release.wait(10)
+        return ToolResponse.from_json({"ok": True})
+
+    monkeypatch.setattr(SentinelMCPServer, "_handle_contract_validate", slow_validate)
+
+    async def scenario(path: Path) -> bool:
+        slow = JsonRpcClient(*await asyncio.open_unix_connection(str(path)), trace=False)
+        fast = JsonRpcClient(*await asyncio.open_unix_connection(str(path)), trace=False)
+        try:
+            call = asyncio.create_task(
+                slow.request("tools/call", {"name": "sentinel_contract_validate", "arguments": {}})
+            )
+            assert await asyncio.to_thread(started.wait, 10)
+            await asyncio.wait_for(fast.request("ping"), 5)
+            answered_while_busy = not release.is_set()
+            release.set()
+            await call
+            return answered_while_busy
+        finally:
+            release.set()
+            await slow.close()
+            await fast.close()
+
+    with running_socket_server(repo_root) as path:
+        assert asyncio.run(scenario(path)) is True
+
+
+def test_selfcheck_mcp_prefers_running_server(repo_root: Path) -> None:
+    context = CLIContext(
+        root=repo_root,
+        format="json",
+        env=EnvironmentInfo(is_ci=False, platform="test", python_version="3.12"),
+    )
+    with running_socket_server(repo_root) as path:
+        result = selfcheck_module._build_checks()["mcp"](context)
+
+    assert result.status == "ok", result.data
+    assert result.data["command"] == [f"unix:{path}"]
@@ -5,9 +5,15 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
+import portalocker
 import pytest
 
-from sentinelkit.runbook.updater import RunbookUpdater, RunbookUpdaterError
+from sentinelkit.runbook.updater import (
+    RunbookNote,
+    RunbookRetention,
+    RunbookUpdater,
+    RunbookUpdaterError,
+)
 
 
 def _write_minimal_runbook(path: Path) -> None:
@@ -65,3 +71,170 @@ def test_unknown_section_errors(tmp_path: Path) -> None:
 
     with pytest.raises(RunbookUpdaterError):
         updater.append(section="unknown", note="test", author="tester")
+
+
+def test_enqueue_and_flush_apply_notes_in_one_write(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    _write_minimal_runbook(runbook_path)
+    updater = RunbookUpdater(runbook_path)
+    stamp = datetime(2025, 11, 13, 12, 0, tzinfo=timezone.utc)
+
+    updater.enqueue(section="gaps", note="first gap", author="Router", timestamp=stamp)
+    updater.enqueue(section="ci", note="ci note", author="Builder", timestamp=stamp)
+    updater.enqueue(section="gaps", note="second gap", author="Router", timestamp=stamp)
+    assert "first gap" not in runbook_path.read_text(encoding="utf-8")
+
+    results = updater.flush()
+
+    assert [result.section.slug for result in results] == ["gaps", "ci", "gaps"]
+    contents = runbook_path.read_text(encoding="utf-8")
+    assert contents == results[-1].content
+    assert contents.index("first gap") < contents.index("second gap") < contents.index("## CI Workflow")
+    assert "- [2025-11-13 12:00Z] (Builder) ci note" in contents
+    assert updater.flush() == []
+
+
+def test_append_many_matches_sequential_appends(tmp_path: Path) -> None:
+    stamp = datetime(2025, 11, 13, 12, 0, tzinfo=timezone.utc)
+    notes = [
+        RunbookNote(section="gaps", note="flaky smoke on windows", author="QA", timestamp=stamp),
+        RunbookNote(section="stack", note="uv-only runtime", author="Builder", timestamp=stamp),
+        RunbookNote(section="gaps", note="schema drift in fixtures", author="QA", timestamp=stamp),
+    ]
+    batched_path = tmp_path / "batched.md"
+    sequential_path = tmp_path / "sequential.md"
+    _write_minimal_runbook(batched_path)
+    _write_minimal_runbook(sequential_path)
+
+    results = RunbookUpdater(batched_path).append_many(notes)
+    sequential = RunbookUpdater(sequential_path)
+    for item in notes:
+        sequential.append(section=item.section, note=item.note, author=item.author, timestamp=item.timestamp)
+
+    assert [result.section.slug for result in results] == ["gaps", "stack", "gaps"]
+    contents = batched_path.read_text(encoding="utf-8")
+    assert contents == sequential_path.read_text(encoding="utf-8")
+    assert contents.index("flaky smoke on windows") < contents.index("schema drift in fixtures")
+
+
+def test_append_many_validates_before_writing(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    _write_minimal_runbook(runbook_path)
+    original = runbook_path.read_text(encoding="utf-8")
+    updater = RunbookUpdater(runbook_path)
+
+    with pytest.raises(RunbookUpdaterError) as excinfo:
+        updater.append_many(
+            [
+                RunbookNote(section="gaps", note="valid", author="QA"),
+                RunbookNote(section="nope", note="invalid", author="QA"),
+            ]
+        )
+    assert excinfo.value.payload.code == "runbook.unknown_section"
+    assert runbook_path.read_text(encoding="utf-8") == original
+
+    with pytest.raises(RunbookUpdaterError) as excinfo:
+        updater.append_many([])
+    assert excinfo.value.payload.code == "runbook.empty_batch"
+
+
+def test_compact_moves_old_notes_into_quarterly_archives(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    _write_minimal_runbook(runbook_path)
+    updater = RunbookUpdater(runbook_path)
+    utc = timezone.utc
+    updater.append_many(
+        [
+            RunbookNote(section="gaps", note="q1 gap", author="QA", timestamp=datetime(2025, 2, 1, tzinfo=utc)),
+            RunbookNote(section="gaps", note="q3 gap", author="QA", timestamp=datetime(2025, 8, 1, tzinfo=utc)),
+            RunbookNote(section="ci", note="old ci", author="QA", timestamp=datetime(2025, 8, 2, tzinfo=utc)),
+            RunbookNote(section="gaps", note="new gap", author="QA", timestamp=datetime(2025, 11, 1, tzinfo=utc)),
+        ]
+    )
+
+    policy = RunbookRetention(keep_per_section=2, max_age_days=60)
+    now = datetime(2025, 11, 13, tzinfo=utc)
+    result = updater.compact(policy, now=now)
+
+    archive_dir = tmp_path / "archive"
+    assert result.archived == 3
+    assert result.archives == {
+        archive_dir / "IMPLEMENTATION-2025-Q1.md": 1,
+        archive_dir / "IMPLEMENTATION-2025-Q3.md": 2,
+    }
+    contents = runbook_path.read_text(encoding="utf-8")
+    assert "new gap" in contents
+    assert "q1 gap" not in contents and "q3 gap" not in contents and "old ci" not in contents
+    assert "- legacy entry" in contents
+    assert "--section ci --note" in contents  # emptied section gets its placeholder back
+    q3 = (archive_dir / "IMPLEMENTATION-2025-Q3.md").read_text(encoding="utf-8")
+    assert q3.startswith("# Implementation Notes Archive (2025-Q3)")
+    assert q3.index("## Known Gaps") < q3.index("q3 gap") < q3.index("## CI Workflow") < q3.index("old ci")
+
+    assert updater.compact(policy, now=now).archived == 0
+
+
+def test_compact_keeps_newest_notes_by_timestamp_not_position(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    updater = RunbookUpdater(runbook_path)
+    utc = timezone.utc
+    updater.append(section="gaps", note="current gap", author="QA", timestamp=datetime(2025, 5, 1, tzinfo=utc))
+    updater.append(section="gaps", note="back-dated gap", author="QA", timestamp=datetime(2020, 1, 1, tzinfo=utc))
+
+    result = updater.compact(RunbookRetention(keep_per_section=1), now=datetime(2025, 6, 1, tzinfo=utc))
+
+    assert result.archives == {tmp_path / "archive" / "IMPLEMENTATION-2020-Q1.md": 1}
+    contents = runbook_path.read_text(encoding="utf-8")
+    assert "current gap" in contents
+    assert "back-dated gap" not in contents
+
+
+def test_compact_does_not_duplicate_already_archived_notes(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    updater = RunbookUpdater(runbook_path)
+    stamp = datetime(2025, 4, 1, tzinfo=timezone.utc)
+    updater.append(section="gaps", note="replayed", author="QA", timestamp=stamp)
+    interrupted = runbook_path.read_text(encoding="utf-8")
+
+    updater.compact(RunbookRetention(keep_per_section=0))
+    runbook_path.write_text(interrupted, encoding="utf-8")  # simulate a crash before the runbook rewrite
+    updater.compact(RunbookRetention(keep_per_section=0))
+
+    archive = (tmp_path / "archive" / "IMPLEMENTATION-2025-Q2.md").read_text(encoding="utf-8")
+    assert archive.count("replayed") == 1
+    with pytest.raises(RunbookUpdaterError) as excinfo:
+        updater.compact(RunbookRetention())
+    assert excinfo.value.payload.code == "runbook.invalid_retention"
+
+
+def test_append_rotates_automatically_past_size_threshold(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    updater = RunbookUpdater(runbook_path, retention=RunbookRetention(keep_per_section=3, max_bytes=1400))
+    archived = 0
+    for day in range(1, 21):
+        result = updater.append(
+            section="flow",
+            note=f"step {day:02d}",
+            author="Builder",
+            timestamp=datetime(2025, 10, day, tzinfo=timezone.utc),
+        )
+        archived += result.archived
+
+    contents = runbook_path.read_text(encoding="utf-8")
+    assert len(contents.encode("utf-8")) <= 1400
+    assert "step 20" in contents
+    assert archived > 0
+    archive = (tmp_path / "archive" / "IMPLEMENTATION-2025-Q4.md").read_text(encoding="utf-8")
+    assert "step 01" in archive and "step 01" not in contents
+
+
+def test_append_lock_contention_raises_error(tmp_path: Path) -> None:
+    runbook_path = tmp_path / "IMPLEMENTATION.md"
+    _write_minimal_runbook(runbook_path)
+    updater = RunbookUpdater(runbook_path, lock_timeout=0.1)
+
+    with portalocker.Lock(str(updater.lock_path), timeout=1, mode="w"):
+        with pytest.raises(RunbookUpdaterError) as excinfo:
+            updater.append(section="gaps", note="blocked", author="tester")
+
+    assert excinfo.value.payload.code == "runbook.lock_timeout"
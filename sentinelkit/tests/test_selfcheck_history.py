@@ -0,0 +1,129 @@
+"""Tests for the selfcheck timing history."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sentinelkit.cli import history as history_module
+from sentinelkit.cli import main as cli_main
+from sentinelkit.cli import selfcheck as selfcheck_module
+from sentinelkit.cli.history import HISTORY_ENV, HISTORY_PATH, SelfcheckHistory
+from sentinelkit.tests._selfcheck_helpers import make_check
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def default_history_location(monkeypatch: pytest.MonkeyPatch) -> None:
+    """These tests exercise the per-root default, not the session-wide override."""
+
+    monkeypatch.delenv(HISTORY_ENV, raising=False)
+
+
+def _record(history: SelfcheckHistory, **durations: float) -> None:
+    results = [make_check(status="ok", name=name, duration=value) for name, value in durations.items()]
+    history.append(results, ok=True)
+
+
+def test_timings_report_percentiles_and_flag_regressions(tmp_path: Path) -> None:
+    history = SelfcheckHistory(tmp_path)
+    for value in (1.0, 1.1, 1.2, 1.0, 1.1, 1.2):
+        _record(history, sentinels=value, contracts=0.01)
+    _record(history, sentinels=2.5, contracts=0.02)
+
+    timings = history.timings(window=50, percentile=95)
+
+    sentinels = timings["sentinels"]
+    assert sentinels.samples == 7
+    assert sentinels.p50 == pytest.approx(1.1)
+    assert sentinels.last == 2.5
+    assert sentinels.threshold == pytest.approx(1.2)
+    assert sentinels.regressed
+    # Doubling a 10ms check is below the noise floor.
+    assert not timings["contracts"].regressed
+
+
+def test_timings_need_enough_earlier_runs(tmp_path: Path) -> None:
+    history = SelfcheckHistory(tmp_path)
+    _record(history, mcp=0.5)
+    _record(history, mcp=9.0)
+
+    timing = history.timings()["mcp"]
+    assert timing.threshold is None
+    assert not timing.regressed
+
+
+def test_pending_checks_do_not_count_towards_percentiles(tmp_path: Path) -> None:
+    history = SelfcheckHistory(tmp_path)
+    history.append([make_check(status="pending", name="capsule", duration=0.0)], ok=True)
+    assert history.timings() == {}
+
+
+def test_runs_reads_only_the_tail_and_skips_torn_lines(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(history_module, "TAIL_CHUNK", 64)
+    history = SelfcheckHistory(tmp_path)
+    for index in range(40):
+        _record(history, sentinels=float(index))
+    with history.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"checks": {"sentinels"')
+
+    runs = history.runs(5)
+
+    assert [run["checks"]["sentinels"]["duration"] for run in runs] == [35.0, 36.0, 37.0, 38.0, 39.0]
+    assert history.timings(window=3)["sentinels"].samples == 3
+
+
+def test_selfcheck_records_history_and_exposes_timings(monkeypatch, tmp_path: Path) -> None:
+    checks = {"contracts": lambda _context: make_check(status="ok", name="contracts", duration=0.2)}
+    monkeypatch.setattr(selfcheck_module, "_build_checks", lambda: checks)
+
+    for _ in range(2):
+        result = runner.invoke(cli_main.app, ["--root", str(tmp_path), "--format", "json", "selfcheck"])
+        assert result.exit_code == 0, result.output
+
+    payload = json.loads(result.stdout)
+    assert payload["regressions"] == []
+    assert payload["checks"][0]["timing"]["samples"] == 2
+    assert payload["checks"][0]["timing"]["p50"] == pytest.approx(0.2)
+    assert len((tmp_path / HISTORY_PATH).read_text(encoding="utf-8").splitlines()) == 2
+
+    result = runner.invoke(cli_main.app, ["--root", str(tmp_path), "--format", "json", "selfcheck", "--no-record"])
+    assert "timing" not in json.loads(result.stdout)["checks"][0]
+    assert len((tmp_path / HISTORY_PATH).read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_selfcheck_trend_does_not_run_checks(monkeypatch, tmp_path: Path) -> None:
+    def _fail():  # pragma: no cover - must not be called
+        raise AssertionError("checks should not run for --trend")
+
+    monkeypatch.setattr(selfcheck_module, "_build_checks", _fail)
+    history = SelfcheckHistory(tmp_path)
+    for value in (1.0, 1.0, 1.0, 1.0, 1.0, 3.0):
+        _record(history, sentinels=value)
+
+    result = runner.invoke(
+        cli_main.app,
+        ["--root", str(tmp_path), "--format", "json", "selfcheck", "--trend", "--percentile", "90"],
+    )
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert payload["percentile"] == 90
+    assert payload["regressions"] == ["sentinels"]
+    assert payload["checks"][0]["last"] == 3.0
+
+
+def test_history_location_can_be_overridden_by_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    override = tmp_path / "elsewhere" / "history.jsonl"
+    monkeypatch.setenv(HISTORY_ENV, str(override))
+
+    history = SelfcheckHistory(tmp_path / "repo")
+    _record(history, sentinels=1.0)
+
+    assert history.path == override
+    assert len(override.read_text(encoding="utf-8").splitlines()) == 1
+    assert SelfcheckHistory(tmp_path, path="custom.jsonl").path == tmp_path / "custom.jsonl"
@@ -43,6 +43,19 @@ def test_prompts_render_cli(tmp_path: Path) -> None:
     assert agent_result.exit_code == 0, agent_result.output
     assert "You are **Builder**" in agent_result.stdout
 
+    streamed = tmp_path / "streamed.md"
+    stream_result = runner.invoke(
+        app, [*base_args, "--mode", "capsule", "--agent", "builder", "--stream", "--output", str(streamed)]
+    )
+    assert stream_result.exit_code == 0, stream_result.output
+    assert streamed.read_text(encoding="utf-8").strip() == agent_result.stdout.strip()
+
+    bundle_dir = tmp_path / "bundle"
+    bundle_result = runner.invoke(app, [*base_args, "--mode", "bundle", "--output", str(bundle_dir)])
+    assert bundle_result.exit_code == 0, bundle_result.output
+    assert (bundle_dir / "router.md").read_text(encoding="utf-8").strip() == router_result.stdout.strip()
+    assert (bundle_dir / "builder.md").read_text(encoding="utf-8").strip() == agent_result.stdout.strip()
+
 
 def test_snippets_sync_cli(tmp_path: Path) -> None:
     readme = tmp_path / "README.md"
@@ -53,6 +66,14 @@ def test_snippets_sync_cli(tmp_path: Path) -> None:
     snippet_dir = tmp_path / ".sentinel/snippets"
     snippet_dir.mkdir(parents=True)
     (snippet_dir / "capsules.md").write_text("replacement", encoding="utf-8")
+    check_args = ["--root", str(tmp_path), "snippets", "sync", "--marker", "SENTINEL:CAPSULES", "--check"]
+
+    drift = runner.invoke(app, check_args)
+    assert drift.exit_code == 1, drift.output
+    assert "--- a/README.md" in drift.stdout
+    assert "-old\n" in drift.stdout and "+replacement\n" in drift.stdout
+    assert "old" in readme.read_text(encoding="utf-8")
+    assert not (tmp_path / "README.md.bak").exists()
 
     result = runner.invoke(
         app,
@@ -68,6 +89,10 @@ def test_snippets_sync_cli(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
     assert "replacement" in readme.read_text(encoding="utf-8")
 
+    clean = runner.invoke(app, ["--format", "json", *check_args])
+    assert clean.exit_code == 0, clean.output
+    assert json.loads(clean.stdout) == {"ok": True, "drift": []}
+
 
 def test_sentinels_run_cli(tmp_path: Path) -> None:
     workspace = tmp_path / "workspace"
@@ -10,7 +10,9 @@ from sentinelkit.context.allowed_context import (
     AllowedContextError,
     assert_include_exists,
     build_allowed_context,
+    clear_expansion_cache,
     discover_allowed_context,
+    expand_include,
     normalize_include,
 )
 
@@ -65,6 +67,55 @@ def test_build_allowed_context_matches_entry_paths() -> None:
     assert discover_paths == [entry.relative_path for entry in entries]
 
 
+def test_expand_include_counts_glob_matches_in_sorted_order(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    (docs / "nested").mkdir(parents=True)
+    (docs / "b.md").write_text("one\ntwo\n", encoding="utf-8")
+    (docs / "a.md").write_text("solo", encoding="utf-8")
+    (docs / "notes.txt").write_text("skip\n", encoding="utf-8")
+    (docs / "nested" / "c.md").write_text("x\ny\nz", encoding="utf-8")
+
+    shallow = expand_include(tmp_path, "docs/*.md")
+    assert [match.relative_path for match in shallow.matches] == ["docs/a.md", "docs/b.md"]
+    assert shallow.total_lines == 1 + 3
+    assert shallow.total_bytes == 4 + 8
+    assert not shallow.truncated
+
+    deep = expand_include(tmp_path, "docs/**/*.md")
+    assert [match.relative_path for match in deep.matches] == ["docs/a.md", "docs/b.md", "docs/nested/c.md"]
+
+    directory = expand_include(tmp_path, "docs")
+    assert len(directory.matches) == 4
+
+
+def test_expand_include_stops_at_match_cap_and_refreshes_on_change(tmp_path: Path) -> None:
+    clear_expansion_cache()
+    for index in range(5):
+        (tmp_path / f"f{index}.md").write_text("line\n", encoding="utf-8")
+
+    capped = expand_include(tmp_path, "*.md", max_matches=3)
+    assert [match.relative_path for match in capped.matches] == ["f0.md", "f1.md", "f2.md"]
+    assert capped.truncated
+
+    assert len(expand_include(tmp_path, "*.md").matches) == 5
+    (tmp_path / "f5.md").write_text("line\n", encoding="utf-8")
+    assert len(expand_include(tmp_path, "*.md").matches) == 6
+
+
+def test_discover_allowed_context_reports_glob_volume(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("1\n2", encoding="utf-8")
+    (docs / "b.md").write_text("3", encoding="utf-8")
+
+    entries = discover_allowed_context(paths=["docs/*.md"], root=tmp_path)
+    glob_entry = next(entry for entry in entries if entry.is_glob)
+    assert glob_entry.line_count == 3
+    assert glob_entry.match_count == 2
+    assert glob_entry.byte_size == 4
+    assert not glob_entry.truncated
+
+
 def _expected_line_count(path: Path) -> int:
     """Mirror the module's newline counting logic for assertions."""
     text = path.read_text(encoding="utf-8")
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
+from sentinelkit.context.limits import load_context_limits
 from sentinelkit.context.lint import ContextLintError, lint_context
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -34,6 +36,17 @@ def test_lint_context_reports_expected_diagnostics() -> None:
     }
 
 
+def test_lint_context_matches_globs_against_a_supplied_file_list() -> None:
+    walked = lint_context(root=REPO_ROOT, config_path=CONFIG_PATH, schema_path=SCHEMA_PATH)
+    files = [path.relative_to(REPO_ROOT).as_posix() for path in (REPO_ROOT / CAPSULE_DIR).rglob("*") if path.is_file()]
+    limits = load_context_limits(root=REPO_ROOT, config_path=CONFIG_PATH, schema_path=SCHEMA_PATH)
+
+    listed = lint_context(root=REPO_ROOT, limits=limits, files=files)
+
+    assert listed == walked
+    assert lint_context(root=REPO_ROOT, limits=limits, files=[]).checked_files == 0
+
+
 def test_lint_context_capsule_filter_limits_results() -> None:
     summary = lint_context(
         root=REPO_ROOT,
@@ -77,3 +90,75 @@ def test_lint_context_blocks_capsule_outside_root() -> None:
             schema_path=SCHEMA_PATH,
             capsules=["../capsules/outside.md"],
         )
+
+
+def test_lint_context_enforces_mounted_volume_of_globs(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for index in range(4):
+        (docs / f"page{index}.md").write_text("a\nb\nc\n", encoding="utf-8")
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    (specs / "capsule.md").write_text(
+        "# Capsule\n\n## Allowed Context\n- docs/*.md\n- docs/*.txt\n",
+        encoding="utf-8",
+    )
+    config = tmp_path / "limits.json"
+    config.write_text(
+        json.dumps(
+            {
+                "defaultMaxLines": 50,
+                "maxGlobMatches": 3,
+                "maxIncludeLines": 8,
+                "forbiddenPaths": [".git"],
+                "artifacts": [{"name": "capsules", "globs": ["specs/*.md"], "enforceAllowedContext": True}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    summary = lint_context(root=tmp_path, config_path=config, schema_path=REPO_ROOT / SCHEMA_PATH)
+
+    codes = {diag.code: diag for diag in summary.diagnostics}
+    assert set(codes) == {"EMPTY_GLOB", "GLOB_MATCH_LIMIT", "INCLUDE_MAX_LINES"}
+    assert "docs/*.txt" in codes["EMPTY_GLOB"].message
+    assert "12 lines across 3 file(s)" in codes["INCLUDE_MAX_LINES"].message
+    assert summary.should_fail()
+
+
+def test_lint_context_totals_mounted_volume_per_capsule(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "big.md").write_text("x\n" * 9, encoding="utf-8")
+    (docs / "mid.md").write_text("x\n" * 4, encoding="utf-8")
+    (docs / "small.md").write_text("x\n", encoding="utf-8")
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    (specs / "heavy.md").write_text(
+        "# Heavy\n\n## Allowed Context\n- docs/*.md\n- docs/big.md\n", encoding="utf-8"
+    )
+    (specs / "light.md").write_text("# Light\n\n## Allowed Context\n- docs/small.md\n", encoding="utf-8")
+    (specs / "near.md").write_text("# Near\n\n## Allowed Context\n- docs/mid.md\n", encoding="utf-8")
+    config = tmp_path / "limits.json"
+    config.write_text(
+        json.dumps(
+            {
+                "defaultMaxLines": 50,
+                "warningThreshold": 0.5,
+                "maxMountedLines": 8,
+                "forbiddenPaths": [".git"],
+                "artifacts": [{"name": "capsules", "globs": ["specs/*.md"], "enforceAllowedContext": True}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    summary = lint_context(root=tmp_path, config_path=config, schema_path=REPO_ROOT / SCHEMA_PATH)
+
+    by_path = {diag.path: diag for diag in summary.diagnostics}
+    assert set(by_path) == {"specs/heavy.md", "specs/near.md"}
+    heavy = by_path["specs/heavy.md"]
+    assert heavy.code == "MOUNTED_MAX_LINES"
+    assert heavy.message.startswith("mounts 17 lines from 3 file(s), over the budget of 8")
+    assert heavy.message.endswith("heaviest: docs/big.md (10), docs/mid.md (5), docs/small.md (2)")
+    assert by_path["specs/near.md"].code == "MOUNTED_NEAR_LIMIT"
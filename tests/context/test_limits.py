@@ -89,3 +89,22 @@ def test_invalid_config_raises_context_limits_error(tmp_path: Path) -> None:
         load_context_limits(root=tmp_path, config_path=config_file, schema_path=SCHEMA_FILE)
 
     assert excinfo.value.payload.code in {"CONTEXT_LIMITS_VALIDATE", "CONTEXT_LIMITS_THRESHOLD"}
+
+
+def test_load_context_limits_reuses_parse_until_config_changes(tmp_path: Path) -> None:
+    config_file = tmp_path / "context-limits.json"
+    payload = {
+        "defaultMaxLines": 200,
+        "forbiddenPaths": [".git"],
+        "artifacts": [{"name": "capsules", "globs": [".specify/specs/*/capsule.md"]}],
+    }
+    config_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    first = load_context_limits(root=tmp_path, config_path=config_file, schema_path=SCHEMA_FILE)
+    assert load_context_limits(root=tmp_path, config_path=config_file, schema_path=SCHEMA_FILE) is first
+
+    payload["defaultMaxLines"] = 250
+    config_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    reloaded = load_context_limits(root=tmp_path, config_path=config_file, schema_path=SCHEMA_FILE)
+    assert reloaded.default_max_lines == 250
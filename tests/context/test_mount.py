@@ -0,0 +1,65 @@
+"""Tests for Allowed Context mount materialization."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sentinelkit.context.mount import ContextMount, ReadCache
+
+
+def _workspace(tmp_path: Path) -> Path:
+    (tmp_path / "docs" / "nested").mkdir(parents=True)
+    (tmp_path / "docs" / "a.md").write_text("a1\na2\na3\n", encoding="utf-8")
+    (tmp_path / "docs" / "nested" / "b.md").write_text("b1\nb2\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("readme\n", encoding="utf-8")
+    (tmp_path / "logo.bin").write_bytes(b"\xff\xfe\x00")
+    return tmp_path
+
+
+def test_mount_expands_globs_and_directories_once(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    cache = ReadCache()
+    mount = ContextMount(root, read_cache=cache)
+
+    result = mount.mount(["README.md", "docs/**/*.md", "docs", "logo.bin", "missing.md"])
+
+    assert [item.path for item in result.files] == ["README.md", "docs/a.md", "docs/nested/b.md"]
+    assert result.total_lines == 6
+    assert result.skipped == ["logo.bin"]
+    assert len(result.errors) == 1 and result.errors[0].startswith("missing.md")
+    assert not result.truncated
+
+    mount.mount(["docs/a.md"])
+    assert cache.hits == 1
+
+
+def test_mount_truncates_deterministically_at_line_budget(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    entries = ["docs/a.md", "docs/nested/b.md", "README.md"]
+
+    first = ContextMount(root, max_lines=4, read_cache=ReadCache()).mount(entries)
+    second = ContextMount(root, max_lines=4, read_cache=ReadCache()).mount(entries)
+
+    assert first.to_dict() == second.to_dict()
+    assert [(item.path, item.line_count, item.truncated) for item in first.files] == [
+        ("docs/a.md", 3, False),
+        ("docs/nested/b.md", 1, True),
+    ]
+    assert first.files[1].content == "b1\n"
+    assert first.omitted == ["README.md"]
+
+
+def test_mount_token_budget(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    result = ContextMount(root, max_tokens=2, read_cache=ReadCache()).mount(["docs/a.md"])
+
+    assert result.files[0].content == "a1\na2\n"
+    assert result.total_tokens <= 2
+
+
+def test_mount_records_entries_over_match_cap(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    result = ContextMount(root, max_matches=1, read_cache=ReadCache()).mount(["docs"])
+
+    assert [item.path for item in result.files] == ["docs/a.md"]
+    assert result.capped == ["docs"]
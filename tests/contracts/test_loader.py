@@ -59,6 +59,19 @@ def test_load_schemas_cache_and_force_reload(tmp_path: Path) -> None:
     assert schemas_force["alpha"].schema["type"] == "array"
 
 
+def test_new_loaders_share_parsed_schemas_until_file_changes(tmp_path: Path) -> None:
+    contracts_dir = tmp_path / ".sentinel" / "contracts"
+    (contracts_dir / "fixtures").mkdir(parents=True)
+    target = contracts_dir / "contract.yaml"
+    create_schema(target, name="alpha")
+
+    first = ContractLoader(root=tmp_path).get_schema("alpha")
+    assert ContractLoader(root=tmp_path).get_schema("alpha").schema is first.schema
+
+    target.write_text("contract: alpha\nschema:\n  type: array\n", encoding="utf-8")
+    assert ContractLoader(root=tmp_path).get_schema("alpha").schema["type"] == "array"
+
+
 def test_iter_fixtures_sorted(tmp_path: Path) -> None:
     contracts_dir = tmp_path / ".sentinel" / "contracts"
     fixtures_parent = contracts_dir / "fixtures"
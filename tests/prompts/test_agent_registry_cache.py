@@ -0,0 +1,49 @@
+"""Tests for the mtime-invalidated agent registry cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+from sentinelkit.prompt import agents as agent_loader
+from sentinelkit.prompt.agents import AgentRegistryCache
+
+FIXTURE_WORKSPACE = Path("tests/fixtures/prompts_snapshot/workspace")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_cache_reuses_registry_until_sources_change(tmp_path: Path, monkeypatch) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_WORKSPACE, workspace)
+    cache = AgentRegistryCache()
+    loads: list[Path] = []
+    original = agent_loader._load_registry
+    monkeypatch.setattr(
+        agent_loader, "_load_registry", lambda root, sources: loads.append(root) or original(root, sources)
+    )
+
+    first = cache.get(workspace)
+    assert cache.get(workspace) is first
+    assert len(loads) == 1
+
+    role = workspace / ".sentinel/agents/builder/ROLE.md"
+    role.write_text(role.read_text(encoding="utf-8") + "\nUpdated guidance.\n", encoding="utf-8")
+    _bump_mtime(role)
+    updated = cache.get(workspace)
+    assert updated is not first
+    assert "Updated guidance." in updated.lookup["builder"].role
+
+    shutil.copytree(workspace / ".sentinel/agents/builder", workspace / ".sentinel/agents/zeta")
+    config = workspace / ".sentinel/agents/zeta/agent.json"
+    config.write_text(config.read_text(encoding="utf-8").replace('"id": "builder"', '"id": "zeta"'), encoding="utf-8")
+    assert "zeta" in cache.get(workspace).lookup
+
+    stats = cache.stats()
+    assert (stats.hits, stats.reloads) == (1, 3)
+    assert stats.last_reload_reason == "listing_changed"
+    assert len(loads) == 3
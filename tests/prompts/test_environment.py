@@ -0,0 +1,47 @@
+"""Tests for shared Jinja environments, bytecode caching, and precompiled templates."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+from jinja2 import ChoiceLoader, FileSystemLoader
+
+from sentinelkit.prompt import environment
+from sentinelkit.prompt.render import TEMPLATE_DIR, PromptRenderer
+
+
+@pytest.fixture(autouse=True)
+def _fresh_environments():
+    environment.clear_environments()
+    yield
+    environment.clear_environments()
+
+
+def test_renderers_share_environment_and_write_bytecode_cache(tmp_path: Path) -> None:
+    first = PromptRenderer(root=tmp_path)
+    second = PromptRenderer(root=tmp_path)
+    assert first.env is second.env
+    assert PromptRenderer(root=tmp_path, bytecode_cache=False).env is not first.env
+
+    first.env.get_template("agent.md.j2")
+    assert list((tmp_path / ".sentinel/cache/jinja").iterdir())
+
+
+def test_compiled_templates_are_used_until_sources_change(tmp_path: Path) -> None:
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATE_DIR, templates, ignore=shutil.ignore_patterns(environment.COMPILED_DIRNAME))
+    compiled = environment.compile_templates(templates)
+    assert any(path.suffix == ".py" for path in compiled.iterdir())
+
+    env = environment.get_environment(templates)
+    assert isinstance(env.loader, ChoiceLoader)
+    expected = env.get_template("agent.md.j2").render(agent={"name": "Builder"}, capsule={})
+    assert "Builder" in expected
+
+    environment.clear_environments()
+    (templates / "agent.md.j2").write_text("changed {{ agent.name }}\n", encoding="utf-8")
+    stale = environment.get_environment(templates)
+    assert isinstance(stale.loader, FileSystemLoader)
+    assert stale.get_template("agent.md.j2").render(agent={"name": "Builder"}).strip() == "changed Builder"
@@ -6,7 +6,8 @@ import json
 import shutil
 from pathlib import Path
 
-from sentinelkit.prompt.render import PromptRenderer
+from sentinelkit.context.mount import ContextMount, ReadCache
+from sentinelkit.prompt.render import PromptRenderer, normalized_chunks
 
 FIXTURE_ROOT = Path("tests/fixtures/prompts_snapshot")
 SCHEMA_PATH = Path(".sentinel/context/limits/context-limits.schema.json")
@@ -46,3 +47,114 @@ def test_prompt_renderer_matches_snapshot(tmp_path: Path) -> None:
     )
     log_path = renderer.write_router_log(capsule_path, payload_path)
     assert log_path.exists()
+
+
+def test_render_bundle_matches_individual_prompts_with_one_lint(tmp_path: Path, monkeypatch) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_ROOT / "workspace", workspace)
+    renderer = PromptRenderer(
+        root=workspace,
+        config_path=workspace / ".sentinel/context/limits/context-limits.json",
+        schema_path=SCHEMA_PATH,
+    )
+    lints: list[str] = []
+    original_lint = renderer._lint_capsule
+    monkeypatch.setattr(renderer, "_lint_capsule", lambda rel: lints.append(rel) or original_lint(rel))
+
+    bundle = renderer.render_bundle(workspace / "specs/sample/capsule.md")
+
+    assert lints == ["specs/sample/capsule.md"]
+    assert bundle.router == (FIXTURE_ROOT / "expected_router_prompt.md").read_text(encoding="utf-8")
+    assert list(bundle.agents) == ["builder"]
+    assert bundle.agents["builder"] == (FIXTURE_ROOT / "expected_builder_prompt.md").read_text(encoding="utf-8")
+
+
+def test_normalized_chunks_match_strip_semantics() -> None:
+    samples = [
+        ["\n\n  ", "Hello", " ", "\n", "world", "\n\n", "  \n"],
+        ["", "  ", "\n"],
+        ["a"],
+        ["  lead", "ing\t", "\t", "mid", " \n "],
+    ]
+    for chunks in samples:
+        assert "".join(normalized_chunks(chunks)) == "".join(chunks).strip() + "\n"
+
+
+def test_stream_prompts_match_rendered_output(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_ROOT / "workspace", workspace)
+    renderer = PromptRenderer(
+        root=workspace,
+        config_path=workspace / ".sentinel/context/limits/context-limits.json",
+        schema_path=SCHEMA_PATH,
+    )
+    capsule_path = workspace / "specs/sample/capsule.md"
+
+    chunks = list(renderer.stream_router_prompt(capsule_path))
+    assert len(chunks) > 1
+    assert "".join(chunks) == (FIXTURE_ROOT / "expected_router_prompt.md").read_text(encoding="utf-8")
+    assert "".join(renderer.stream_agent_prompt(capsule_path, "builder")) == (
+        FIXTURE_ROOT / "expected_builder_prompt.md"
+    ).read_text(encoding="utf-8")
+
+
+def test_agent_prompt_inlines_mounted_context(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_ROOT / "workspace", workspace)
+    renderer = PromptRenderer(
+        root=workspace,
+        config_path=workspace / ".sentinel/context/limits/context-limits.json",
+        schema_path=SCHEMA_PATH,
+        context_mount=ContextMount(workspace, max_lines=1_000),
+    )
+
+    prompt = renderer.render_agent_prompt(workspace / "specs/sample/capsule.md", "builder")
+
+    readme = (workspace / "README.md").read_text(encoding="utf-8").rstrip()
+    assert "## Mounted Context" in prompt
+    assert f"--- BEGIN FILE README.md ---\n{readme}\n--- END FILE README.md ---" in prompt
+    assert "--- BEGIN FILE src/example.py ---" in prompt
+
+
+def test_agent_prompt_lists_unmounted_paths(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_ROOT / "workspace", workspace)
+    (workspace / "README.md").write_bytes(b"\xff\xfe not text")
+
+    class UnreadableExample(ReadCache):
+        def read(self, path: Path) -> str | None:
+            if path.name == "example.py":
+                raise PermissionError("permission denied")
+            return super().read(path)
+
+    renderer = PromptRenderer(
+        root=workspace,
+        config_path=workspace / ".sentinel/context/limits/context-limits.json",
+        schema_path=SCHEMA_PATH,
+        context_mount=ContextMount(workspace, max_lines=1_000, read_cache=UnreadableExample()),
+    )
+
+    prompt = renderer.render_agent_prompt(workspace / "specs/sample/capsule.md", "builder")
+
+    assert "## Mounted Context" in prompt
+    assert "--- BEGIN FILE" not in prompt
+    assert "Skipped (not UTF-8 text): README.md" in prompt
+    assert "Could not mount: src/example.py: permission denied" in prompt
+
+
+def test_agent_prompt_omits_heading_when_nothing_mounts(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    shutil.copytree(FIXTURE_ROOT / "workspace", workspace)
+    capsule_path = workspace / "specs/sample/capsule.md"
+    (workspace / "docs").mkdir()
+    capsule_path.write_text("# Fixture Capsule\n\n## Allowed Context\n- docs/\n", encoding="utf-8")
+    renderer = PromptRenderer(
+        root=workspace,
+        config_path=workspace / ".sentinel/context/limits/context-limits.json",
+        schema_path=SCHEMA_PATH,
+        context_mount=ContextMount(workspace, max_lines=1_000),
+    )
+
+    prompt = renderer.render_agent_prompt(capsule_path, "builder")
+
+    assert "## Mounted Context" not in prompt
@@ -7,7 +7,9 @@ from pathlib import Path
 import pytest
 
 from sentinelkit.scripts.md_surgeon import (
+    MarkdownDocument,
     MarkdownSurgeonError,
+    SnippetEdit,
     SurgeonOptions,
     main as md_surgeon_main,
     synchronize_snippet,
@@ -85,6 +87,51 @@ def test_unbalanced_snippet_raises(tmp_path: Path) -> None:
         )
 
 
+def test_markdown_document_replaces_many_markers_in_one_render() -> None:
+    document = MarkdownDocument(
+        "# Doc\n"
+        "<!-- ONE:start -->\nold one\n<!-- ONE:end --> <!-- TWO:start -->\nold two\n<!-- TWO:end -->\n"
+        "## Later\n"
+    )
+    document.apply(SnippetEdit(marker="TWO", snippet="new two"))
+    document.apply(SnippetEdit(marker="ONE", snippet="first"))
+    document.apply(SnippetEdit(marker="ONE", snippet="new one"))
+    document.apply(SnippetEdit(marker="THREE", snippet="inserted", heading="Later"))
+    document.validate()
+
+    assert document.render() == (
+        "# Doc\n"
+        "<!-- ONE:start -->\nnew one\n<!-- ONE:end --> <!-- TWO:start -->\nnew two\n<!-- TWO:end -->\n"
+        "## Later\n\n<!-- THREE:start -->\ninserted\n<!-- THREE:end -->\n\n"
+    )
+    assert document.block("THREE") is not None
+
+
+def test_markdown_document_rechecks_fences_for_replaced_regions() -> None:
+    document = MarkdownDocument("```\n<!-- A:start -->\n```\n<!-- A:end -->\n```\n")
+    assert document.fence_counts() == (3, 0)
+
+    document.apply(SnippetEdit(marker="A", snippet="plain"))
+    assert document.fence_counts() == (2, 0)
+    document.validate()
+
+    document.apply(SnippetEdit(marker="A", snippet="~~~\nfenced\n~~~"))
+    assert document.fence_counts() == (2, 2)
+
+
+def test_markdown_document_hides_markers_inside_replaced_blocks() -> None:
+    interleaved = MarkdownDocument("<!-- A:start -->\n<!-- B:start -->\n<!-- A:end -->\n<!-- B:end -->\n")
+    interleaved.apply(SnippetEdit(marker="A", snippet="a"))
+    with pytest.raises(MarkdownSurgeonError) as excinfo:
+        interleaved.apply(SnippetEdit(marker="B", snippet="b"))
+    assert excinfo.value.payload.code == "md_surgeon.no_markers"
+
+    nested = MarkdownDocument("<!-- A:start -->\n<!-- B:start -->\nb\n<!-- B:end -->\n<!-- A:end -->\n")
+    nested.apply(SnippetEdit(marker="B", snippet="inner"))
+    nested.apply(SnippetEdit(marker="A", snippet="outer"))
+    assert nested.render() == "<!-- A:start -->\nouter\n<!-- A:end -->\n"
+
+
 def test_cli_main_reports_failures(tmp_path: Path) -> None:
     target = tmp_path / "doc.md"
     target.write_text("# Doc\nContent", encoding="utf-8")
@@ -25,3 +25,38 @@ def test_sync_snippets_updates_markers(tmp_path: Path) -> None:
     updated = sync_snippets(root=tmp_path, mappings=(mapping,))
     assert target in updated
     assert "replacement" in target.read_text(encoding="utf-8")
+
+
+def test_sync_snippets_writes_each_target_once_and_skips_noops(tmp_path: Path, monkeypatch) -> None:
+    target = tmp_path / "doc.md"
+    target.write_text(
+        "<!-- SENTINEL:ONE:start -->\nold\n<!-- SENTINEL:ONE:end -->\n"
+        "<!-- SENTINEL:TWO:start -->\nold\n<!-- SENTINEL:TWO:end -->\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "one.md").write_text("first", encoding="utf-8")
+    (tmp_path / "two.md").write_text("second", encoding="utf-8")
+    mappings = (
+        SnippetMapping(marker="SENTINEL:ONE", target=Path("doc.md"), snippet=Path("one.md")),
+        SnippetMapping(marker="SENTINEL:TWO", target=Path("doc.md"), snippet=Path("two.md")),
+    )
+
+    writes: list[Path] = []
+    original_write = Path.write_text
+
+    def counting_write(self: Path, *args, **kwargs):
+        writes.append(self)
+        return original_write(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", counting_write)
+
+    assert sync_snippets(root=tmp_path, mappings=mappings) == [target]
+    assert writes == [target]
+    text = target.read_text(encoding="utf-8")
+    assert "first" in text and "second" in text and "old" not in text
+
+    backup = tmp_path / "doc.md.bak"
+    backup.unlink()
+    assert sync_snippets(root=tmp_path, mappings=mappings) == []
+    assert writes == [target]
+    assert not backup.exists()